@@ -0,0 +1,245 @@
+"""
+Benchmarks of openpile
+======================
+
+Times the hot paths of openpile over a range of mesh sizes and soil models:
+
+* ``construct``: creation of a `openpile.construct.Model`, springs included,
+* ``springs``: creation of the springs of all the layers of the model, without cache,
+* ``assembly``: assembly of the global stiffness matrix with the initial stiffness of the springs,
+* ``solve``: solution of the system of equations with the initial stiffness matrix,
+* ``winkler``: full `openpile.analyze.winkler` analysis,
+* ``dataframes``: creation of the results and retrieval of their DataFrames.
+
+Each benchmark is run once to compile the numba functions, then timed `--repeat` times.
+Results are written to a JSON file together with the versions of openpile and its main
+dependencies such that runs of different releases can be compared with `--compare`.
+
+Usage
+-----
+
+.. code-block:: bash
+
+    python benchmarks/bench.py --output benchmarks/results.json
+    python benchmarks/bench.py --quick --compare benchmarks/results.json
+
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import numba
+import pandas as pd
+
+import openpile
+from openpile import analyze, cache
+from openpile.construct import Pile, SoilProfile, Layer, Model
+from openpile.core import kernel
+from openpile.soilmodels import API_sand, API_clay, Cowden_clay, Dunkirk_sand, Reese_weakrock
+
+COARSENESS = [2.0, 1.0, 0.5, 0.2, 0.1, 0.05]
+QUICK_COARSENESS = [1.0, 0.2]
+
+SOIL_MODELS = {
+    "API_sand": lambda: API_sand(phi=[32, 36], kind="cyclic"),
+    "API_clay": lambda: API_clay(Su=[30, 90], eps50=0.01, kind="static"),
+    "Reese_weakrock": lambda: Reese_weakrock(
+        Ei=[2e5, 3e5], qu=[4e3, 6e3], RQD=50, k=0.0005, ztop=0
+    ),
+    "Cowden_clay": lambda: Cowden_clay(Su=[60, 120], G0=[50e3, 90e3]),
+    "Dunkirk_sand": lambda: Dunkirk_sand(Dr=75, G0=[50e3, 100e3]),
+}
+
+BENCHMARKS = ["construct", "springs", "assembly", "solve", "winkler", "dataframes"]
+
+
+def create_model(soil_model: str, coarseness: float):
+    """creates a 7.5m diameter monopile embedded 30m in a single soil layer, loaded at its head."""
+    pile = Pile.create_tubular(
+        name="pile", top_elevation=5, bottom_elevation=-30, diameter=7.5, wt=0.075
+    )
+    soil = SoilProfile(
+        name=soil_model,
+        top_elevation=0,
+        water_line=10,
+        layers=[
+            Layer(
+                name=soil_model,
+                top=0,
+                bottom=-40,
+                weight=19,
+                lateral_model=SOIL_MODELS[soil_model](),
+            )
+        ],
+    )
+    model = Model(name="benchmark", pile=pile, soil=soil, coarseness=coarseness)
+    model.set_support(elevation=-30, Tx=True)
+    model.set_pointload(elevation=5, Py=2e3, Mz=-10e3)
+    return model
+
+
+def winkler(model):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return analyze.winkler(model)
+
+
+def benchmark_functions(model):
+    """returns the function to time for each benchmark, all taking no argument."""
+    F, U, supports = kernel.global_dof_vectors(model)
+    u = np.zeros(U.shape)
+    K = kernel.build_stiffness_matrix(model, u=u, kind="initial", storage="banded")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        d, Q, details = analyze._newton_raphson(model, F, U, supports)
+
+    def dataframes():
+        results = analyze._winkler_results(model, d, Q, details)
+        return (
+            results.displacements,
+            results.forces,
+            results.reactions,
+            results.py_mobilization,
+            results.mt_mobilization,
+        )
+
+    return {
+        "construct": lambda: create_model(model.soil.name, model.coarseness),
+        "springs": model._create_springs,
+        "assembly": lambda: kernel.build_stiffness_matrix(
+            model, u=u, kind="initial", storage="banded"
+        ),
+        "solve": lambda: kernel.solve_equations(K, F, U, restraints=supports),
+        "winkler": lambda: winkler(model),
+        "dataframes": dataframes,
+    }
+
+
+def timeit(fct, repeat: int):
+    """runs the function once to warm it up and returns the wall times of `repeat` runs."""
+    fct()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fct()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run(coarseness, soil_models, benchmarks, repeat):
+    # springs are created at each run, not retrieved from a cache
+    cache.disable()
+    results = []
+    for soil_model in soil_models:
+        for c in coarseness:
+            model = create_model(soil_model, c)
+            functions = benchmark_functions(model)
+            for name in benchmarks:
+                times = timeit(functions[name], repeat)
+                results.append(
+                    {
+                        "benchmark": name,
+                        "soil_model": soil_model,
+                        "coarseness [m]": c,
+                        "element_number": model.element_number,
+                        "min [s]": min(times),
+                        "median [s]": statistics.median(times),
+                        "times [s]": times,
+                    }
+                )
+                print(
+                    f"{name:>10} {soil_model:>15} coarseness={c:<5} "
+                    f"elements={model.element_number:<5} median={statistics.median(times):.3e}s"
+                )
+    return results
+
+
+def metadata():
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "openpile": openpile.__version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "numba": numba.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(results, reference, threshold):
+    """prints the ratio of the median times w.r.t. a reference run and returns
+    the number of benchmarks slower than `threshold` times the reference."""
+
+    def key(r):
+        return (r["benchmark"], r["soil_model"], r["coarseness [m]"])
+
+    ref = {key(r): r for r in reference["results"]}
+    regressions = 0
+    print(
+        f"\ncomparison w.r.t. openpile {reference['metadata']['openpile']} ({reference['metadata']['date']})"
+    )
+    for r in results:
+        if key(r) not in ref:
+            continue
+        ratio = r["median [s]"] / ref[key(r)]["median [s]"]
+        flag = ""
+        if ratio > threshold:
+            regressions += 1
+            flag = "  <-- regression"
+        print(
+            f"{r['benchmark']:>10} {r['soil_model']:>15} coarseness={r['coarseness [m]']:<5} "
+            f"ratio={ratio:.2f}{flag}"
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[4])
+    parser.add_argument("--output", help="path of the JSON file where results are written")
+    parser.add_argument("--compare", help="path of a JSON file of a previous run to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.5,
+        help="ratio of median times above which a benchmark is reported as a regression",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs")
+    parser.add_argument(
+        "--quick", action="store_true", help=f"only run coarseness {QUICK_COARSENESS}"
+    )
+    parser.add_argument("--coarseness", type=float, nargs="+", help="mesh coarseness values [m]")
+    parser.add_argument("--soil-models", nargs="+", choices=list(SOIL_MODELS), help="soil models")
+    parser.add_argument("--benchmarks", nargs="+", choices=BENCHMARKS, help="benchmarks to run")
+    args = parser.parse_args(argv)
+
+    coarseness = args.coarseness or (QUICK_COARSENESS if args.quick else COARSENESS)
+    results = run(
+        coarseness=coarseness,
+        soil_models=args.soil_models or list(SOIL_MODELS),
+        benchmarks=args.benchmarks or BENCHMARKS,
+        repeat=args.repeat,
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"metadata": metadata(), "results": results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            reference = json.load(f)
+        if compare(results, reference, args.threshold) > 0:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,9 +11,15 @@ Every function from this module returns an `openpile.analyze.AnalyzeResult` obje
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+import copy
+import os
 import warnings
+import time
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from scipy import sparse
+from scipy.sparse.linalg import eigsh, LinearOperator
+from typing_extensions import Literal
 
 from openpile.core import kernel
 import openpile.core.validation as validation
@@ -27,11 +33,9 @@ class PydanticConfig:
     underscore_attrs_are_private = True
 
 
-def springs_mob_to_df(model, d):
-
-    # elevations
-    x = model.nodes_coordinates["x [m]"].values
-    x = kernel.double_inner_njit(x)
+def springs_mobilization(model, d):
+    """returns the mobilized and maximum resistances of the distributed p-y and m-t springs
+    at the top and bottom of each element from the global displacement vector."""
 
     # PY springs
     # py secant stiffness
@@ -51,13 +55,26 @@ def springs_mob_to_df(model, d):
     # calculate max spring values
     mt_max = model._mt_springs[:, :, 0, -1].max(axis=2).flatten()
 
+    return np.abs(py_mob), py_max, np.abs(mt_mob), mt_max
+
+
+def springs_mob_to_df(model, d, mobilization=None):
+
+    # elevations
+    x = model._nodes_coordinates["x [m]"]
+    x = kernel.double_inner_njit(x)
+
+    if mobilization is None:
+        mobilization = springs_mobilization(model, d)
+    py_mob, py_max, mt_mob, mt_max = mobilization
+
     # create DataFrame
     df = pd.DataFrame(
         data={
             "Elevation [m]": x,
-            "p_mobilized [kN/m]": np.abs(py_mob),
+            "p_mobilized [kN/m]": py_mob,
             "p_max [kN/m]": py_max,
-            "m_mobilized [kNm/m]": np.abs(mt_mob),
+            "m_mobilized [kNm/m]": mt_mob,
             "m_max [kNm/m]": mt_max,
         }
     )
@@ -65,8 +82,21 @@ def springs_mob_to_df(model, d):
     return df
 
 
+def base_springs_mobilization(model, d):
+    """returns the mobilized and maximum resistances of the base shear and base moment springs."""
+    hb_mob = (
+        abs(d[-2]) * kernel.calculate_base_spring_stiffness(d[-2], model._Hb_spring, kind="secant"),
+        model._Hb_spring.flatten().max(),
+    )
+    mb_mob = (
+        abs(d[-1]) * kernel.calculate_base_spring_stiffness(d[-1], model._Mb_spring, kind="secant"),
+        model._Mb_spring.flatten().max(),
+    )
+    return hb_mob, mb_mob
+
+
 def reaction_forces_to_df(model, Q):
-    x = model.nodes_coordinates["x [m]"].values
+    x = model._nodes_coordinates["x [m]"]
     Q = Q.reshape(-1, 3)
 
     df = pd.DataFrame(
@@ -86,15 +116,24 @@ def reaction_forces_to_df(model, Q):
     )
 
 
-def structural_forces_to_df(model, q):
-    x = model.nodes_coordinates["x [m]"].values
-    x = misc.repeat_inner(x)
-    L = kernel.mesh_to_element_length(model).reshape(-1)
+def structural_forces(model, q):
+    """returns the normal force, shear force and bending moment at the top and bottom of each element
+    from the internal forces vector."""
+    L = kernel.element_invariants(model).L.reshape(-1)
 
     N = np.vstack((-q[0::6], q[3::6])).reshape(-1, order="F")
     V = np.vstack((-q[1::6], q[4::6])).reshape(-1, order="F")
     M = np.vstack((-q[2::6], -q[2::6] + L * q[1::6])).reshape(-1, order="F")
 
+    return N, V, M
+
+
+def structural_forces_to_df(model, q):
+    x = model._nodes_coordinates["x [m]"]
+    x = misc.repeat_inner(x)
+
+    N, V, M = structural_forces(model, q)
+
     structural_forces_to_DataFrame = pd.DataFrame(
         data={
             "Elevation [m]": x,
@@ -108,7 +147,7 @@ def structural_forces_to_df(model, q):
 
 
 def disp_to_df(model, u):
-    x = model.nodes_coordinates["x [m]"].values
+    x = model._nodes_coordinates["x [m]"]
 
     Tx = u[::3].reshape(-1)
     Ty = u[1::3].reshape(-1)
@@ -132,16 +171,36 @@ class AnalyzeResult:
 
     As such the user can use the following properties and/or methods for any return values of an analysis.
 
+    The results hold the global displacement and reaction vectors of the analysis. The tables of results
+    are created on first access and stored for later accesses. The results can also be retrieved as numpy
+    arrays without creating any table with :py:attr:`openpile.analyze.AnalyzeResult.arrays`.
+
     """
 
     _name: str
-    _d: pd.DataFrame
-    _f: pd.DataFrame
-    _Q: pd.DataFrame
-    _dist_mob: pd.DataFrame = None
-    _hb_mob: tuple = None
-    _mb_mob: tuple = None
+    _model: object
+    _d: np.ndarray
+    _Q: np.ndarray
     _details: dict = None
+    #: True if the results include soil springs
+    _springs: bool = False
+    _cache: dict = field(default_factory=dict, repr=False, compare=False)
+
+    def _memoized(self, key, fct):
+        """returns the stored value of `key`, computed with `fct` on first access"""
+        if key not in self._cache:
+            self._cache[key] = fct()
+        return self._cache[key]
+
+    @property
+    def arrays(self):
+        """Retrieves the results as numpy arrays, see :py:class:`openpile.analyze.ResultArrays`.
+
+        Returns
+        -------
+        `openpile.analyze.ResultArrays` object
+        """
+        return ResultArrays(self)
 
     @property
     def displacements(self):
@@ -152,7 +211,7 @@ class AnalyzeResult:
         pandas.DataFrame
             Table with the nodes elevations along the pile and their displacements
         """
-        return self._d
+        return self._memoized("displacements", lambda: disp_to_df(self._model, self._d))
 
     @property
     def forces(self):
@@ -163,7 +222,17 @@ class AnalyzeResult:
         pandas.DataFrame
             Table with the nodes elevations along the pile and their forces
         """
-        return self._f
+        return self._memoized(
+            "forces",
+            lambda: pd.DataFrame(
+                data={
+                    "Elevation [m]": self.arrays.forces_elevation,
+                    "N [kN]": self.arrays.forces[:, 0],
+                    "V [kN]": self.arrays.forces[:, 1],
+                    "M [kNm]": self.arrays.forces[:, 2],
+                }
+            ),
+        )
 
     @property
     def reactions(self):
@@ -174,7 +243,7 @@ class AnalyzeResult:
         pandas.DataFrame
             Table with the nodes elevations along the pile and their forces
         """
-        return self._Q
+        return self._memoized("reactions", lambda: reaction_forces_to_df(self._model, self._Q))
 
     @property
     def settlement(self):
@@ -185,7 +254,7 @@ class AnalyzeResult:
         pandas.DataFrame
             Table with the nodes elevations along the pile and their normal displacements
         """
-        return self._d[["Elevation [m]", "Settlement [m]"]]
+        return self.displacements[["Elevation [m]", "Settlement [m]"]]
 
     @property
     def deflection(self):
@@ -196,7 +265,7 @@ class AnalyzeResult:
         pandas.DataFrame
             Table with the nodes elevations along the pile and their transversal displacements
         """
-        return self._d[["Elevation [m]", "Deflection [m]"]]
+        return self.displacements[["Elevation [m]", "Deflection [m]"]]
 
     @property
     def rotation(self):
@@ -207,7 +276,14 @@ class AnalyzeResult:
         pandas.DataFrame
             Table with the nodes elevations along the pile and their rotations
         """
-        return self._d[["Elevation [m]", "Rotation [rad]"]]
+        return self.displacements[["Elevation [m]", "Rotation [rad]"]]
+
+    def _springs_mobilization(self):
+        """DataFrame of the mobilized resistances of the distributed springs"""
+        return self._memoized(
+            "springs_mobilization",
+            lambda: springs_mob_to_df(self._model, self._d, self.arrays._mobilization()),
+        )
 
     @property
     def py_mobilization(self):
@@ -219,10 +295,12 @@ class AnalyzeResult:
             Table with the nodes elevations along the pile and the mobilized resistance in kN/m.
         """
 
-        if self._dist_mob is None:
+        if not self._springs:
             return None
         else:
-            return self._dist_mob[["Elevation [m]", "p_mobilized [kN/m]", "p_max [kN/m]"]]
+            return self._springs_mobilization()[
+                ["Elevation [m]", "p_mobilized [kN/m]", "p_max [kN/m]"]
+            ]
 
     @property
     def mt_mobilization(self):
@@ -233,10 +311,12 @@ class AnalyzeResult:
         pandas.DataFrame
             Table with the nodes elevations along the pile and the mobilized resistance in kNm/m.
         """
-        if self._dist_mob is None:
+        if not self._springs:
             return None
         else:
-            return self._dist_mob[["Elevation [m]", "m_mobilized [kNm/m]", "m_max [kNm/m]"]]
+            return self._springs_mobilization()[
+                ["Elevation [m]", "m_mobilized [kNm/m]", "m_max [kNm/m]"]
+            ]
 
     @property
     def Hb_mobilization(self):
@@ -247,7 +327,12 @@ class AnalyzeResult:
         tuple
             the mobilised value and the maximum resistance in kN
         """
-        return self._hb_mob if self._hb_mob is not None else None
+        if not self._springs:
+            return None
+        else:
+            return self._memoized(
+                "base_mobilization", lambda: base_springs_mobilization(self._model, self._d)
+            )[0]
 
     @property
     def Mb_mobilization(self):
@@ -258,7 +343,12 @@ class AnalyzeResult:
         tuple
             the mobilised value and the maximum resistance in kNm
         """
-        return self._mb_mob if self._mb_mob is not None else None
+        if not self._springs:
+            return None
+        else:
+            return self._memoized(
+                "base_mobilization", lambda: base_springs_mobilization(self._model, self._d)
+            )[1]
 
     def plot_deflection(self, assign=False):
         """
@@ -353,24 +443,268 @@ class AnalyzeResult:
 
         """
 
+        f = self.arrays.forces
+        d = self.arrays.displacements
+
         return {
             **self._details,
-            "Max. normal force [kN]": round(self._f["N [kN]"].max(), 2),
-            "Min. normal force [kN]": round(self._f["N [kN]"].min(), 2),
-            "Max. shear force [kN]": round(self._f["V [kN]"].max(), 2),
-            "Min. shear force [kN]": round(self._f["V [kN]"].min(), 2),
-            "Max. moment [kNm]": round(self._f["M [kNm]"].max(), 2),
-            "Min. moment [kNm]": round(self._f["M [kNm]"].min(), 2),
-            "Max. settlement [m]": round(self._d["Settlement [m]"].max(), 3),
-            "Min. settlement [m]": round(self._d["Settlement [m]"].min(), 3),
-            "Max. deflection [m]": round(self._d["Deflection [m]"].max(), 3),
-            "Min. deflection [m]": round(self._d["Deflection [m]"].min(), 3),
-            "Max. rotation [rad]": round(self._d["Rotation [rad]"].max(), 3),
-            "Min. rotation [rad]": round(self._d["Rotation [rad]"].min(), 3),
+            "Max. normal force [kN]": round(f[:, 0].max(), 2),
+            "Min. normal force [kN]": round(f[:, 0].min(), 2),
+            "Max. shear force [kN]": round(f[:, 1].max(), 2),
+            "Min. shear force [kN]": round(f[:, 1].min(), 2),
+            "Max. moment [kNm]": round(f[:, 2].max(), 2),
+            "Min. moment [kNm]": round(f[:, 2].min(), 2),
+            "Max. settlement [m]": round(d[:, 0].max(), 3),
+            "Min. settlement [m]": round(d[:, 0].min(), 3),
+            "Max. deflection [m]": round(d[:, 1].max(), 3),
+            "Min. deflection [m]": round(d[:, 1].min(), 3),
+            "Max. rotation [rad]": round(d[:, 2].max(), 3),
+            "Min. rotation [rad]": round(d[:, 2].min(), 3),
         }
 
 
-def beam(model):
+@dataclass
+class ResultArrays:
+    """The `ResultArrays` class gives access to the results of an `openpile.analyze.AnalyzeResult` object
+    as numpy arrays, e.g. `results.arrays.deflection`.
+
+    No table is created, which makes it the fastest way to post-process many analyses.
+    """
+
+    _result: AnalyzeResult
+
+    @property
+    def elevation(self):
+        """Elevations of the nodes [m]
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_nodes,)
+        """
+        return self._result._model._nodes_coordinates["x [m]"].copy()
+
+    @property
+    def displacements(self):
+        """Nodal displacements, i.e. settlement, deflection and rotation.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_nodes, 3)
+        """
+        return self._result._d.reshape(-1, 3)
+
+    @property
+    def settlement(self):
+        """Nodal settlements [m].
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_nodes,)
+        """
+        return self._result._d[0::3]
+
+    @property
+    def deflection(self):
+        """Nodal deflections [m].
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_nodes,)
+        """
+        return self._result._d[1::3]
+
+    @property
+    def rotation(self):
+        """Nodal rotations [rad].
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_nodes,)
+        """
+        return self._result._d[2::3]
+
+    @property
+    def reactions(self):
+        """Nodal reaction forces, i.e. normal force [kN], shear force [kN] and moment [kNm].
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_nodes, 3)
+        """
+        return self._result._Q.reshape(-1, 3)
+
+    @property
+    def forces_elevation(self):
+        """Elevations of the top and bottom of each element [m], where forces are given.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (2 x n_elements,)
+        """
+        return misc.repeat_inner(self.elevation)
+
+    @property
+    def forces(self):
+        """Normal force [kN], shear force [kN] and bending moment [kNm] at the top and bottom of each element.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (2 x n_elements, 3)
+        """
+
+        def calculate():
+            q_int = kernel.pile_internal_forces(self._result._model, self._result._d)
+            return np.column_stack(structural_forces(self._result._model, q_int))
+
+        return self._result._memoized("forces_array", calculate)
+
+    def _mobilization(self):
+        return self._result._memoized(
+            "mobilization_arrays",
+            lambda: springs_mobilization(self._result._model, self._result._d),
+        )
+
+    @property
+    def p_mobilized(self):
+        """Mobilized resistance of the p-y springs at the top and bottom of each element [kN/m],
+        None if the analysis has no soil springs.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (2 x n_elements,)
+        """
+        return self._mobilization()[0] if self._result._springs else None
+
+    @property
+    def m_mobilized(self):
+        """Mobilized resistance of the m-t springs at the top and bottom of each element [kNm/m],
+        None if the analysis has no soil springs.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (2 x n_elements,)
+        """
+        return self._mobilization()[2] if self._result._springs else None
+
+
+@dataclass
+class AnalyzeBatchResult:
+    """The `AnalyzeBatchResult` class is created by the batch analyses of the :py:mod:`openpile.analyze` module,
+    i.e. :py:func:`openpile.analyze.winkler_batch` and :py:func:`openpile.analyze.beam_batch`.
+
+    The results of all load cases are stacked in numpy arrays where the first dimension is the load case.
+    The results of one load case can be retrieved as an `AnalyzeResult` object by indexing, e.g. `results[0]`.
+
+    """
+
+    _name: str
+    _model: object
+    _d: np.ndarray
+    _Q: np.ndarray
+    _details: list
+
+    def __len__(self):
+        return self._d.shape[0]
+
+    def __getitem__(self, i):
+        if self._model.soil is None:
+            return _beam_results(self._model, self._d[i], self._Q[i])
+        else:
+            return _winkler_results(self._model, self._d[i], self._Q[i], self._details[i])
+
+    @property
+    def elevation(self):
+        """Elevations of the nodes [m]
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_nodes,)
+        """
+        return self._model._nodes_coordinates["x [m]"].copy()
+
+    @property
+    def displacements(self):
+        """Retrieves nodal displacements of all load cases, i.e. settlement, deflection and rotation.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_cases, n_nodes, 3)
+        """
+        return self._d.reshape(len(self), -1, 3)
+
+    @property
+    def settlement(self):
+        """Retrieves settlements of all load cases [m].
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_cases, n_nodes)
+        """
+        return self._d[:, 0::3]
+
+    @property
+    def deflection(self):
+        """Retrieves deflections of all load cases [m].
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_cases, n_nodes)
+        """
+        return self._d[:, 1::3]
+
+    @property
+    def rotation(self):
+        """Retrieves rotations of all load cases [rad].
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_cases, n_nodes)
+        """
+        return self._d[:, 2::3]
+
+    @property
+    def forces(self):
+        """Retrieves normal force, shear force and bending moment at the top and bottom of each element
+        for all load cases.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_cases, 2 x n_elements, 3)
+        """
+        out = np.zeros((len(self), 2 * self._model.element_number, 3))
+        for i in range(len(self)):
+            q_int = kernel.pile_internal_forces(self._model, self._d[i])
+            out[i] = np.column_stack(structural_forces(self._model, q_int))
+        return out
+
+    def details(self) -> list:
+        """Provide details on the convergence of each load case.
+
+        Returns
+        -------
+        list
+            list of dictionaries
+        """
+        return self._details
+
+
+def beam(model, storage: Literal["dense", "banded", "sparse"] = "banded"):
     """
     Function where loading or displacement defined in the model boundary conditions
     are used to solve the system of equations, .
@@ -379,6 +713,9 @@ def beam(model):
     ----------
     model : `openpile.construct.Model` object
         Model where structure and boundary conditions are defined.
+    storage: str, by default "banded"
+        storage of the global stiffness matrix, can be of ("dense", "banded", "sparse").
+        The dense storage is kept for verification purposes.
 
     Returns
     -------
@@ -389,34 +726,47 @@ def beam(model):
     # validate boundary conditions
     validation.check_boundary_conditions(model)
 
-    # initialise global force
-    F = kernel.mesh_to_global_force_dof_vector(model.global_forces)
-    # initiliase prescribed displacement vector
-    U = kernel.mesh_to_global_disp_dof_vector(model.global_disp)
-    # initialise global supports vector
-    supports = kernel.mesh_to_global_restrained_dof_vector(model.global_restrained)
+    # initialise global force, prescribed displacement and supports vectors
+    F, U, supports = kernel.global_dof_vectors(model)
+
+    d, Q = _beam_solve(model, F, U, supports, storage=storage)
+
+    return _beam_results(model, d, Q)
+
+
+def _beam_solve(model, F, U, supports, storage="banded"):
+    """solves the system of equations of a model without soil springs, accounting for p-delta effects.
 
+    Returns
+    -------
+    d : numpy.ndarray
+        global displacement vector
+    Q : numpy.ndarray
+        global reaction force vector
+    """
     # initialise displacement vectors
     d = np.zeros(U.shape)
 
     # initialise global stiffness matrix
-    K = kernel.build_stiffness_matrix(model, d)
+    K = kernel.build_stiffness_matrix(model, d, storage=storage)
     # first run with no stress stiffness matrix
     d, Q = kernel.solve_equations(K, F, U, restraints=supports)
     # rerun global stiffness matrix
-    K = kernel.build_stiffness_matrix(model, d)
+    K = kernel.build_stiffness_matrix(model, d, storage=storage)
     # second run with stress stiffness matrix
     d, Q = kernel.solve_equations(K, F, U, restraints=supports)
 
-    # internal forces
-    q_int = kernel.pile_internal_forces(model, d)
+    return d, Q
+
+
+def _beam_results(model, d, Q):
+    """creates the AnalyzeResult object of a model without soil springs."""
 
-    # Final results
     results = AnalyzeResult(
         _name=f"{model.name} ({model.pile.name})",
-        _d=disp_to_df(model, d),
-        _f=structural_forces_to_df(model, q_int),
-        _Q=reaction_forces_to_df(model, Q),
+        _model=copy.copy(model),
+        _d=d,
+        _Q=Q,
         _details={
             "converged @ iter no.": 1,
             "error": 0.0,
@@ -427,7 +777,20 @@ def beam(model):
     return results
 
 
-def winkler(model, max_iter: int = 100):
+def winkler(
+    model,
+    max_iter: int = 100,
+    storage: Literal["dense", "banded", "sparse"] = "banded",
+    strategy: Literal["full", "modified", "initial"] = "full",
+    refactor_every: int = 5,
+    line_search: Literal["backtracking", "energy"] = None,
+    acceleration: Literal["aitken", "anderson"] = None,
+    initial_state=None,
+    adaptive: bool = False,
+    refinement_tolerance: float = 0.05,
+    adaptive_tolerance: float = 1e-3,
+    max_refinements: int = 5,
+):
     """
     Function where loading or displacement defined in the model boundary conditions
     are used to solve the system of equations via the iterative Newton-Raphson scheme.
@@ -438,109 +801,1709 @@ def winkler(model, max_iter: int = 100):
         Model where structure and boundary conditions are defined.
     max_iter: int, by defaut 100
         maximum number of iterations for convergence
+    storage: str, by default "banded"
+        storage of the global stiffness matrix, can be of ("dense", "banded", "sparse").
+        The dense storage is kept for verification purposes.
+    strategy: str, by default "full"
+        iteration strategy, can be of ("full", "modified", "initial").
+        "full" is the full Newton-Raphson scheme where the tangent stiffness matrix is
+        re-built and re-factorized at each iteration, "modified" is the modified Newton-Raphson
+        scheme where the tangent stiffness matrix is re-built and re-factorized every `refactor_every`
+        iterations or when the residual forces are not at least halved in one iteration, "initial" is the
+        initial stiffness scheme where the initial stiffness matrix is factorized once.
+        Whenever not re-factorized, the factorization of the stiffness matrix is reused.
+    refactor_every: int, by default 5
+        maximum number of iterations between two factorizations for the "modified" strategy
+    line_search: str, optional
+        line search scaling the displacement increment of each iteration, can be of ("backtracking", "energy").
+        "backtracking" halves the increment until the residual forces decrease, "energy" scales the
+        increment such that the work of the residual forces along the increment vanishes. It damps the
+        oscillations of the iterations with softening springs, at the cost of one assembly per trial.
+        By default, no line search.
+    acceleration: str, optional
+        acceleration of the iterations, can be of ("aitken", "anderson"). "aitken" relaxes the displacement
+        increment with a factor updated at each iteration with Aitken's delta-squared method. "anderson"
+        combines the displacement increment with the increments of the (up to 5) previous iterations solved with
+        the same factorization (Anderson's method), it is therefore effective with the "modified" and "initial"
+        strategies only. By default, no acceleration.
+    initial_state: `openpile.analyze.AnalyzeResult` object or numpy array, optional
+        previous solution the iterations start from, given as the results of a previous analysis or
+        as the global displacement vector of dim (ndof,) or (n_nodes, 3). The iterations then start
+        with the tangent stiffness matrix of this solution instead of the initial stiffness matrix,
+        such that the analysis of a slightly modified model (e.g. in a sensitivity study on loads or
+        multipliers) converges in one or two iterations. By default, the iterations start from zero
+        displacements.
+    adaptive: bool, by default False
+        if True, the mesh of the model is refined where the solution varies the most: the model is
+        solved, the elements where the springs mobilization or the bending moment vary by more than
+        `refinement_tolerance` are split in two, and the refined model is solved again starting
+        from the previous solution, transferred to the new nodes, until the displacement
+        and rotation of the pile head change by less than `adaptive_tolerance`. The model is not
+        modified, the results refer to the refined model. It allows to start with a coarse mesh
+        and only refine it where the soil is mobilized, i.e. near the mudline.
+    refinement_tolerance: float, by default 0.05
+        elements are refined when the mobilization (ratio of the p-y or m-t spring resistance to its
+        maximum) varies by more than this value along the element, or when the bending moment varies
+        by more than this fraction of the maximum bending moment along the pile.
+    adaptive_tolerance: float, by default 1e-3
+        refinements stop when the relative change of the pile head displacement and rotation
+        is lower.
+    max_refinements: int, by default 5
+        maximum number of refinements.
 
     Returns
     -------
     results : `openpile.analyses.Result` object
-        Results of the analysis
+        Results of the analysis. The residual forces of each iteration are given in the
+        "residual history [kN]" entry of `details()`. In adaptive analyses, the number of elements
+        and the relative change of the pile head response of each refinement are given in the
+        "element number history" and "head change history" entries.
     """
 
     if model.soil is None:
         UserWarning("SoilProfile must be provided when creating the Model.")
 
     else:
-        # initialise global force
-        F = kernel.mesh_to_global_force_dof_vector(model.global_forces)
-        # initiliase prescribed displacement vector
-        U = kernel.mesh_to_global_disp_dof_vector(model.global_disp)
-        # initialise displacement vectors
-        d = np.zeros(U.shape)
-        # initialise global stiffness matrix
-        K = kernel.build_stiffness_matrix(model, u=d, kind="initial")
-        # initialise global supports vector
-        supports = kernel.mesh_to_global_restrained_dof_vector(model.global_restrained)
+        # initialise global force, prescribed displacement and supports vectors
+        F, U, supports = kernel.global_dof_vectors(model)
 
         # validate boundary conditions
         # validation.check_boundary_conditions(model)
 
-        # Initialise residual forces
-        Rg = F
+        kwargs = {
+            "max_iter": max_iter,
+            "storage": storage,
+            "strategy": strategy,
+            "refactor_every": refactor_every,
+            "line_search": line_search,
+            "acceleration": acceleration,
+        }
+
+        if adaptive:
+            return _adaptive_winkler(
+                model,
+                d0=_state_displacements(initial_state),
+                refinement_tolerance=refinement_tolerance,
+                adaptive_tolerance=adaptive_tolerance,
+                max_refinements=max_refinements,
+                **kwargs,
+            )
+
+        d, Q, details = _newton_raphson(
+            model, F, U, supports, d0=_state_displacements(initial_state), **kwargs
+        )
+
+        return _winkler_results(model, d, Q, details)
 
-        # incremental calculations to convergence
-        iter_no = 0
-        while iter_no <= max_iter:
-
-            # solve system
-            try:
-                u_inc, Q = kernel.solve_equations(K, Rg, U, restraints=supports)
-                # bump iteration number
-                iter_no += 1
-            except np.linalg.LinAlgError:
-                print(
-                    """Cannot converge. Failure of the pile-soil system.\n
-                      Boundary conditions may not be realistic or values may be too large."""
-                )
-                break
 
-            # External forces
-            F_ext = F - Q
-            control = np.linalg.norm(F_ext)
-            nr_tol = 1e-4 * control
+def _refinement_elements(model, d, tolerance):
+    """returns the indices of the elements where the mobilization of the p-y or m-t springs varies
+    by more than the tolerance or, in the soil, where the bending moment varies by more than the
+    tolerance times the maximum bending moment."""
+    py_mob, py_max, mt_mob, mt_max = springs_mobilization(model, d)
+    py_ratio = np.divide(py_mob, py_max, out=np.zeros(py_mob.shape), where=py_max > 0)
+    mt_ratio = np.divide(mt_mob, mt_max, out=np.zeros(mt_mob.shape), where=mt_max > 0)
+    py_ratio, mt_ratio = py_ratio.reshape(-1, 2), mt_ratio.reshape(-1, 2)
 
+    _, _, M = structural_forces(model, kernel.pile_internal_forces(model, d))
+    M = M.reshape(-1, 2)
+    # beam elements without springs are exact
+    in_soil = (py_max.reshape(-1, 2) > 0).any(axis=1)
+
+    refine = (np.abs(py_ratio[:, 0] - py_ratio[:, 1]) > tolerance) | (
+        np.abs(mt_ratio[:, 0] - mt_ratio[:, 1]) > tolerance
+    )
+    refine |= in_soil & (np.abs(M[:, 0] - M[:, 1]) > tolerance * np.abs(M).max())
+    return np.flatnonzero(refine)
+
+
+def _refined_displacements(model, d, elements):
+    """returns the global displacement vector of the model with the given elements split in two,
+    interpolated linearly at the new nodes."""
+    u = d.reshape(-1, 3)
+    midpoints = 0.5 * (u[elements] + u[elements + 1])
+    return np.insert(u, elements + 1, midpoints, axis=0).reshape(-1)
+
+
+def _adaptive_winkler(
+    model, d0, refinement_tolerance, adaptive_tolerance, max_refinements, **kwargs
+):
+    """winkler analysis where the mesh of the model is refined until the pile head response
+    converges, see :py:func:`openpile.analyze.winkler`."""
+    element_history = []
+    change_history = []
+    head = None
+    for refinement in range(max_refinements + 1):
+        F, U, supports = kernel.global_dof_vectors(model)
+        d, Q, details = _newton_raphson(model, F, U, supports, d0=d0, verbose=False, **kwargs)
+
+        # relative change of the head response w.r.t. the previous mesh
+        new_head = d[1:3]
+        scale = np.maximum(np.abs(new_head), np.abs(head) if head is not None else 0.0)
+        change = (
+            None
+            if head is None
+            else float(np.max(np.abs(new_head - head) / np.where(scale > 0.0, scale, 1.0)))
+        )
+        head = new_head
+        element_history.append(model.element_number)
+        change_history.append(change)
+
+        if (change is not None and change < adaptive_tolerance) or refinement == max_refinements:
+            break
+
+        elements = _refinement_elements(model, d, refinement_tolerance)
+        if elements.size == 0:
+            break
+        d0 = _refined_displacements(model, d, elements)
+        model = model._refined(elements)
+
+    print(
+        f"Converged at iteration no. {details['converged @ iter no.']} "
+        f"with {model.element_number} elements after {len(element_history) - 1} refinements"
+    )
+
+    details["element number history"] = element_history
+    details["head change history"] = change_history
+
+    return _winkler_results(model, d, Q, details)
+
+
+def _state_displacements(initial_state):
+    """returns the global displacement vector of an initial state given as
+    results of an analysis or as displacement vector, None if not given."""
+    if initial_state is None:
+        return None
+    elif isinstance(initial_state, AnalyzeResult):
+        return initial_state._d
+    else:
+        return np.asarray(initial_state, dtype=np.float64).reshape(-1)
+
+
+def _newton_raphson(
+    model,
+    F,
+    U,
+    supports,
+    max_iter: int = 100,
+    storage: str = "banded",
+    strategy: str = "full",
+    refactor_every: int = 5,
+    line_search: str = None,
+    acceleration: str = None,
+    d0=None,
+    verbose: bool = True,
+):
+    """Newton-Raphson scheme solving the system of equations of a model with soil springs.
+
+    The iterations start from the displacements `d0` with the tangent stiffness matrix
+    of `d0` if given, or from zero displacements with the initial stiffness matrix otherwise.
+
+    Returns the global displacement vector, the global reaction forces vector and
+    a dictionary with details on the convergence.
+    """
+    if strategy not in ["full", "modified", "initial"]:
+        raise ValueError("strategy must be one of ('full', 'modified', 'initial').")
+    if line_search not in [None, "backtracking", "energy"]:
+        raise ValueError("line_search must be one of (None, 'backtracking', 'energy').")
+    if acceleration not in [None, "aitken", "anderson"]:
+        raise ValueError("acceleration must be one of (None, 'aitken', 'anderson').")
+
+    start_time = time.perf_counter()
+
+    def equilibrium(d, F_ext):
+        # tangent stiffness (if needed), internal forces and residual forces of the displacements d
+        if strategy == "full":
+            # secant and tangent stiffness are evaluated in one pass
+            K_secant, K_tangent = kernel.build_stiffness_matrix(
+                model, u=d, kind=("secant", "tangent"), storage=storage
+            )
+        else:
+            K_secant = kernel.build_stiffness_matrix(model, u=d, kind="secant", storage=storage)
+            K_tangent = None
+        F_int = -kernel.stiffness_dot(K_secant, d)
+        return K_tangent, F_int, F_ext + F_int
+
+    U = np.array(U, dtype=np.float64)
+    # internal forces of the current displacements
+    F_int = np.zeros(U.shape)
+    if d0 is None:
+        # initialise displacement vectors
+        d = np.zeros(U.shape)
+        # initialise global stiffness matrix
+        K = kernel.build_stiffness_matrix(model, u=d, kind="initial", storage=storage)
+        # Initialise residual forces
+        Rg = F
+    else:
+        # warm start from the given displacements
+        d = np.array(d0, dtype=np.float64)
+        if d.shape != U.shape:
+            raise ValueError(
+                f"initial displacements must have {U.shape[0]} degrees of freedom, got {d.shape}."
+            )
+        K, F_int, Rg = equilibrium(d, F)
+        if K is None:
+            K = kernel.build_stiffness_matrix(model, u=d, kind="tangent", storage=storage)
+        # prescribed displacements are increments w.r.t. the initial displacements
+        U = np.where(supports, U - d, 0.0)
+    Q = np.zeros(U.shape)
+    nr_tol = 0.0
+
+    # factorization of the global stiffness matrix, reused until re-factorized
+    K_factorized = None
+    refactor_no = 0
+    iter_since_refactor = 0
+    error_previous = None
+
+    # relaxation factor and previous increment of Aitken's method
+    omega = 1.0
+    u_previous = None
+    # previous displacements and increments of Anderson's method
+    anderson_history = []
+    residual_history = []
+
+    # incremental calculations to convergence
+    iter_no = 0
+    while iter_no <= max_iter:
+
+        # solve system
+        try:
+            if K_factorized is None:
+                K_factorized = kernel.FactorizedStiffness(K, supports)
+                refactor_no += 1
+                iter_since_refactor = 0
+            u_inc, Q = K_factorized.solve(Rg, U)
+            # bump iteration number
+            iter_no += 1
+            iter_since_refactor += 1
+        except np.linalg.LinAlgError:
+            print(
+                """Cannot converge. Failure of the pile-soil system.\n
+                  Boundary conditions may not be realistic or values may be too large."""
+            )
+            break
+
+        # External forces
+        F_ext = F - Q
+        control = np.linalg.norm(F_ext)
+        nr_tol = 1e-4 * control
+
+        # relax increment with Aitken's method
+        if acceleration == "aitken":
+            if u_previous is not None:
+                omega = _aitken_relaxation(omega, u_previous[~supports], u_inc[~supports])
+            u_previous = u_inc
+            u_inc = omega * u_inc
+        elif acceleration == "anderson" and iter_no > 1:
+            u_inc = _anderson_increment(anderson_history, d, u_inc)
+
+        if line_search is not None and iter_no > 1:
+            # add up increment displacements scaled by the line search
+            d, (K_tangent, F_int, Rg) = _line_search(
+                line_search, lambda x: equilibrium(x, F_ext), d, u_inc, Rg, ~supports
+            )
+        else:
             # add up increment displacements
             d += u_inc
+            # calculate internal and residual forces
+            K_tangent, F_int, Rg = equilibrium(d, F_ext)
 
-            # calculate internal forces
-            K_secant = kernel.build_stiffness_matrix(model, u=d, kind="secant")
-            F_int = -K_secant.dot(d)
+        error = np.linalg.norm(Rg[~supports])
+        residual_history.append(round(error, 3))
 
-            # calculate residual forces
-            Rg = F_ext + F_int
-
-            # check if converged
-            if np.linalg.norm(Rg[~supports]) < nr_tol and iter_no > 1:
-                # do not accept convergence without iteration (without a second call to solve equations)
+        # check if converged
+        if error < nr_tol and (iter_no > 1 or d0 is not None):
+            # do not accept convergence without iteration (without a second call to solve equations)
+            # unless the iterations start from a previous solution
+            if verbose:
                 print(f"Converged at iteration no. {iter_no}")
+            break
+
+        if iter_no == 100 and verbose:
+            print("Not converged after 100 iterations.")
+
+        # re-calculate global stiffness matrix for next iterations
+        if strategy == "full":
+            refactor = True
+        elif strategy == "modified":
+            refactor = iter_since_refactor >= refactor_every or (
+                error_previous is not None and error > 0.5 * error_previous
+            )
+        else:
+            refactor = False
+
+        if refactor:
+            # the iterations are not a fixed-point iteration anymore
+            anderson_history.clear()
+            if strategy == "full":
+                K = K_tangent
+            else:
+                K = kernel.build_stiffness_matrix(model, u=d, kind="tangent", storage=storage)
+            K_factorized = None
+
+        error_previous = error
+
+        # reset prescribed displacements to converge properly in case
+        # of displacement-driven analysis
+        U[:] = 0.0
+
+    # reaction forces at restrained dofs from the equilibrium of the final displacements
+    Q = np.where(supports, -F_int - F, 0.0)
+
+    details = {
+        "converged @ iter no.": iter_no,
+        "error [kN]": round(np.linalg.norm(Rg[~supports]), 3),
+        "tolerance [kN]": round(nr_tol, 3),
+        "strategy": strategy,
+        "line search": line_search,
+        "acceleration": acceleration,
+        "factorizations": refactor_no,
+        "residual history [kN]": residual_history,
+        "wall time [s]": round(time.perf_counter() - start_time, 4),
+    }
+
+    return d, Q, details
+
+
+def _aitken_relaxation(omega, u_previous, u):
+    """returns the relaxation factor of the increment u from the previous factor and increments
+    with Aitken's delta-squared method (Irons and Tuck), bounded to [0.1, 2]."""
+    du = u - u_previous
+    norm = du @ du
+    if norm == 0.0:
+        return omega
+    return min(2.0, max(0.1, -omega * (u_previous @ du) / norm))
+
+
+def _anderson_increment(history, d, u, depth=5):
+    """returns the displacement increment accelerated with Anderson's method from the increment u
+    at the displacements d and the `depth` previous displacements and increments stored in `history`.
+
+    The iterations are seen as a fixed-point iteration d -> d + u, the history is updated in place
+    and must be cleared when the stiffness matrix changes.
+    """
+    history.append((d.copy(), u.copy()))
+    if len(history) > depth + 1:
+        history.pop(0)
+    if len(history) < 2:
+        return u
+    dX = np.diff([x[0] for x in history], axis=0).T
+    dU = np.diff([x[1] for x in history], axis=0).T
+    gamma = np.linalg.lstsq(dU, u, rcond=None)[0]
+    return u - (dX + dU) @ gamma
+
+
+def _line_search(method, equilibrium, d, u, R, free, max_trials=5):
+    """scales the displacement increment u from the displacements d where the residual forces are R.
+
+    With the "backtracking" method, the increment is halved until the norm of the residual forces decreases
+    (the scaling with the lowest residual forces is kept otherwise). With the "energy" method, the scaling
+    is found with the secant method such that the work of the residual forces along the increment is at least
+    halved (Crisfield), bounded to [0.1, 1].
+
+    `equilibrium` returns the state of trial displacements, the residual forces being its last item.
+    Returns the displacements and their state.
+    """
+    error = np.linalg.norm(R[free])
+    s0 = u[free] @ R[free]
+
+    if method == "backtracking":
+        best = None
+        eta = 1.0
+        for _ in range(max_trials):
+            state = equilibrium(d + eta * u)
+            error_trial = np.linalg.norm(state[-1][free])
+            if best is None or error_trial < best[2]:
+                best = (eta, state, error_trial)
+            if error_trial <= (1.0 - 1e-4 * eta) * error:
                 break
+            eta *= 0.5
+        eta, state, _ = best
 
-            if iter_no == 100:
-                print("Not converged after 100 iterations.")
-
-            # re-calculate global stiffness matrix for next iterations
-            K = kernel.build_stiffness_matrix(model, u=d, kind="tangent")
-
-            # reset prescribed displacements to converge properly in case
-            # of displacement-driven analysis
-            U[:] = 0.0
-
-        # Internal forces calculations with dim(nelem,6,6)
-        q_int = kernel.pile_internal_forces(model, d)
-
-        # Final results
-        results = AnalyzeResult(
-            _name=f"{model.name} ({model.pile.name}/{model.soil.name})",
-            _d=disp_to_df(model, d),
-            _f=structural_forces_to_df(model, q_int),
-            _Q=reaction_forces_to_df(model, Q),
-            _dist_mob=springs_mob_to_df(model, d),
-            _hb_mob=(
-                abs(d[-2])
-                * kernel.calculate_base_spring_stiffness(d[-2], model._Hb_spring, kind="secant"),
-                model._Hb_spring.flatten().max(),
-            ),
-            _mb_mob=(
-                abs(d[-1])
-                * kernel.calculate_base_spring_stiffness(d[-1], model._Mb_spring, kind="secant"),
-                model._Mb_spring.flatten().max(),
-            ),
-            _details={
-                "converged @ iter no.": iter_no,
-                "error [kN]": round(np.linalg.norm(Rg[~supports]), 3),
-                "tolerance [kN]": round(nr_tol, 3),
-            },
+    else:
+        eta_previous, s_previous = 0.0, s0
+        eta_next = 1.0
+        for _ in range(max_trials):
+            eta = eta_next
+            state = equilibrium(d + eta * u)
+            s = u[free] @ state[-1][free]
+            if abs(s) <= 0.5 * abs(s0) or s == s_previous:
+                break
+            eta_next = min(1.0, max(0.1, eta - s * (eta - eta_previous) / (s - s_previous)))
+            if eta_next == eta:
+                break
+            eta_previous, s_previous = eta, s
+
+    return d + eta * u, state
+
+
+def _winkler_results(model, d, Q, details):
+    """creates the AnalyzeResult object of a model with soil springs."""
+
+    results = AnalyzeResult(
+        _name=f"{model.name} ({model.pile.name}/{model.soil.name})",
+        _model=copy.copy(model),
+        _d=d,
+        _Q=Q,
+        _details=details,
+        _springs=True,
+    )
+
+    return results
+
+
+def _node_index(model, elevation=None) -> int:
+    """returns the index of the node at the given elevation, by default the pile head"""
+    if elevation is None:
+        elevation = model.pile.top_elevation
+    check = np.isclose(model._nodes_coordinates["x [m]"], elevation, atol=0.001)
+    if not check.any():
+        raise validation.UserInputError(
+            "The chosen elevation is not meshed as a node. Please include elevation in `x2mesh` variable when creating the Model."
+        )
+    return int(np.where(check)[0][0])
+
+
+def _batch_force_vectors(model, loads, elevation=None):
+    """converts the loads of a batch analysis into global force vectors of dim (n_cases, ndof)"""
+
+    loads = np.atleast_2d(np.asarray(loads, dtype=np.float64))
+    ndof = 3 * (model.element_number + 1)
+
+    if loads.shape[1] == ndof:
+        return loads.copy()
+    elif loads.shape[1] == 3:
+        node_idx = _node_index(model, elevation)
+        F = np.zeros((loads.shape[0], ndof))
+        F[:, 3 * node_idx : 3 * node_idx + 3] = loads
+        return F
+    else:
+        raise validation.UserInputError(
+            "loads must be of dim (n_cases, 3) with [Px, Py, Mz] or of dim (n_cases, ndof)."
         )
 
-        return results
+
+def _winkler_batch_chunk(model, F, U, supports, kwargs):
+    """runs the Newton-Raphson scheme for a chunk of load cases (used by worker processes)"""
+    out = []
+    for Fi in F:
+        out.append(_newton_raphson(model, Fi, U, supports, verbose=False, **kwargs))
+    return out
+
+
+def winkler_batch(
+    model,
+    loads,
+    elevation: float = None,
+    workers: int = 1,
+    max_iter: int = 100,
+    storage: Literal["dense", "banded", "sparse"] = "banded",
+    strategy: Literal["full", "modified", "initial"] = "full",
+    refactor_every: int = 5,
+    line_search: Literal["backtracking", "energy"] = None,
+    acceleration: Literal["aitken", "anderson"] = None,
+):
+    """
+    Function that runs the :py:func:`openpile.analyze.winkler` analysis for several load cases
+    on the same model.
+
+    The mesh, the springs and the boundary conditions of the model are shared by all load cases
+    and the loads defined in the model are ignored.
+
+    Parameters
+    ----------
+    model : `openpile.construct.Model` object
+        Model where structure and boundary conditions are defined.
+    loads : array-like
+        load cases, either of dim (n_cases, 3) where each row gives [Px, Py, Mz] applied at the given elevation
+        or of dim (n_cases, ndof) where each row is a global force vector.
+    elevation : float, optional
+        elevation where loads are applied if loads are given as [Px, Py, Mz], by default the pile head.
+    workers : int, by default 1
+        number of processes to run load cases in parallel, if None, the number of CPUs is used.
+        Processes are spawned, so scripts calling this function with workers > 1 must be
+        protected by an `if __name__ == "__main__":` block.
+    max_iter: int, by defaut 100
+        maximum number of iterations for convergence
+    storage: str, by default "banded"
+        storage of the global stiffness matrix, see :py:func:`openpile.analyze.winkler`
+    strategy: str, by default "full"
+        iteration strategy, see :py:func:`openpile.analyze.winkler`
+    refactor_every: int, by default 5
+        maximum number of iterations between two factorizations for the "modified" strategy
+    line_search: str, optional
+        line search of the iterations, see :py:func:`openpile.analyze.winkler`
+    acceleration: str, optional
+        acceleration of the iterations, see :py:func:`openpile.analyze.winkler`
+
+    Returns
+    -------
+    results : `openpile.analyze.AnalyzeBatchResult` object
+        Stacked results of all load cases
+    """
+    if model.soil is None:
+        raise validation.UserInputError("SoilProfile must be provided when creating the Model.")
+
+    F = _batch_force_vectors(model, loads, elevation)
+    # initialise prescribed displacement and supports vectors
+    _, U, supports = kernel.global_dof_vectors(model)
+
+    kwargs = {
+        "max_iter": max_iter,
+        "storage": storage,
+        "strategy": strategy,
+        "refactor_every": refactor_every,
+        "line_search": line_search,
+        "acceleration": acceleration,
+    }
+
+    if workers is None:
+        workers = os.cpu_count()
+    workers = max(1, min(workers, F.shape[0]))
+
+    if workers == 1:
+        out = _winkler_batch_chunk(model, F, U, supports, kwargs)
+    else:
+        # only the compact state of the model is sent to the processes
+        from openpile.parallel import ModelState, executor
+
+        state = ModelState.from_model(model)
+        with executor(workers) as pool:
+            futures = [
+                pool.submit(_winkler_batch_chunk, state, chunk, U, supports, kwargs)
+                for chunk in np.array_split(F, workers)
+            ]
+            out = [x for future in futures for x in future.result()]
+
+    return AnalyzeBatchResult(
+        _name=f"{model.name} ({model.pile.name}/{model.soil.name})",
+        _model=copy.copy(model),
+        _d=np.array([x[0] for x in out]),
+        _Q=np.array([x[1] for x in out]),
+        _details=[x[2] for x in out],
+    )
+
+
+def beam_batch(
+    model,
+    loads,
+    elevation: float = None,
+    storage: Literal["dense", "banded", "sparse"] = "banded",
+):
+    """
+    Function that runs the :py:func:`openpile.analyze.beam` analysis for several load cases
+    on the same model.
+
+    The stiffness matrix is factorized once and all load cases are solved with this factorization.
+    The second run with the stress stiffness matrix is then factorized once for each distinct
+    pattern of axial loads since the stress stiffness matrix only depends on these.
+
+    Parameters
+    ----------
+    model : `openpile.construct.Model` object
+        Model where structure and boundary conditions are defined.
+    loads : array-like
+        load cases, either of dim (n_cases, 3) where each row gives [Px, Py, Mz] applied at the given elevation
+        or of dim (n_cases, ndof) where each row is a global force vector.
+    elevation : float, optional
+        elevation where loads are applied if loads are given as [Px, Py, Mz], by default the pile head.
+    storage: str, by default "banded"
+        storage of the global stiffness matrix, see :py:func:`openpile.analyze.beam`
+
+    Returns
+    -------
+    results : `openpile.analyze.AnalyzeBatchResult` object
+        Stacked results of all load cases
+    """
+    F = _batch_force_vectors(model, loads, elevation)
+
+    # validate boundary conditions, with the dofs loaded in any load case
+    validation.check_boundary_conditions(model, forces=np.abs(F).max(axis=0).reshape(-1, 3))
+
+    # initialise prescribed displacement and supports vectors
+    _, U, supports = kernel.global_dof_vectors(model)
+
+    d = np.zeros(F.shape)
+    Q = np.zeros(F.shape)
+
+    # first run with no stress stiffness matrix, one factorization for all load cases
+    K = kernel.build_stiffness_matrix(model, np.zeros(F.shape[1]), storage=storage)
+    K_factorized = kernel.FactorizedStiffness(K, supports)
+    for i in range(F.shape[0]):
+        d[i], _ = K_factorized.solve(F[i], U)
+
+    # second run with stress stiffness matrix, one factorization per axial load pattern
+    _, groups = np.unique(F[:, 0::3], axis=0, return_inverse=True)
+    groups = np.asarray(groups).reshape(-1)
+    for group in np.unique(groups):
+        idx = np.where(groups == group)[0]
+        K = kernel.build_stiffness_matrix(model, d[idx[0]], storage=storage)
+        K_factorized = kernel.FactorizedStiffness(K, supports)
+        for i in idx:
+            d[i], Q[i] = K_factorized.solve(F[i], U)
+
+    return AnalyzeBatchResult(
+        _name=f"{model.name} ({model.pile.name})",
+        _model=copy.copy(model),
+        _d=d,
+        _Q=Q,
+        _details=[
+            {
+                "converged @ iter no.": 1,
+                "error": 0.0,
+                "tolerance": None,
+            }
+            for _ in range(F.shape[0])
+        ],
+    )
+
+
+@dataclass
+class PushoverResult(AnalyzeBatchResult):
+    """The `PushoverResult` class is created by :py:func:`openpile.analyze.pushover`.
+
+    The results of all converged steps are stacked in numpy arrays where the first dimension is the step,
+    as in :py:class:`openpile.analyze.AnalyzeBatchResult`. The results of one step can be retrieved as an
+    `AnalyzeResult` object by indexing, e.g. `results[-1]` for the last converged step.
+
+    """
+
+    #: load factor of each converged step
+    _load_factor: np.ndarray = None
+    #: index of the node where the load-displacement curve is given
+    _head: int = 0
+    #: True if the target was reached
+    _converged: bool = True
+    #: reference global force vector, i.e. the loads of the model
+    _F_ref: np.ndarray = None
+    #: number of steps restarted with a smaller step
+    _cutbacks: int = 0
+    #: wall time of the analysis
+    _wall_time: float = 0.0
+
+    @property
+    def load_factor(self):
+        """Load factor of each converged step, i.e. the factor applied to the loads
+        and prescribed displacements of the model.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_steps,)
+        """
+        return self._load_factor
+
+    @property
+    def converged(self) -> bool:
+        """True if the target of the analysis was reached."""
+        return self._converged
+
+    @property
+    def statistics(self) -> dict:
+        """Statistics of the analysis used to tune its parameters, i.e. the number of steps, the number
+        of cutbacks (steps restarted with a smaller step), the number of iterations and the wall time.
+        Iterations and wall time of each step are given in `details()`.
+
+        Returns
+        -------
+        dict
+        """
+        iterations = [x["converged @ iter no."] for x in self._details]
+        return {
+            "steps": len(self),
+            "cutbacks": self._cutbacks,
+            "iterations": int(np.sum(iterations)),
+            "iterations per step": float(np.mean(iterations)) if iterations else 0.0,
+            "wall time [s]": self._wall_time,
+            "wall time per step [s]": self._wall_time / max(1, len(self)),
+        }
+
+    @property
+    def curve(self):
+        """Load-displacement curve at the pile head (or at the controlled node),
+        one row per converged step.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Table with the load factor, the loads and the displacements of the node
+        """
+        i = 3 * self._head
+        loads = self._load_factor.reshape(-1, 1) * self._F_ref[i : i + 3]
+        return pd.DataFrame(
+            data={
+                "Load factor": self._load_factor,
+                "Px [kN]": loads[:, 0],
+                "Py [kN]": loads[:, 1],
+                "Mz [kNm]": loads[:, 2],
+                "Settlement [m]": self._d[:, i],
+                "Deflection [m]": self._d[:, i + 1],
+                "Rotation [rad]": self._d[:, i + 2],
+            }
+        )
+
+
+def _arc_length_load_increment(delta_d, d_R, d_F, arc_length, reference):
+    """returns the load factor increment of an iteration such that the displacement increment of the step
+    has the length `arc_length` (cylindrical arc-length method), or None if there is no such increment.
+
+    Of the two roots, the one giving the displacement increment closest to `reference` is chosen.
+    """
+    u = delta_d + d_R
+    a = d_F @ d_F
+    b = 2.0 * d_F @ u
+    c = u @ u - arc_length**2
+    discriminant = b**2 - 4.0 * a * c
+    if not a > 0.0 or discriminant < 0.0:
+        return None
+    roots = (-b + np.array([1.0, -1.0]) * np.sqrt(discriminant)) / (2.0 * a)
+    return max(roots, key=lambda root: (u + root * d_F) @ reference)
+
+
+def _pushover_step(
+    model,
+    d,
+    lam,
+    F_ref,
+    U_ref,
+    supports,
+    K,
+    max_iter,
+    storage,
+    target=None,
+    control_dof=None,
+    arc_length=None,
+    direction=None,
+):
+    """equilibrium iterations of one step of a pushover analysis, starting from the converged state
+    (d, lam) and its secant and tangent stiffness matrices K.
+
+    The load factor is an unknown of the iterations, it is either:
+
+    * prescribed to `target` (load control),
+    * such that the controlled dof reaches the displacement `target` (displacement control, if `control_dof` is given),
+    * such that the displacement increment of the step has the length `arc_length`
+      (arc-length control, if `arc_length` is given), the step being in the `direction` of the previous step.
+
+    Returns the displacements, the load factor, the stiffness matrices, the internal forces,
+    the number of iterations and the error and tolerance of the last iteration,
+    or None if the iterations did not converge.
+    """
+    K_secant, K_tangent = K
+    F_int = kernel.stiffness_dot(K_secant, d)
+    zeros = np.zeros(d.shape)
+    d_start = d
+    d = d.copy()
+
+    for iter_no in range(1, max_iter + 1):
+        try:
+            K_factorized = kernel.FactorizedStiffness(K_tangent, supports)
+            # response to the residual forces and to the reference loads
+            d_R, _ = K_factorized.solve(lam * F_ref - F_int, zeros)
+            d_F, _ = K_factorized.solve(F_ref, U_ref)
+        except np.linalg.LinAlgError:
+            return None
+
+        if arc_length is not None:
+            d_lam = _arc_length_load_increment(
+                d - d_start,
+                d_R,
+                d_F,
+                arc_length,
+                reference=direction if iter_no == 1 else d - d_start,
+            )
+            if d_lam is None:
+                return None
+        elif control_dof is None:
+            d_lam = target - lam
+        else:
+            d_lam = (target - d[control_dof] - d_R[control_dof]) / d_F[control_dof]
+
+        d += d_R + d_lam * d_F
+        lam += d_lam
+
+        K_secant, K_tangent = kernel.build_stiffness_matrix(
+            model, u=d, kind=("secant", "tangent"), storage=storage
+        )
+        F_int = kernel.stiffness_dot(K_secant, d)
+        error = np.linalg.norm((lam * F_ref - F_int)[~supports])
+        tolerance = 1e-4 * np.linalg.norm(F_int)
+
+        if not np.isfinite(error):
+            return None
+        if error < tolerance:
+            return d, lam, (K_secant, K_tangent), F_int, iter_no, error, tolerance
+
+    return None
+
+
+def pushover(
+    model,
+    target: float = 1.0,
+    control: Literal["load", "displacement", "arc-length"] = "load",
+    dof: Literal["Tx", "Ty", "Rz"] = "Ty",
+    elevation: float = None,
+    n_steps: int = 10,
+    adaptive: bool = True,
+    max_iter: int = 20,
+    desired_iter: int = 4,
+    max_cutbacks: int = 10,
+    max_steps: int = 1000,
+    storage: Literal["dense", "banded", "sparse"] = "banded",
+):
+    """
+    Function where the loads and prescribed displacements defined in the model boundary conditions
+    are applied incrementally to trace the load-displacement curve of the pile.
+
+    The loads and prescribed displacements of the model are scaled by a load factor. Each step starts
+    from the converged state of the previous step and is solved with the Newton-Raphson scheme.
+
+    With load control, the load factor is increased up to `target`. With displacement control,
+    the load factor is found such that the displacement `dof` of the node at `elevation` is increased up to
+    `target`, which allows to follow the softening response of the pile beyond its peak load.
+    With arc-length control, the load factor is found such that the norm of the displacement increment
+    of each step is constant (cylindrical arc-length method of Crisfield), which also allows to pass the
+    points where the controlled displacement decreases. The analysis ends once the displacement `dof`
+    of the node at `elevation` reaches `target`, the last step being run with displacement control.
+
+    If `adaptive` is True, the step is reduced when a step needs more than `desired_iter` iterations
+    or does not converge within `max_iter` iterations, in which case it is restarted from the last
+    converged state. The step is increased back to its initial value when steps converge quickly.
+
+    Parameters
+    ----------
+    model : `openpile.construct.Model` object
+        Model where structure and boundary conditions are defined.
+    target : float, by default 1.0
+        final load factor (load control) or displacement of the controlled dof in m or rad
+        (displacement and arc-length control).
+    control : str, by default "load"
+        can be of ("load", "displacement", "arc-length").
+    dof : str, by default "Ty"
+        controlled dof for displacement and arc-length control, can be of ("Tx", "Ty", "Rz").
+    elevation : float, optional
+        elevation of the node where the load-displacement curve is given and whose displacement
+        is controlled, by default the pile head.
+    n_steps : int, by default 10
+        number of steps if no step is reduced, the initial step is `target / n_steps`. With arc-length control,
+        the arc length is the norm of the displacement increment of the first step under load control.
+    adaptive : bool, by default True
+        whether the step is adapted to the number of iterations, else the analysis stops at the first
+        step that does not converge.
+    max_iter : int, by default 20
+        maximum number of iterations per step
+    desired_iter : int, by default 4
+        number of iterations per step the step size is adapted to.
+    max_cutbacks : int, by default 10
+        the analysis stops if the step must be smaller than the initial step halved `max_cutbacks` times.
+    max_steps : int, by default 1000
+        maximum number of converged steps.
+    storage: str, by default "banded"
+        storage of the global stiffness matrix, see :py:func:`openpile.analyze.winkler`
+
+    Returns
+    -------
+    results : `openpile.analyze.PushoverResult` object
+        Stacked results of all converged steps and load-displacement curve
+
+    Example
+    -------
+
+    >>> from openpile.construct import Pile, SoilProfile, Layer, Model
+    >>> from openpile.soilmodels import API_clay
+    >>> from openpile.analyze import pushover
+    >>> p = Pile.create_tubular(
+    ...     name="<pile name>", top_elevation=0, bottom_elevation=-40, diameter=7.5, wt=0.075
+    ... )
+    >>> sp = SoilProfile(
+    ...     name="<soil profile name>",
+    ...     top_elevation=0,
+    ...     water_line=0,
+    ...     layers=[
+    ...         Layer(
+    ...             name="clay",
+    ...             top=0,
+    ...             bottom=-40,
+    ...             weight=18,
+    ...             lateral_model=API_clay(Su=[40, 200], eps50=0.01, kind="static"),
+    ...         ),
+    ...     ],
+    ... )
+    >>> M = Model(name="<model name>", pile=p, soil=sp)
+    >>> M.set_support(elevation=-40, Tx=True)
+    >>> M.set_pointload(elevation=0, Py=1e3, Mz=-10e3)
+    >>> # push the pile head to 0.5 m deflection with the ratio of moment to shear of the model
+    >>> results = pushover(M, target=0.5, control="displacement")
+    >>> curve = results.curve
+    >>> # number of steps, iterations and wall time of the analysis
+    >>> stats = results.statistics
+    """
+    if model.soil is None:
+        raise validation.UserInputError("SoilProfile must be provided when creating the Model.")
+    if control not in ["load", "displacement", "arc-length"]:
+        raise validation.UserInputError(
+            "control must be one of ('load', 'displacement', 'arc-length')."
+        )
+    if dof not in ["Tx", "Ty", "Rz"]:
+        raise validation.UserInputError("dof must be one of ('Tx', 'Ty', 'Rz').")
+
+    start_time = time.perf_counter()
+
+    F_ref, U_ref, supports = kernel.global_dof_vectors(model)
+    head = _node_index(model, elevation)
+
+    control_dof = 3 * head + ["Tx", "Ty", "Rz"].index(dof)
+    if control != "load" and supports[control_dof]:
+        raise validation.UserInputError("The controlled dof must not be restrained.")
+
+    # converged state
+    d = np.zeros(F_ref.shape)
+    lam = 0.0
+    K = kernel.build_stiffness_matrix(model, u=d, kind=("secant", "tangent"), storage=storage)
+
+    if control == "arc-length":
+        # the first step moves the controlled dof by target / n_steps
+        d_F, _ = kernel.FactorizedStiffness(K[1], supports).solve(F_ref, U_ref)
+        if d_F[control_dof] == 0.0:
+            raise validation.UserInputError(
+                "The controlled dof is not displaced by the loads of the model."
+            )
+        initial_arc_length = abs(target / n_steps / d_F[control_dof]) * np.linalg.norm(d_F)
+        direction = np.sign(target * d_F[control_dof]) * d_F
+
+    out = []
+    # step size relative to the initial step
+    scale = 1.0
+    cutbacks = 0
+    # fraction of the target reached
+    progress = 0.0
+    step_time = time.perf_counter()
+
+    while progress < 1.0 - 1e-9 and len(out) < max_steps:
+        kwargs = dict(
+            model=model,
+            d=d,
+            lam=lam,
+            F_ref=F_ref,
+            U_ref=U_ref,
+            supports=supports,
+            K=K,
+            max_iter=max_iter,
+            storage=storage,
+        )
+        if control == "arc-length":
+            solution = _pushover_step(
+                arc_length=scale * initial_arc_length, direction=direction, **kwargs
+            )
+            if solution is not None and solution[0][control_dof] / target > 1.0:
+                # last step lands on the target with displacement control, if it fails
+                # the step is cut back instead of keeping the overshoot
+                solution = _pushover_step(target=target, control_dof=control_dof, **kwargs)
+        else:
+            step = min(scale / n_steps, 1.0 - progress)
+            solution = _pushover_step(
+                target=(progress + step) * target,
+                control_dof=control_dof if control == "displacement" else None,
+                **kwargs,
+            )
+
+        if solution is None:
+            # restart from last converged state with a smaller step
+            scale *= 0.5
+            cutbacks += 1
+            if not adaptive or scale < 0.5**max_cutbacks:
+                break
+            continue
+
+        d_previous = d
+        d, lam, K, F_int, iter_no, error, tolerance = solution
+        if control == "arc-length":
+            direction = d - d_previous
+            progress = d[control_dof] / target
+        else:
+            progress += step
+
+        details = {
+            "step no.": len(out) + 1,
+            "load factor": lam,
+            "converged @ iter no.": iter_no,
+            "error [kN]": round(error, 3),
+            "tolerance [kN]": round(tolerance, 3),
+            "wall time [s]": round(time.perf_counter() - step_time, 4),
+        }
+        if control == "arc-length":
+            details["arc length"] = np.linalg.norm(d - d_previous)
+        out.append((d, np.where(supports, F_int - lam * F_ref, 0.0), lam, details))
+        step_time = time.perf_counter()
+
+        if adaptive:
+            # larger steps if converged in less iterations than desired, else smaller steps
+            factor = min(2.0, max(0.5, np.sqrt(desired_iter / iter_no)))
+            scale = min(1.0, scale * factor)
+
+    converged = progress >= 1.0 - 1e-9
+    if not converged:
+        print(f"Pushover stopped at {progress:.1%} of the target after {len(out)} steps.")
+
+    ndof = F_ref.shape[0]
+    return PushoverResult(
+        _name=f"{model.name} ({model.pile.name}/{model.soil.name})",
+        _model=copy.copy(model),
+        _d=np.array([x[0] for x in out]).reshape(-1, ndof),
+        _Q=np.array([x[1] for x in out]).reshape(-1, ndof),
+        _details=[x[3] for x in out],
+        _load_factor=np.array([x[2] for x in out], dtype=float),
+        _head=head,
+        _converged=converged,
+        _F_ref=F_ref,
+        _cutbacks=cutbacks,
+        _wall_time=round(time.perf_counter() - start_time, 4),
+    )
+
+
+def _linearized_stiffness(model, state=None, storage="banded"):
+    """returns the global stiffness matrix of the model linearized at a state, i.e. the
+    tangent stiffness matrix of the state if given or the initial stiffness matrix otherwise."""
+    d = _state_displacements(state)
+    if d is None:
+        d = np.zeros(3 * len(model._nodes_coordinates["x [m]"]))
+        kind = "initial"
+    else:
+        kind = "tangent"
+    return kernel.build_stiffness_matrix(model, u=d, kind=kind, storage=storage)
+
+
+def head_stiffness(
+    model,
+    state=None,
+    elevation: float = None,
+    flexibility: bool = False,
+    storage: Literal["dense", "banded", "sparse"] = "banded",
+):
+    """
+    Linearized stiffness matrix of the pile head, i.e. the stiffness matrix of the pile and soil
+    springs statically condensed to the degrees of freedom of the pile head.
+
+    The global stiffness matrix is factorized once with the degrees of freedom of the pile head
+    restrained, the other supports of the model being kept, and the columns of the condensed stiffness
+    matrix are given by the reaction forces at the pile head for unit displacements of the pile head.
+
+    Parameters
+    ----------
+    model : `openpile.construct.Model` object
+        Model where structure and boundary conditions are defined.
+    state: `openpile.analyze.AnalyzeResult` object or numpy array, optional
+        state where the stiffness is linearized, given as the results of an analysis or as
+        the global displacement vector of dim (ndof,) or (n_nodes, 3). The tangent stiffness matrix
+        of the soil springs at this state is used. By default, the initial stiffness matrix is used.
+    elevation: float, optional
+        elevation of the node where the stiffness is calculated, by default the pile head.
+    flexibility: bool, by default False
+        if True, the flexibility matrix, i.e. the inverse of the stiffness matrix, is also returned.
+    storage: str, by default "banded"
+        storage of the global stiffness matrix, can be of ("dense", "banded", "sparse").
+
+    Returns
+    -------
+    K_head : numpy array of dim (3, 3)
+        stiffness matrix of the pile head with dofs ordered as (Tx, Ty, Rz),
+        i.e. in unit kN/m, kN/rad and kNm/rad.
+    C_head : numpy array of dim (3, 3)
+        flexibility matrix of the pile head, only returned if `flexibility` is True.
+        Terms related to a degree of freedom without stiffness (e.g. axial without axial springs
+        nor support) are infinite.
+
+    Example
+    -------
+
+    >>> from openpile.construct import Pile, SoilProfile, Layer, Model
+    >>> from openpile.soilmodels import API_sand
+    >>> from openpile.analyze import head_stiffness
+    >>> p = Pile.create_tubular(
+    ...     name="<pile name>", top_elevation=0, bottom_elevation=-40, diameter=7.5, wt=0.075
+    ... )
+    >>> sp = SoilProfile(
+    ...     name="Offshore Soil Profile",
+    ...     top_elevation=0,
+    ...     water_line=15,
+    ...     layers=[
+    ...         Layer(
+    ...             name="medium dense sand",
+    ...             top=0,
+    ...             bottom=-40,
+    ...             weight=18,
+    ...             lateral_model=API_sand(phi=33, kind="cyclic"),
+    ...         ),
+    ...     ],
+    ... )
+    >>> M = Model(name="<model name>", pile=p, soil=sp)
+    >>> M.set_support(elevation=-40, Tx=True)
+    >>> K = head_stiffness(M)
+    >>> K.shape
+    (3, 3)
+    """
+    K = _linearized_stiffness(model, state, storage)
+    _, _, supports = kernel.global_dof_vectors(model)
+
+    node_idx = _node_index(model, elevation)
+    K_head = kernel.condense_stiffness(K, supports, 3 * node_idx + np.arange(3))
+
+    if not flexibility:
+        return K_head
+
+    # invert the stiffness of the dofs with stiffness only, the stiffness of the other dofs
+    # being round-off errors
+    C_head = np.full(K_head.shape, np.inf)
+    stiff = np.abs(np.diag(K_head)) > 1e-9 * np.abs(K_head).max()
+    C_head[np.ix_(stiff, stiff)] = np.linalg.inv(K_head[np.ix_(stiff, stiff)])
+    return K_head, C_head
+
+
+@dataclass
+class Superelement:
+    """The `Superelement` class is created by :py:func:`openpile.analyze.superelement`.
+
+    It holds the stiffness matrix of the pile and soil springs statically condensed to the
+    degrees of freedom of a set of interface nodes, with dofs ordered node by node as (Tx, Ty, Rz),
+    and optionally the stiffness matrices linearized at several states of the model (e.g. load levels).
+    It can be saved to and loaded from a numpy `.npz` file to be used in another structural solver.
+
+    """
+
+    _name: str
+    #: elevations of the interface nodes
+    _elevations: np.ndarray
+    #: condensed initial stiffness matrix
+    _K: np.ndarray
+    #: condensed tangent stiffness matrices of the states
+    _states_K: np.ndarray
+    #: displacements of the interface dofs at the states
+    _states_d: np.ndarray
+    #: forces at the interface dofs at the states
+    _states_F: np.ndarray
+
+    @property
+    def name(self) -> str:
+        """Name of the model the superelement is created from."""
+        return self._name
+
+    @property
+    def elevations(self):
+        """Elevations of the interface nodes [m].
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_nodes,)
+        """
+        return self._elevations
+
+    @property
+    def dofs(self) -> list:
+        """Labels of the interface dofs, e.g. "Ty @ 0.0m"."""
+        return [f"{dof} @ {x}m" for x in self._elevations for dof in ["Tx", "Ty", "Rz"]]
+
+    @property
+    def stiffness(self):
+        """Condensed initial stiffness matrix.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (3 * n_nodes, 3 * n_nodes)
+        """
+        return self._K
+
+    @property
+    def states_stiffness(self):
+        """Condensed tangent stiffness matrices linearized at each state.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_states, 3 * n_nodes, 3 * n_nodes)
+        """
+        return self._states_K
+
+    @property
+    def states_displacements(self):
+        """Displacements of the interface dofs at each state.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_states, 3 * n_nodes)
+        """
+        return self._states_d
+
+    @property
+    def states_forces(self):
+        """Forces resisted by the pile and soil springs at the interface dofs at each state,
+        i.e. the forces applied by the interfaced structure.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_states, 3 * n_nodes)
+        """
+        return self._states_F
+
+    def to_npz(self, path):
+        """Saves the superelement in a numpy `.npz` file with the arrays "elevations", "dofs",
+        "stiffness", "states_stiffness", "states_displacements" and "states_forces".
+
+        Parameters
+        ----------
+        path : str or path-like
+            path of the file
+        """
+        np.savez(
+            path,
+            name=np.array(self._name),
+            elevations=self._elevations,
+            dofs=np.array(self.dofs),
+            stiffness=self._K,
+            states_stiffness=self._states_K,
+            states_displacements=self._states_d,
+            states_forces=self._states_F,
+        )
+
+    @classmethod
+    def from_npz(cls, path):
+        """Loads a superelement saved with :py:meth:`openpile.analyze.Superelement.to_npz`.
+
+        Parameters
+        ----------
+        path : str or path-like
+            path of the file
+
+        Returns
+        -------
+        `openpile.analyze.Superelement` object
+        """
+        with np.load(path) as data:
+            return cls(
+                _name=str(data["name"]),
+                _elevations=data["elevations"],
+                _K=data["stiffness"],
+                _states_K=data["states_stiffness"],
+                _states_d=data["states_displacements"],
+                _states_F=data["states_forces"],
+            )
+
+
+def superelement(
+    model,
+    elevations=None,
+    states=None,
+    storage: Literal["dense", "banded", "sparse"] = "banded",
+):
+    """
+    Superelement of the pile and soil springs, i.e. the stiffness matrix statically condensed to the
+    degrees of freedom of a set of interface nodes.
+
+    The global stiffness matrix is factorized once per stiffness matrix with the dofs of the interface
+    nodes restrained, the other supports of the model being kept, see
+    :py:func:`openpile.core.kernel.condense_stiffness`. With the default banded storage, the cost of the
+    condensation is linear with the number of dofs of the model.
+
+    Parameters
+    ----------
+    model : `openpile.construct.Model` object
+        Model where structure and boundary conditions are defined.
+    elevations: float or list of float, optional
+        elevations of the interface nodes, by default the pile head.
+        Each elevation must be meshed as a node.
+    states: list of `openpile.analyze.AnalyzeResult` objects or `openpile.analyze.AnalyzeBatchResult` object, optional
+        states, e.g. load levels, where linearized (tangent) stiffness matrices are also condensed.
+        States can also be given as global displacement vectors. By default, no state.
+    storage: str, by default "banded"
+        storage of the global stiffness matrix, can be of ("dense", "banded", "sparse").
+
+    Returns
+    -------
+    `openpile.analyze.Superelement` object
+    """
+    if elevations is None:
+        elevations = [model.pile.top_elevation]
+    elevations = np.atleast_1d(np.asarray(elevations, dtype=np.float64))
+
+    nodes = np.array([_node_index(model, x) for x in elevations])
+    dofs = (3 * nodes.reshape(-1, 1) + np.arange(3)).reshape(-1)
+    _, _, supports = kernel.global_dof_vectors(model)
+
+    if states is None:
+        states = []
+    elif isinstance(states, AnalyzeBatchResult):
+        states = list(states._d)
+
+    states_K = np.zeros((len(states), len(dofs), len(dofs)))
+    states_d = np.zeros((len(states), len(dofs)))
+    states_F = np.zeros((len(states), len(dofs)))
+    for i, state in enumerate(states):
+        d = _state_displacements(state)
+        K_secant, K_tangent = kernel.build_stiffness_matrix(
+            model, u=d, kind=("secant", "tangent"), storage=storage
+        )
+        states_K[i] = kernel.condense_stiffness(K_tangent, supports, dofs)
+        states_d[i] = d[dofs]
+        states_F[i] = kernel.stiffness_dot(K_secant, d)[dofs]
+
+    return Superelement(
+        _name=model.name,
+        _elevations=elevations,
+        _K=kernel.condense_stiffness(_linearized_stiffness(model, storage=storage), supports, dofs),
+        _states_K=states_K,
+        _states_d=states_d,
+        _states_F=states_F,
+    )
+
+
+def _scaled_modes(eigenvectors, free, ndof):
+    """returns the eigenvectors of the free dofs as global vectors of dim (n_modes, ndof),
+    scaled to a maximum translation of 1."""
+    n_modes = eigenvectors.shape[1]
+    modes = np.zeros((n_modes, ndof))
+    modes[:, free] = eigenvectors.T
+    translations = modes.reshape(n_modes, -1, 3)[:, :, :2].reshape(n_modes, -1)
+    peak = translations[np.arange(n_modes), np.abs(translations).argmax(axis=1)]
+    return modes / peak.reshape(-1, 1)
+
+
+@dataclass
+class ModalResult:
+    """The `ModalResult` class is created by :py:func:`openpile.analyze.modal`.
+
+    It holds the natural frequencies and mode shapes of the lowest modes of the pile-soil system.
+
+    """
+
+    _name: str
+    #: elevations of the nodes
+    _elevation: np.ndarray
+    #: natural circular frequencies [rad/s]
+    _omega: np.ndarray
+    #: mode shapes as global displacement vectors
+    _modes: np.ndarray
+    _details: dict = None
+
+    def __len__(self):
+        return len(self._omega)
+
+    @property
+    def elevation(self):
+        """Elevations of the nodes [m].
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_nodes,)
+        """
+        return self._elevation
+
+    @property
+    def frequencies(self):
+        """Natural frequencies [Hz] in ascending order.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_modes,)
+        """
+        return self._omega / (2 * np.pi)
+
+    @property
+    def periods(self):
+        """Natural periods [s] in descending order.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_modes,)
+        """
+        with np.errstate(divide="ignore"):
+            return 1.0 / self.frequencies
+
+    @property
+    def mode_shapes(self):
+        """Nodal displacements of each mode, i.e. settlement, deflection and rotation,
+        scaled to a maximum translation of 1.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_modes, n_nodes, 3)
+        """
+        return self._modes.reshape(len(self), -1, 3)
+
+    def details(self) -> dict:
+        """Provides details of the analysis, i.e. the mass matrix, the masses and the wall time.
+
+        Returns
+        -------
+        dict
+        """
+        return self._details
+
+
+def modal(
+    model,
+    n_modes: int = 3,
+    mass: Literal["consistent", "lumped"] = "consistent",
+    head_mass: float = 0.0,
+    head_inertia: float = 0.0,
+    state=None,
+):
+    """
+    Modal analysis of the pile-soil system, giving the natural frequencies and mode shapes
+    of the lowest modes.
+
+    The mass matrix is built from the cross-sections and the unit weight of the pile, see
+    :py:func:`openpile.core.kernel.build_mass_matrix`, and a mass can be lumped at the pile head,
+    e.g. the mass of the structure above. The soil springs are linearized at the initial state or at
+    a given state. Only the lowest `n_modes` modes are computed with a sparse eigensolver in
+    shift-invert mode, i.e. from one sparse factorization of the stiffness matrix.
+
+    Parameters
+    ----------
+    model : `openpile.construct.Model` object
+        Model where structure and boundary conditions are defined.
+    n_modes: int, by default 3
+        number of modes to calculate.
+    mass: str, by default "consistent"
+        mass matrix of the pile, can be of ("consistent", "lumped").
+    head_mass: float, by default 0.0
+        mass lumped at the pile head [t].
+    head_inertia: float, by default 0.0
+        rotational inertia lumped at the pile head [t.m2].
+    state: `openpile.analyze.AnalyzeResult` object or numpy array, optional
+        state where the soil springs are linearized, given as the results of an analysis or as
+        the global displacement vector of dim (ndof,) or (n_nodes, 3). By default, the initial
+        stiffness of the soil springs is used.
+
+    Returns
+    -------
+    `openpile.analyze.ModalResult` object
+    """
+    start_time = time.perf_counter()
+
+    K = _linearized_stiffness(model, state, storage="sparse")
+    M = kernel.build_mass_matrix(model, kind=mass, storage="sparse")
+    # masses lumped at the pile head
+    head = np.zeros(M.shape[0])
+    head[3 * _node_index(model) + np.arange(3)] = [head_mass, head_mass, head_inertia]
+    M = M + sparse.diags(head)
+
+    _, _, supports = kernel.global_dof_vectors(model)
+    free = np.flatnonzero(~supports)
+    if not 0 < n_modes < len(free):
+        raise ValueError(f"n_modes must be between 1 and {len(free) - 1}.")
+
+    # the negative shift gives the modes of lowest frequencies and keeps the factorized matrix
+    # non-singular in the presence of rigid body modes
+    eigenvalues, eigenvectors = eigsh(
+        K[free][:, free].tocsc(), k=n_modes, M=M[free][:, free].tocsc(), sigma=-1.0, which="LM"
+    )
+    order = np.argsort(eigenvalues)
+
+    return ModalResult(
+        _name=model.name,
+        _elevation=np.asarray(model._nodes_coordinates["x [m]"], dtype=np.float64),
+        _omega=np.sqrt(np.maximum(eigenvalues[order], 0.0)),
+        _modes=_scaled_modes(eigenvectors[:, order], free, M.shape[0]),
+        _details={
+            "mass matrix": mass,
+            "pile mass [t]": round(model.pile.weight / 9.81, 3),
+            "head mass [t]": head_mass,
+            "head inertia [t.m2]": head_inertia,
+            "wall time [s]": round(time.perf_counter() - start_time, 4),
+        },
+    )
+
+
+@dataclass
+class BucklingResult:
+    """The `BucklingResult` class is created by :py:func:`openpile.analyze.buckling`.
+
+    It holds the critical load factors and buckling modes of the lowest modes of the pile-soil system.
+
+    """
+
+    _name: str
+    #: elevations of the nodes
+    _elevation: np.ndarray
+    #: critical load factors
+    _load_factors: np.ndarray
+    #: buckling modes as global displacement vectors
+    _modes: np.ndarray
+    #: largest axial compression in the pile under the reference loads [kN]
+    _reference: float
+    _details: dict = None
+
+    def __len__(self):
+        return len(self._load_factors)
+
+    @property
+    def elevation(self):
+        """Elevations of the nodes [m].
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_nodes,)
+        """
+        return self._elevation
+
+    @property
+    def load_factors(self):
+        """Critical load factors in ascending order, i.e. the factors applied to the reference loads
+        at which the pile buckles.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_modes,)
+        """
+        return self._load_factors
+
+    @property
+    def critical_loads(self):
+        """Critical axial loads [kN] in ascending order, i.e. the critical load factors multiplied by the
+        largest axial compression in the pile under the reference loads and displacements.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_modes,)
+        """
+        return self._load_factors * self._reference
+
+    @property
+    def mode_shapes(self):
+        """Nodal displacements of each buckling mode, i.e. settlement, deflection and rotation,
+        scaled to a maximum translation of 1.
+
+        Returns
+        -------
+        numpy.ndarray
+            array of dim (n_modes, n_nodes, 3)
+        """
+        return self._modes.reshape(len(self), -1, 3)
+
+    def details(self) -> dict:
+        """Provides details of the analysis, i.e. the reference load and the wall time.
+
+        Returns
+        -------
+        dict
+        """
+        return self._details
+
+
+def buckling(
+    model,
+    n_modes: int = 1,
+    load: float = None,
+    state=None,
+):
+    r"""
+    Linear buckling analysis of the pile-soil system, giving the critical load factors and buckling
+    modes of the lowest modes.
+
+    The axial forces in the pile are calculated by a linear analysis under reference loads, which give
+    the geometric (stress) stiffness matrix of the pile :math:`K_G`, see
+    :py:func:`openpile.core.kernel.elem_p_delta_stiffness_matrix`. The critical load factors
+    :math:`\lambda` are the lowest positive solutions of the generalized eigenvalue problem
+    :math:`(K + \lambda K_G) \phi = 0`, where :math:`K` is the stiffness matrix of the pile and soil springs.
+    Both matrices are assembled once in banded storage and the lowest modes only are computed with a sparse
+    eigensolver, the stiffness matrix being factorized once.
+
+    Parameters
+    ----------
+    model : `openpile.construct.Model` object
+        Model where structure and boundary conditions are defined.
+    n_modes: int, by default 1
+        number of buckling modes to calculate.
+    load: float, optional
+        axial compression [kN] applied at the pile head as reference load. The critical load factors are then the
+        critical loads. By default, the loads and prescribed displacements of the model are the reference loads.
+    state: `openpile.analyze.AnalyzeResult` object or numpy array, optional
+        state where the soil springs are linearized, given as the results of an analysis or as
+        the global displacement vector of dim (ndof,) or (n_nodes, 3). By default, the initial
+        stiffness of the soil springs is used.
+
+    Returns
+    -------
+    `openpile.analyze.BucklingResult` object
+
+    Raises
+    ------
+    ValueError
+        if the reference loads do not compress the pile
+    """
+    start_time = time.perf_counter()
+
+    F, U, supports = kernel.global_dof_vectors(model)
+    if load is not None:
+        F = np.zeros(F.shape)
+        U = np.zeros(U.shape)
+        F[3 * _node_index(model)] = -load
+    free = np.flatnonzero(~supports)
+    if not 0 < n_modes < len(free):
+        raise ValueError(f"n_modes must be between 1 and {len(free) - 1}.")
+
+    # stiffness matrix of the pile and soil springs, without the stress stiffness of the state
+    d = _state_displacements(state)
+    if d is None:
+        K = _linearized_stiffness(model, storage="banded")
+    else:
+        K = _linearized_stiffness(model, d, storage="banded") - kernel.assemble(
+            kernel.elem_p_delta_stiffness_matrix(model, d), storage="banded"
+        )
+    factorized = kernel.FactorizedStiffness(K, supports)
+
+    # geometric stiffness matrix of the axial forces of the reference loads
+    d_ref, _ = factorized.solve(F, U)
+    # largest axial compression of the reference loads and prescribed displacements
+    reference = float(kernel.pile_internal_forces(model, d_ref)[::6].max())
+    if not reference > 0.0:
+        raise ValueError("The reference loads do not compress the pile, it cannot buckle.")
+    K_G = kernel.assemble(kernel.elem_p_delta_stiffness_matrix(model, d_ref), storage="banded")
+
+    def expand(x):
+        # global vector of the free dofs
+        y = np.zeros(len(supports))
+        y[free] = x
+        return y
+
+    def inverse(x):
+        return factorized.solve(expand(x), np.zeros(len(supports)))[0][free]
+
+    # largest eigenvalues mu = 1 / lambda of -K_G phi = mu K phi, where K is positive definite
+    shape = (len(free), len(free))
+    mu, eigenvectors = eigsh(
+        LinearOperator(shape, matvec=lambda x: -kernel.stiffness_dot(K_G, expand(x))[free]),
+        k=n_modes,
+        M=LinearOperator(shape, matvec=lambda x: kernel.stiffness_dot(K, expand(x))[free]),
+        Minv=LinearOperator(shape, matvec=inverse),
+        which="LA",
+    )
+    order = np.argsort(mu)[::-1]
+    mu, eigenvectors = mu[order], eigenvectors[:, order]
+    # modes with negative factors would buckle under reversed loads
+    positive = mu > 0.0
+
+    return BucklingResult(
+        _name=model.name,
+        _elevation=np.asarray(model._nodes_coordinates["x [m]"], dtype=np.float64),
+        _load_factors=1.0 / mu[positive],
+        _modes=_scaled_modes(eigenvectors[:, positive], free, len(supports)),
+        _reference=reference,
+        _details={
+            "reference axial load [kN]": round(reference, 3),
+            "wall time [s]": round(time.perf_counter() - start_time, 4),
+        },
+    )
 
 
 def simple_winkler_analysis(model, max_iter: int = 100):
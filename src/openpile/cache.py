@@ -0,0 +1,231 @@
+"""
+`cache` module
+==================
+
+The `cache` module provides an opt-in cache of the springs created by the soil models
+when a `openpile.construct.Model` is created.
+
+The springs of a layer only depend on the parameters of its lateral model and on the
+vertical stress, depth, pile width and water table at the points where they are created.
+They are stored with a hash of these inputs as key, such that models rebuilt with the
+same soil profile and mesh, e.g. for another load case or another wall thickness of the pile,
+reuse the springs instead of creating them again.
+
+The springs are kept in memory with a least-recently-used policy and, optionally,
+in a directory as numpy `.npz` files to be shared between sessions and processes.
+
+Lateral models with a function as parameter (e.g. a multiplier varying with depth)
+cannot be hashed reliably and their springs are never cached.
+
+Example
+-------
+
+.. code-block:: python
+
+    from openpile import cache
+
+    cache.enable(maxsize=512, directory="spring_cache")
+
+    for wt in [0.06, 0.07, 0.08]:
+        # springs are created once, then retrieved from the cache
+        M = create_model(wall_thickness=wt)
+        ...
+
+    print(cache.statistics())
+
+"""
+
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+
+import numpy as np
+
+from openpile.globals import VERSION
+
+#: version of the springs created by the soil models, part of the cache keys such that springs
+#: cached by a previous version are not reused. To be increased whenever a function creating
+#: springs (e.g. in `openpile.utils.py_curves`) gives different springs for the same inputs.
+SPRINGS_VERSION = 2
+
+
+class SpringCache:
+    """Cache of springs keyed by a hash of the soil model parameters and spring inputs.
+
+    Keys also include the versions of openpile and of the springs, see `SPRINGS_VERSION`,
+    such that springs stored on disk by a previous version are not reused.
+
+    Parameters
+    ----------
+    maxsize : int, by default 256
+        maximum number of springs sets (one per layer and kind of springs) kept in memory.
+    directory : str or path-like, optional
+        directory where springs are also stored as `.npz` files, by default springs are kept in memory only.
+    """
+
+    def __init__(self, maxsize: int = 256, directory=None):
+        self.maxsize = maxsize
+        self.directory = None if directory is None else os.fspath(directory)
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+
+    def key(self, soil_model, name: str, inputs: dict):
+        """returns the hash of the soil model parameters, the kind of springs and the inputs
+        of the spring function, None if the soil model cannot be hashed."""
+        h = hashlib.sha1(
+            f"{VERSION}|{SPRINGS_VERSION}|{type(soil_model).__qualname__}|{name}".encode()
+        )
+        if is_dataclass(soil_model):
+            parameters = [(f.name, getattr(soil_model, f.name)) for f in fields(soil_model)]
+        else:
+            parameters = sorted(vars(soil_model).items())
+        for label, value in parameters + sorted(inputs.items()):
+            if callable(value):
+                return None
+            h.update(label.encode())
+            if isinstance(value, np.ndarray):
+                h.update(str((value.dtype, value.shape)).encode())
+                h.update(np.ascontiguousarray(value).tobytes())
+            else:
+                h.update(repr(value).encode())
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def get(self, key):
+        """returns the springs stored with the key, None if not stored."""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key]
+        if self.directory is not None and os.path.exists(self._path(key)):
+            with np.load(self._path(key)) as data:
+                springs = tuple(data[f"arr_{i}"] for i in range(len(data.files)))
+            self._store(key, springs)
+            self.disk_hits += 1
+            return springs
+        return None
+
+    def put(self, key, springs):
+        """stores springs, i.e. a tuple of arrays, with the key."""
+        springs = tuple(np.array(x) for x in springs)
+        self._store(key, springs)
+        if self.directory is not None:
+            # write to a temporary file first such that concurrent processes never read partial files
+            fd, tmp = tempfile.mkstemp(suffix=".npz", dir=self.directory)
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, *springs)
+            os.replace(tmp, self._path(key))
+
+    def _store(self, key, springs):
+        for x in springs:
+            x.setflags(write=False)
+        self._memory[key] = springs
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def springs(self, soil_model, name: str, inputs: dict, create):
+        """returns the springs of the inputs, created with `create(**inputs)` if not cached."""
+        key = self.key(soil_model, name, inputs)
+        if key is None:
+            self.uncacheable += 1
+            return create(**inputs)
+
+        springs = self.get(key)
+        if springs is None:
+            self.misses += 1
+            springs = create(**inputs)
+            self.put(key, springs)
+        return springs
+
+    def clear(self, disk: bool = False):
+        """empties the cache in memory, and on disk if `disk` is True, and resets the statistics."""
+        self._memory.clear()
+        if disk and self.directory is not None:
+            for file in os.listdir(self.directory):
+                if file.endswith(".npz"):
+                    os.remove(os.path.join(self.directory, file))
+        self.hits = self.disk_hits = self.misses = self.uncacheable = 0
+
+    def statistics(self) -> dict:
+        """returns the number of hits (in memory and on disk), misses and uncacheable calls."""
+        return {
+            "hits": self.hits,
+            "disk hits": self.disk_hits,
+            "misses": self.misses,
+            "uncacheable": self.uncacheable,
+            "size": len(self._memory),
+        }
+
+
+_cache = None
+
+
+def enable(maxsize: int = 256, directory=None) -> SpringCache:
+    """Enables the cache of springs for all models created afterwards.
+
+    Parameters
+    ----------
+    maxsize : int, by default 256
+        maximum number of springs sets (one per layer and kind of springs) kept in memory.
+    directory : str or path-like, optional
+        directory where springs are also stored as `.npz` files, by default springs are kept in memory only.
+
+    Returns
+    -------
+    `openpile.cache.SpringCache` object
+        the active cache
+    """
+    global _cache
+    _cache = SpringCache(maxsize=maxsize, directory=directory)
+    return _cache
+
+
+def disable():
+    """Disables the cache of springs, springs are then created for each model."""
+    global _cache
+    _cache = None
+
+
+def active():
+    """Returns the active cache, None if the cache is disabled.
+
+    Returns
+    -------
+    `openpile.cache.SpringCache` object or None
+    """
+    return _cache
+
+
+def clear(disk: bool = False):
+    """Empties the active cache, see :py:meth:`openpile.cache.SpringCache.clear`."""
+    if _cache is not None:
+        _cache.clear(disk=disk)
+
+
+def statistics() -> dict:
+    """Returns the statistics of the active cache, see :py:meth:`openpile.cache.SpringCache.statistics`.
+
+    Returns
+    -------
+    dict
+        empty if the cache is disabled
+    """
+    return {} if _cache is None else _cache.statistics()
+
+
+def springs(soil_model, name: str, inputs: dict, create):
+    """returns the springs of a soil model created with `create(**inputs)`, retrieved from the
+    active cache if any."""
+    if _cache is None:
+        return create(**inputs)
+    return _cache.springs(soil_model, name, inputs, create)
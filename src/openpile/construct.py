@@ -22,7 +22,10 @@ These objects include:
 import math as m
 import pandas as pd
 import numpy as np
+import copy
 import warnings
+from dataclasses import replace
+from functools import partial
 from typing import List, Dict, Optional, Union
 from typing_extensions import Literal
 from pydantic import (
@@ -44,6 +47,7 @@ import openpile.utils.graphics as graphics
 import openpile.core.validation as validation
 import openpile.soilmodels as soilmodels
 
+from openpile import cache
 from openpile.core import misc
 
 from openpile.soilmodels import ConstitutiveModel
@@ -51,6 +55,26 @@ from openpile.soilmodels import ConstitutiveModel
 from openpile.core.misc import generate_color_string
 
 
+def _check_springs(arr) -> bool:
+    # True if springs have negative or NaN values
+    return np.isnan(arr).any() or (arr < 0).any()
+
+
+def _columns_to_arrays(df: pd.DataFrame) -> dict:
+    # contiguous array of each column of a table, keyed by column name
+    return {column: np.ascontiguousarray(df[column].to_numpy()) for column in df.columns}
+
+
+def _springs_point_by_point(fct, **kwargs) -> tuple:
+    # springs of a lateral model without batch function, one call per point
+    n = len(kwargs["X"])
+    springs = [
+        fct(**{key: (v[i] if isinstance(v, np.ndarray) else v) for key, v in kwargs.items()})
+        for i in range(n)
+    ]
+    return tuple(np.array(x) for x in zip(*springs))
+
+
 class PydanticConfig:
     arbitrary_types_allowed = True
     extra = Extra.forbid
@@ -165,33 +189,24 @@ class Pile:
         area = []
         second_moment_of_area = []
         # add top and bottom of section i (essentially the same values)
-        if self.materail =="Steel";
-          for _, (d, wt) in enumerate(
-              zip(self.pile_sections["diameter"], self.pile_sections["wall thickness"])
-          ):
-              # calculate area
-              if self.kind == "Circular":
-                  A = m.pi / 4 * (d**2 - (d - 2 * wt) ** 2)
-                  I = m.pi / 64 * (d**4 - (d - 2 * wt) ** 4)
-                  area.append(A)
-                  area.append(area[-1])
-                  second_moment_of_area.append(I)
-                  second_moment_of_area.append(second_moment_of_area[-1])
-              else:
-                  # not yet supporting other kind
-                  raise ValueError()
-        else:
-              # calculate area
-              if self.kind == "Circular":
-                  A = m.pi / 4 * (d**2)
-                  I = m.pi / 64 * (d**4)
-                  area.append(A)
-                  area.append(area[-1])
-                  second_moment_of_area.append(I)
-                  second_moment_of_area.append(second_moment_of_area[-1])
-              else:
-                  # not yet supporting other kind
-                  raise ValueError()
+        for _, (d, wt) in enumerate(
+            zip(self.pile_sections["diameter"], self.pile_sections["wall thickness"])
+        ):
+            # calculate area
+            if self.kind == "Circular":
+                if self.material == "Steel":
+                    A = m.pi / 4 * (d**2 - (d - 2 * wt) ** 2)
+                    I = m.pi / 64 * (d**4 - (d - 2 * wt) ** 4)
+                else:
+                    A = m.pi / 4 * (d**2)
+                    I = m.pi / 64 * (d**4)
+                area.append(A)
+                area.append(area[-1])
+                second_moment_of_area.append(I)
+                second_moment_of_area.append(second_moment_of_area[-1])
+            else:
+                # not yet supporting other kind
+                raise ValueError()
         # Create pile data
         self.data = pd.DataFrame(
             data={
@@ -816,6 +831,11 @@ class Model:
         additional elevations to be included in the mesh, by default none.
     coarseness : float, optional
         maximum distance in meters between two nodes of the mesh, by default 0.5.
+        In graded meshes, maximum distance at the ground level.
+    grading : float, optional
+        ratio of the maximum distance between two nodes at the pile tip to the one at
+        the ground level, the maximum distance varies linearly in between, by default 1.0,
+        i.e. uniform mesh. Values above 1 give meshes finer near the mudline and coarser at depth.
     distributed_lateral : bool, optional
         include distributed lateral springs, by default True.
     distributed_moment : bool, optional
@@ -863,6 +883,8 @@ class Model:
     >>> Model_without_soil = Model(name = "Example without soil", pile=p, coarseness=5)
     >>> # create Model with nodes maximum 1 metre apart with soil profile
     >>> Model_with_soil = Model(name = "Example with soil", pile=p, soil=sp, coarseness=1)
+    >>> # create Model with nodes 0.25 metre apart at the mudline and 1 metre apart at the pile tip
+    >>> Graded_model = Model(name = "Graded", pile=p, soil=sp, coarseness=0.25, grading=4)
     """
 
     #: model name
@@ -877,6 +899,8 @@ class Model:
     x2mesh: List[float] = Field(default_factory=list)
     #: mesh coarseness, represent the maximum accepted length of elements
     coarseness: float = 0.5
+    #: ratio of the maximum accepted length of elements at the pile tip to the one at the ground
+    grading: confloat(gt=0.0) = 1.0
     #: whether to include p-y springs in the calculations
     distributed_lateral: bool = True
     #: whether to include m-t springs in the calculations
@@ -900,17 +924,10 @@ class Model:
         return values
 
     def __post_init__(self):
-        def check_springs(arr):
-            check_nan = np.isnan(arr).any()
-            check_negative = (arr < 0).any()
-
-            return check_nan or check_negative
-
         def get_coordinates() -> pd.DataFrame:
             # Primary discretisation over x-axis
-            x = np.array([], dtype=np.float16)
             # add get pile relevant sections
-            x = np.append(x, self.pile.data["Elevation [m]"].values)
+            x = self.pile.data["Elevation [m]"].values
             # add soil relevant layers and others
             if self.soil is not None:
                 soil_elevations = np.array(
@@ -924,26 +941,14 @@ class Model:
             # add user-defined elevation
             x = np.append(x, self.x2mesh)
 
-            # get unique values and sort in reverse order
-            x = np.unique(x)[::-1]
-
-            # Secondary discretisation over x-axis depending on coarseness factor
-            x_secondary = np.array([], dtype=np.float16)
-            for i in range(len(x) - 1):
-                spacing = x[i] - x[i + 1]
-                new_spacing = spacing
-                divider = 1
-                while new_spacing > self.coarseness:
-                    divider += 1
-                    new_spacing = spacing / divider
-                new_x = x[i] - (
-                    np.arange(start=1, stop=divider) * np.tile(new_spacing, (divider - 1))
-                )
-                x_secondary = np.append(x_secondary, new_x)
-
-            # assemble x- coordinates
-            x = np.append(x, x_secondary)
-            x = np.unique(x)[::-1]
+            # Secondary discretisation over x-axis depending on coarseness and grading
+            x = misc.mesh_elevations(
+                x,
+                coarseness=self.coarseness,
+                grading=self.grading,
+                ground=self.pile.top_elevation if self.soil is None else self.soil.top_elevation,
+                tip=self.pile.bottom_elevation,
+            )
 
             # dummy y- coordinates
             y = np.zeros(shape=x.shape)
@@ -955,7 +960,7 @@ class Model:
                     "y [m]": y,
                 },
                 dtype=float,
-            ).round(3)
+            )
             nodes.index.name = "Node no."
 
             element = pd.DataFrame(
@@ -966,41 +971,126 @@ class Model:
                     "y_bottom [m]": y[1:],
                 },
                 dtype=float,
-            ).round(3)
+            )
             element.index.name = "Element no."
 
             return nodes, element
 
-            # function doing the work
+        # creates mesh coordinates
+        nodes_coordinates, element_coordinates = get_coordinates()
+        self._nodes_coordinates = _columns_to_arrays(nodes_coordinates)
+        self.element_number = int(element_coordinates.shape[0])
 
-        def get_soil_profile() -> pd.DataFrame:
-            top_elevations = [x.top for x in self.soil.layers]
-            bottom_elevations = [x.bottom for x in self.soil.layers]
-            soil_weights = [x.weight for x in self.soil.layers]
+        # creates element structural properties
+        self._element_properties = self._create_element_properties(element_coordinates)
 
-            idx_sort = np.argsort(top_elevations)[::-1]
+        if self.soil is not None:
+            # create soil properties
+            self._soil_properties = self._create_soil_properties(element_coordinates)
 
-            top_elevations = [top_elevations[i] for i in idx_sort]
-            soil_weights = [soil_weights[i] for i in idx_sort]
-            bottom_elevations = [bottom_elevations[i] for i in idx_sort]
+            # Create arrays of springs
+            (
+                self._py_springs,
+                self._mt_springs,
+                self._Hb_spring,
+                self._Mb_spring,
+                self._tz_springs,
+            ) = self._create_springs()
+
+        # Initialise nodal global forces [Px, Py, Mz] (used for force-driven calcs)
+        n_nodes = self.element_number + 1
+        self._global_forces = np.zeros((n_nodes, 3), dtype=np.float64)
+        # Initialise nodal global displacement [Tx, Ty, Rz] (used for displacement-driven calcs)
+        self._global_disp = np.zeros((n_nodes, 3), dtype=np.float64)
+        # Initialise nodal global support [Tx, Ty, Rz] (used for defining boundary conditions)
+        self._global_restrained = np.zeros((n_nodes, 3), dtype=bool)
+
+    def _create_element_properties(self, element_coordinates: pd.DataFrame) -> dict:
+        # structural properties of the pile sections at each element of the mesh
+        # merge Pile.data and element coordinates
+        element_properties = pd.merge_asof(
+            left=element_coordinates.sort_values(by=["x_top [m]"]),
+            right=self.pile.data.sort_values(by=["Elevation [m]"]),
+            left_on="x_top [m]",
+            right_on="Elevation [m]",
+            direction="forward",
+        ).sort_values(by=["x_top [m]"], ascending=False)
+        # add young modulus to data
+        element_properties["E [kPa]"] = self.pile.E
+        # delete Elevation [m] column
+        element_properties.drop("Elevation [m]", inplace=True, axis=1)
+        # reset index
+        element_properties.reset_index(inplace=True, drop=True)
+        return _columns_to_arrays(element_properties)
+
+    def _create_soil_properties(self, element_coordinates: pd.DataFrame) -> dict:
+        # unit weight, depth and vertical stress at each element of the mesh
+        soil_properties = pd.merge_asof(
+            left=element_coordinates[["x_top [m]", "x_bottom [m]"]].sort_values(by=["x_top [m]"]),
+            right=self._soil_profile().sort_values(by=["Top soil layer [m]"]),
+            left_on="x_top [m]",
+            right_on="Top soil layer [m]",
+            direction="forward",
+        ).sort_values(by=["x_top [m]"], ascending=False)
+        # add elevation of element w.r.t. ground level
+        soil_properties["xg_top [m]"] = soil_properties["x_top [m]"] - self.soil.top_elevation
+        soil_properties["xg_bottom [m]"] = soil_properties["x_bottom [m]"] - self.soil.top_elevation
+        # add vertical stress at top and bottom of each element
+        condition_below_water_table = soil_properties["x_top [m]"] <= self.soil.water_line
+        soil_properties["Unit Weight [kN/m3]"][condition_below_water_table] = (
+            soil_properties["Unit Weight [kN/m3]"][condition_below_water_table] - 10.0
+        )
+        s = (soil_properties["x_top [m]"] - soil_properties["x_bottom [m]"]) * soil_properties[
+            "Unit Weight [kN/m3]"
+        ]
+        soil_properties["sigma_v top [kPa]"] = np.insert(
+            s.cumsum().values[:-1],
+            np.where(soil_properties["x_top [m]"].values == self.soil.top_elevation)[0],
+            0.0,
+        )
+        soil_properties["sigma_v bottom [kPa]"] = s.cumsum()
+        # reset index
+        soil_properties.reset_index(inplace=True, drop=True)
+        return _columns_to_arrays(soil_properties)
 
-            # #calculate vertical stress
-            # v_stress = [0.0,]
-            # for uw, top, bottom in zip(soil_weights, top_elevations, bottom_elevations):
-            #     v_stress.append(v_stress[-1] + uw*(top-bottom))
+    def _soil_profile(self) -> pd.DataFrame:
+        top_elevations = [x.top for x in self.soil.layers]
+        bottom_elevations = [x.bottom for x in self.soil.layers]
+        soil_weights = [x.weight for x in self.soil.layers]
 
-            # elevation in model w.r.t to x axis
-            x = top_elevations
+        idx_sort = np.argsort(top_elevations)[::-1]
 
-            return pd.DataFrame(
-                data={"Top soil layer [m]": x, "Unit Weight [kN/m3]": soil_weights},
-                dtype=np.float64,
-            )
+        top_elevations = [top_elevations[i] for i in idx_sort]
+        soil_weights = [soil_weights[i] for i in idx_sort]
+        bottom_elevations = [bottom_elevations[i] for i in idx_sort]
+
+        # #calculate vertical stress
+        # v_stress = [0.0,]
+        # for uw, top, bottom in zip(soil_weights, top_elevations, bottom_elevations):
+        #     v_stress.append(v_stress[-1] + uw*(top-bottom))
+
+        # elevation in model w.r.t to x axis
+        x = top_elevations
+
+        return pd.DataFrame(
+            data={"Top soil layer [m]": x, "Unit Weight [kN/m3]": soil_weights},
+            dtype=np.float64,
+        )
 
-        def create_springs() -> np.ndarray:
-            # dim of springs
-            spring_dim = 15
+    def _layer_elements(self, layer: Layer) -> np.ndarray:
+        # indices of the elements within a layer
+        soil = self._soil_properties
+        return np.flatnonzero(
+            (soil["x_top [m]"] <= layer.top) & (soil["x_bottom [m]"] >= layer.bottom)
+        )
+
+    def _create_springs(self, layers: Optional[List[int]] = None) -> tuple:
+        # springs of all elements, or copies of the springs of the model where only the springs
+        # of the given layers (indices in the soil profile) are created again
+        # dim of springs
+        spring_dim = 15
 
+        if layers is None:
             # Allocate array
             py = np.zeros(shape=(self.element_number, 2, 2, spring_dim), dtype=np.float32)
             mt = np.zeros(
@@ -1010,218 +1100,242 @@ class Model:
             Mb = np.zeros(shape=(1, 1, 2, spring_dim), dtype=np.float32)
 
             tz = np.zeros(shape=(self.element_number, 2, 2, 15), dtype=np.float32)
+        else:
+            # new arrays such that results computed from the previous springs are not reused
+            py, mt = self._py_springs.copy(), self._mt_springs.copy()
+            Hb, Mb = self._Hb_spring.copy(), self._Mb_spring.copy()
+            tz = self._tz_springs
+            # base springs are created by the layer(s) at the pile tip, all created again
+            # if one of them changes
+            tip_layers = {
+                i
+                for i, layer in enumerate(self.soil.layers)
+                if layer.top >= self.pile.bottom_elevation
+                and layer.bottom <= self.pile.bottom_elevation
+            }
+            if tip_layers.intersection(layers):
+                layers = tip_layers.union(layers)
+                Hb[:] = 0.0
+                Mb[:] = 0.0
+
+        # soil properties of all elements, (top, bottom) of each element
+        soil = self._soil_properties
+        sig_v_all = np.column_stack([soil["sigma_v top [kPa]"], soil["sigma_v bottom [kPa]"]])
+        elevation_all = np.column_stack([soil["x_top [m]"], soil["x_bottom [m]"]])
+        depth_from_ground_all = np.abs(np.column_stack([soil["xg_top [m]"], soil["xg_bottom [m]"]]))
+        pile_width_all = self._element_properties["Diameter [m]"].astype(float)
+
+        # fill in spring for each element
+        for i, layer in enumerate(self.soil.layers):
+            if layers is not None and i not in layers:
+                continue
+            elements_for_layer = self._layer_elements(layer)
+            py[elements_for_layer] = 0.0
+            mt[elements_for_layer] = 0.0
+
+            # py curve
+            if elements_for_layer.size == 0:
+                # layer below the pile tip
+                pass
+            elif layer.lateral_model is None:
+                pass
+            else:
+                # local layer parameters at top and bottom of each element of the layer
+                sig_v = sig_v_all[elements_for_layer]
+                elevation = elevation_all[elements_for_layer]
+                depth_from_ground = depth_from_ground_all[elements_for_layer]
+                pile_width = pile_width_all[elements_for_layer]
+
+                spring_parameters = dict(
+                    layer_height=(layer.top - layer.bottom),
+                    L=(self.soil.top_elevation - self.pile.bottom_elevation),
+                    output_length=spring_dim,
+                )
 
-            # fill in spring for each element
-            for layer in self.soil.layers:
-                elements_for_layer = self.soil_properties.loc[
-                    (self.soil_properties["x_top [m]"] <= layer.top)
-                    & (self.soil_properties["x_bottom [m]"] >= layer.bottom)
-                ].index
+                def layer_springs(name):
+                    # springs at top and bottom of all elements of the layer, created in one
+                    # call of the batch function of the lateral model if any, else point by point
+                    batch = getattr(layer.lateral_model, f"{name}_spring_batch", None)
+                    if batch is None:
+                        fct = getattr(layer.lateral_model, f"{name}_spring_fct")
+                        batch = partial(_springs_point_by_point, fct)
+                    return cache.springs(
+                        layer.lateral_model,
+                        name,
+                        dict(
+                            sig=sig_v.reshape(-1),
+                            X=depth_from_ground.reshape(-1),
+                            depth_from_top_of_layer=(layer.top - elevation).reshape(-1),
+                            D=np.repeat(pile_width, 2),
+                            below_water_table=(elevation <= self.soil.water_line).reshape(-1),
+                            **spring_parameters,
+                        ),
+                        batch,
+                    )
 
-                # py curve
-                if layer.lateral_model is None:
-                    pass
-                else:
-                    # Set local layer parameters for each element of the layer
-                    for i in elements_for_layer:
-                        # vertical effective stress
-                        sig_v = self.soil_properties[
-                            ["sigma_v top [kPa]", "sigma_v bottom [kPa]"]
-                        ].iloc[i]
-                        # elevation
-                        elevation = self.soil_properties[["x_top [m]", "x_bottom [m]"]].iloc[i]
-                        # depth from ground
-                        depth_from_ground = (
-                            self.soil_properties[["xg_top [m]", "xg_bottom [m]"]].iloc[i]
-                        ).abs()
-                        # pile width
-                        pile_width = self.element_properties["Diameter [m]"].iloc[i]
-
-                        # p-y curves
-                        if (
-                            layer.lateral_model.spring_signature[0] and self.distributed_lateral
-                        ):  # True if py spring function exist
-
-                            # calculate springs (top and) for each element
-                            for j in [0, 1]:
-                                (py[i, j, 1], py[i, j, 0]) = layer.lateral_model.py_spring_fct(
-                                    sig=sig_v[j],
-                                    X=depth_from_ground[j],
-                                    layer_height=(layer.top - layer.bottom),
-                                    depth_from_top_of_layer=(layer.top - elevation[j]),
-                                    D=pile_width,
-                                    L=(self.soil.top_elevation - self.pile.bottom_elevation),
-                                    below_water_table=elevation[j] <= self.soil.water_line,
-                                    output_length=spring_dim,
-                                )
+                # p-y curves
+                if (
+                    layer.lateral_model.spring_signature[0] and self.distributed_lateral
+                ):  # True if py spring function exist
+                    y, p = layer_springs("py")
+                    py[elements_for_layer, :, 1] = y.reshape(-1, 2, spring_dim)
+                    py[elements_for_layer, :, 0] = p.reshape(-1, 2, spring_dim)
 
-                        if (
-                            layer.lateral_model.spring_signature[2] and self.distributed_moment
-                        ):  # True if mt spring function exist
-
-                            # calculate springs (top and) for each element
-                            for j in [0, 1]:
-                                (mt[i, j, 1], mt[i, j, 0]) = layer.lateral_model.mt_spring_fct(
-                                    sig=sig_v[j],
-                                    X=depth_from_ground[j],
-                                    layer_height=(layer.top - layer.bottom),
-                                    depth_from_top_of_layer=(layer.top - elevation[j]),
-                                    D=pile_width,
-                                    L=(self.soil.top_elevation - self.pile.bottom_elevation),
-                                    below_water_table=elevation[j] <= self.soil.water_line,
-                                    output_length=spring_dim,
-                                )
+                # m-t curves
+                if (
+                    layer.lateral_model.spring_signature[2] and self.distributed_moment
+                ):  # True if mt spring function exist
+                    t, m = layer_springs("mt")
+                    mt[elements_for_layer, :, 1] = t.reshape(-1, 2, spring_dim, spring_dim)
+                    mt[elements_for_layer, :, 0] = m.reshape(-1, 2, spring_dim, spring_dim)
 
-                    # check if pile tip is within layer
-                    if (
-                        layer.top >= self.pile.bottom_elevation
-                        and layer.bottom <= self.pile.bottom_elevation
-                    ):
-
-                        # Hb curve
-                        sig_v_tip = self.soil_properties["sigma_v bottom [kPa]"].iloc[-1]
-
-                        if layer.lateral_model.spring_signature[1] and self.base_shear:
-
-                            # calculate Hb spring
-                            (Hb[0, 0, 1], Hb[0, 0, 0]) = layer.lateral_model.Hb_spring_fct(
-                                sig=sig_v_tip,
-                                X=(self.soil.top_elevation - self.soil.bottom_elevation),
-                                layer_height=(layer.top - layer.bottom),
-                                depth_from_top_of_layer=(layer.top - self.pile.bottom_elevation),
-                                D=pile_width,
-                                L=(self.soil.top_elevation - self.pile.bottom_elevation),
-                                below_water_table=self.pile.bottom_elevation
-                                <= self.soil.water_line,
-                                output_length=spring_dim,
-                            )
-
-                        # Mb curve
-                        if layer.lateral_model.spring_signature[3] and self.base_moment:
-
-                            (Mb[0, 0, 1], Mb[0, 0, 0]) = layer.lateral_model.Mb_spring_fct(
-                                sig=sig_v_tip,
-                                X=(self.soil.top_elevation - self.soil.bottom_elevation),
-                                layer_height=(layer.top - layer.bottom),
-                                depth_from_top_of_layer=(layer.top - self.pile.bottom_elevation),
-                                D=pile_width,
-                                L=(self.soil.top_elevation - self.pile.bottom_elevation),
-                                below_water_table=self.pile.bottom_elevation
-                                <= self.soil.water_line,
-                                output_length=spring_dim,
-                            )
-
-            if check_springs(py):
-                print("py springs have negative or NaN values.")
-                print(
-                    """if using PISA type springs, this can be due to parameters behind out of the parameter space.
-                Please check that: 2 < L/D < 6.
-                """
-                )
-            if check_springs(mt):
-                print("mt springs have negative or NaN values.")
-                print(
-                    """if using PISA type springs, this can be due to parameters behind out of the parameter space.
-                Please check that: 2 < L/D < 6.
-                """
-                )
-            if check_springs(Hb):
-                print("Hb spring has negative or NaN values.")
-                print(
-                    """if using PISA type springs, this can be due to parameters behind out of the parameter space.
-                Please check that: 2 < L/D < 6.
-                """
-                )
-            if check_springs(Mb):
-                print("Mb spring has negative or NaN values.")
-                print(
-                    """if using PISA type springs, this can be due to parameters behind out of the parameter space.
-                Please check that: 2 < L/D < 6.
-                """
-                )
-            return py, mt, Hb, Mb, tz
+                # check if pile tip is within layer
+                if (
+                    layer.top >= self.pile.bottom_elevation
+                    and layer.bottom <= self.pile.bottom_elevation
+                ):
 
-        # creates mesh coordinates
-        self.nodes_coordinates, self.element_coordinates = get_coordinates()
-        self.element_number = int(self.element_coordinates.shape[0])
+                    # Hb curve
+                    sig_v_tip = soil["sigma_v bottom [kPa]"][-1]
+                    pile_width_tip = pile_width_all[elements_for_layer[-1]]
+
+                    if layer.lateral_model.spring_signature[1] and self.base_shear:
+
+                        # calculate Hb spring
+                        (Hb[0, 0, 1], Hb[0, 0, 0]) = layer.lateral_model.Hb_spring_fct(
+                            sig=sig_v_tip,
+                            X=(self.soil.top_elevation - self.soil.bottom_elevation),
+                            layer_height=(layer.top - layer.bottom),
+                            depth_from_top_of_layer=(layer.top - self.pile.bottom_elevation),
+                            D=pile_width_tip,
+                            L=(self.soil.top_elevation - self.pile.bottom_elevation),
+                            below_water_table=self.pile.bottom_elevation <= self.soil.water_line,
+                            output_length=spring_dim,
+                        )
 
-        # creates element structural properties
-        # merge Pile.data and self.coordinates
-        self.element_properties = pd.merge_asof(
-            left=self.element_coordinates.sort_values(by=["x_top [m]"]),
-            right=self.pile.data.sort_values(by=["Elevation [m]"]),
-            left_on="x_top [m]",
-            right_on="Elevation [m]",
-            direction="forward",
-        ).sort_values(by=["x_top [m]"], ascending=False)
-        # add young modulus to data
-        self.element_properties["E [kPa]"] = self.pile.E
-        # delete Elevation [m] column
-        self.element_properties.drop("Elevation [m]", inplace=True, axis=1)
-        # reset index
-        self.element_properties.reset_index(inplace=True, drop=True)
+                    # Mb curve
+                    if layer.lateral_model.spring_signature[3] and self.base_moment:
+
+                        (Mb[0, 0, 1], Mb[0, 0, 0]) = layer.lateral_model.Mb_spring_fct(
+                            sig=sig_v_tip,
+                            X=(self.soil.top_elevation - self.soil.bottom_elevation),
+                            layer_height=(layer.top - layer.bottom),
+                            depth_from_top_of_layer=(layer.top - self.pile.bottom_elevation),
+                            D=pile_width_tip,
+                            L=(self.soil.top_elevation - self.pile.bottom_elevation),
+                            below_water_table=self.pile.bottom_elevation <= self.soil.water_line,
+                            output_length=spring_dim,
+                        )
 
-        # create soil properties
-        if self.soil is not None:
-            self.soil_properties = pd.merge_asof(
-                left=self.element_coordinates[["x_top [m]", "x_bottom [m]"]].sort_values(
-                    by=["x_top [m]"]
-                ),
-                right=get_soil_profile().sort_values(by=["Top soil layer [m]"]),
-                left_on="x_top [m]",
-                right_on="Top soil layer [m]",
-                direction="forward",
-            ).sort_values(by=["x_top [m]"], ascending=False)
-            # add elevation of element w.r.t. ground level
-            self.soil_properties["xg_top [m]"] = (
-                self.soil_properties["x_top [m]"] - self.soil.top_elevation
+        if _check_springs(py):
+            print("py springs have negative or NaN values.")
+            print(
+                """if using PISA type springs, this can be due to parameters behind out of the parameter space.
+            Please check that: 2 < L/D < 6.
+            """
             )
-            self.soil_properties["xg_bottom [m]"] = (
-                self.soil_properties["x_bottom [m]"] - self.soil.top_elevation
+        if _check_springs(mt):
+            print("mt springs have negative or NaN values.")
+            print(
+                """if using PISA type springs, this can be due to parameters behind out of the parameter space.
+            Please check that: 2 < L/D < 6.
+            """
             )
-            # add vertical stress at top and bottom of each element
-            condition_below_water_table = self.soil_properties["x_top [m]"] <= self.soil.water_line
-            self.soil_properties["Unit Weight [kN/m3]"][condition_below_water_table] = (
-                self.soil_properties["Unit Weight [kN/m3]"][condition_below_water_table] - 10.0
+        if _check_springs(Hb):
+            print("Hb spring has negative or NaN values.")
+            print(
+                """if using PISA type springs, this can be due to parameters behind out of the parameter space.
+            Please check that: 2 < L/D < 6.
+            """
             )
-            s = (
-                self.soil_properties["x_top [m]"] - self.soil_properties["x_bottom [m]"]
-            ) * self.soil_properties["Unit Weight [kN/m3]"]
-            self.soil_properties["sigma_v top [kPa]"] = np.insert(
-                s.cumsum().values[:-1],
-                np.where(self.soil_properties["x_top [m]"].values == self.soil.top_elevation)[0],
-                0.0,
+        if _check_springs(Mb):
+            print("Mb spring has negative or NaN values.")
+            print(
+                """if using PISA type springs, this can be due to parameters behind out of the parameter space.
+            Please check that: 2 < L/D < 6.
+            """
             )
-            self.soil_properties["sigma_v bottom [kPa]"] = s.cumsum()
-            # reset index
-            self.soil_properties.reset_index(inplace=True, drop=True)
+        return py, mt, Hb, Mb, tz
 
-            # Create arrays of springs
-            (
-                self._py_springs,
-                self._mt_springs,
-                self._Hb_spring,
-                self._Mb_spring,
-                self._tz_springs,
-            ) = create_springs()
-
-        # Initialise nodal global forces with link to nodes_coordinates (used for force-driven calcs)
-        self.global_forces = self.nodes_coordinates.copy()
-        self.global_forces["Px [kN]"] = 0
-        self.global_forces["Py [kN]"] = 0
-        self.global_forces["Mz [kNm]"] = 0
-
-        # Initialise nodal global displacement with link to nodes_coordinates (used for displacement-driven calcs)
-        self.global_disp = self.nodes_coordinates.copy()
-        self.global_disp["Tx [m]"] = 0
-        self.global_disp["Ty [m]"] = 0
-        self.global_disp["Rz [rad]"] = 0
-
-        # Initialise nodal global support with link to nodes_coordinates (used for defining boundary conditions)
-        self.global_restrained = self.nodes_coordinates.copy()
-        self.global_restrained["Tx"] = False
-        self.global_restrained["Ty"] = False
-        self.global_restrained["Rz"] = False
+    def _nodes_table(self, columns, values) -> pd.DataFrame:
+        # table of nodal values with the coordinates of the nodes
+        df = self.nodes_coordinates
+        for i, column in enumerate(columns):
+            df[column] = values[:, i]
+        return df
+
+    @property
+    def nodes_coordinates(self) -> pd.DataFrame:
+        """Table with the coordinates of the nodes of the mesh.
+
+        The table is created on each call from the arrays of the model,
+        modifying it does not modify the model.
+        """
+        df = pd.DataFrame(self._nodes_coordinates, copy=True)
+        df.index.name = "Node no."
+        return df
+
+    @property
+    def element_coordinates(self) -> pd.DataFrame:
+        """Table with the coordinates of the top and bottom nodes of each element.
+
+        The table is created on each call from the arrays of the model,
+        modifying it does not modify the model.
+        """
+        df = pd.DataFrame(
+            {
+                key: self._element_properties[key]
+                for key in ["x_top [m]", "x_bottom [m]", "y_top [m]", "y_bottom [m]"]
+            },
+            copy=True,
+        )
+        df.index.name = "Element no."
+        return df
+
+    @property
+    def element_properties(self) -> pd.DataFrame:
+        """Table with the coordinates and structural properties of each element.
+
+        The table is created on each call from the arrays of the model,
+        modifying it does not modify the model.
+        """
+        return pd.DataFrame(self._element_properties, copy=True)
+
+    @property
+    def soil_properties(self) -> pd.DataFrame:
+        """Table with the soil properties of each element.
+
+        The table is created on each call from the arrays of the model,
+        modifying it does not modify the model.
+        """
+        return pd.DataFrame(self._soil_properties, copy=True)
+
+    @property
+    def global_forces(self) -> pd.DataFrame:
+        """Table with the point loads applied at each node, see `Model.set_pointload()`.
+
+        The table is created on each call from the arrays of the model,
+        modifying it does not modify the model.
+        """
+        return self._nodes_table(["Px [kN]", "Py [kN]", "Mz [kNm]"], self._global_forces)
+
+    @property
+    def global_disp(self) -> pd.DataFrame:
+        """Table with the displacements prescribed at each node, see `Model.set_pointdisplacement()`.
+
+        The table is created on each call from the arrays of the model,
+        modifying it does not modify the model.
+        """
+        return self._nodes_table(["Tx [m]", "Ty [m]", "Rz [rad]"], self._global_disp)
+
+    @property
+    def global_restrained(self) -> pd.DataFrame:
+        """Table with the restrained degrees of freedom of each node, see `Model.set_support()`.
+
+        The table is created on each call from the arrays of the model,
+        modifying it does not modify the model.
+        """
+        return self._nodes_table(["Tx", "Ty", "Rz"], self._global_restrained)
 
     @property
     def embedment(self) -> float:
@@ -1338,7 +1452,7 @@ class Model:
         """
 
         # identify if one node is at given elevation or if load needs to be split
-        nodes_elevations = self.nodes_coordinates["x [m]"].values
+        nodes_elevations = self._nodes_coordinates["x [m]"]
         # check if corresponding node exist
         check = np.isclose(nodes_elevations, np.tile(elevation, nodes_elevations.shape), atol=0.001)
 
@@ -1348,16 +1462,13 @@ class Model:
                 node_idx = int(np.where(check == True)[0])
                 # apply loads at this node
                 if Px is not None:
-                    self.global_forces.loc[node_idx, "Px [kN]"] = Px
+                    self._global_forces[node_idx, 0] = Px
                 if Py is not None:
-                    self.global_forces.loc[node_idx, "Py [kN]"] = Py
+                    self._global_forces[node_idx, 1] = Py
                 if Mz is not None:
-                    self.global_forces.loc[node_idx, "Mz [kNm]"] = Mz
+                    self._global_forces[node_idx, 2] = Mz
             else:
-                if (
-                    elevation > self.nodes_coordinates["x [m]"].iloc[0]
-                    or elevation < self.nodes_coordinates["x [m]"].iloc[-1]
-                ):
+                if elevation > nodes_elevations[0] or elevation < nodes_elevations[-1]:
                     print(
                         "Load not applied! The chosen elevation is outside the mesh. The load must be applied on the structure."
                     )
@@ -1396,7 +1507,7 @@ class Model:
 
         try:
             # identify if one node is at given elevation or if load needs to be split
-            nodes_elevations = self.nodes_coordinates["x [m]"].values
+            nodes_elevations = self._nodes_coordinates["x [m]"]
             # check if corresponding node exist
             check = np.isclose(
                 nodes_elevations, np.tile(elevation, nodes_elevations.shape), atol=0.001
@@ -1407,21 +1518,18 @@ class Model:
                 node_idx = int(np.where(check == True)[0])
                 # apply displacements at this node
                 if Tx is not None:
-                    self.global_disp.loc[node_idx, "Tx [m]"] = Tx
-                    self.global_restrained.loc[node_idx, "Tx"] = Tx > 0.0
+                    self._global_disp[node_idx, 0] = Tx
+                    self._global_restrained[node_idx, 0] = Tx > 0.0
                 if Ty is not None:
-                    self.global_disp.loc[node_idx, "Ty [m]"] = Ty
-                    self.global_restrained.loc[node_idx, "Ty"] = Ty > 0.0
+                    self._global_disp[node_idx, 1] = Ty
+                    self._global_restrained[node_idx, 1] = Ty > 0.0
                 if Rz is not None:
-                    self.global_disp.loc[node_idx, "Rz [rad]"] = Rz
-                    self.global_restrained.loc[node_idx, "Rz"] = Rz > 0.0
+                    self._global_disp[node_idx, 2] = Rz
+                    self._global_restrained[node_idx, 2] = Rz > 0.0
                 # set restrain at this node
 
             else:
-                if (
-                    elevation > self.nodes_coordinates["x [m]"].iloc[0]
-                    or elevation < self.nodes_coordinates["x [m]"].iloc[-1]
-                ):
+                if elevation > nodes_elevations[0] or elevation < nodes_elevations[-1]:
                     print(
                         "Support not applied! The chosen elevation is outside the mesh. The support must be applied on the structure."
                     )
@@ -1461,7 +1569,7 @@ class Model:
 
         try:
             # identify if one node is at given elevation or if load needs to be split
-            nodes_elevations = self.nodes_coordinates["x [m]"].values
+            nodes_elevations = self._nodes_coordinates["x [m]"]
             # check if corresponding node exist
             check = np.isclose(
                 nodes_elevations, np.tile(elevation, nodes_elevations.shape), atol=0.001
@@ -1471,14 +1579,11 @@ class Model:
                 # one node correspond, extract node
                 node_idx = int(np.where(check == True)[0])
                 # apply loads at this node
-                self.global_restrained.loc[node_idx, "Tx"] = Tx
-                self.global_restrained.loc[node_idx, "Ty"] = Ty
-                self.global_restrained.loc[node_idx, "Rz"] = Rz
+                self._global_restrained[node_idx, 0] = Tx
+                self._global_restrained[node_idx, 1] = Ty
+                self._global_restrained[node_idx, 2] = Rz
             else:
-                if (
-                    elevation > self.nodes_coordinates["x [m]"].iloc[0]
-                    or elevation < self.nodes_coordinates["x [m]"].iloc[-1]
-                ):
+                if elevation > nodes_elevations[0] or elevation < nodes_elevations[-1]:
                     print(
                         "Support not applied! The chosen elevation is outside the mesh. The support must be applied on the structure."
                     )
@@ -1490,6 +1595,277 @@ class Model:
             print("\n!User Input Error! Please create Model first with the Model.create().\n")
             raise
 
+    def _layer_index(self, layer: Union[int, str]) -> int:
+        # index of a layer of the soil profile given by its index or name
+        if self.soil is None:
+            raise ValueError("The model has no soil profile.")
+        names = [x.name for x in self.soil.layers]
+        if isinstance(layer, str):
+            if layer not in names:
+                raise ValueError(
+                    f"No layer named '{layer}' in the soil profile, layers are {names}."
+                )
+            return names.index(layer)
+        if not -len(names) <= layer < len(names):
+            raise ValueError(
+                f"Layer index {layer} out of range, the soil profile has {len(names)} layers."
+            )
+        return layer % len(names)
+
+    def _update(self, pile: Optional[Pile] = None, layers: Optional[Dict[int, Layer]] = None):
+        # replaces the pile and/or layers of the model and creates again the element properties,
+        # soil properties and springs that change, the mesh, loads and supports are kept.
+        # New arrays are assigned such that cached element invariants and springs maxima
+        # are refreshed.
+        changed_layers = set()
+        previous_width = self._element_properties["Diameter [m]"]
+
+        if pile is not None:
+            self.pile = pile
+            self._element_properties = self._create_element_properties(self.element_coordinates)
+
+        if self.soil is None:
+            return
+
+        previous_soil = self._soil_properties
+        if layers:
+            new_layers = list(self.soil.layers)
+            weight_changed = False
+            for i, layer in layers.items():
+                weight_changed |= layer.weight != new_layers[i].weight
+                if layer.lateral_model is not new_layers[i].lateral_model:
+                    changed_layers.add(i)
+                new_layers[i] = layer
+            self.soil = replace(self.soil, layers=new_layers)
+            if weight_changed:
+                # vertical stress changes in and below the layers
+                self._soil_properties = self._create_soil_properties(self.element_coordinates)
+
+        # springs depend on the pile width and vertical stress
+        changed_elements = (
+            (self._element_properties["Diameter [m]"] != previous_width)
+            | (self._soil_properties["sigma_v top [kPa]"] != previous_soil["sigma_v top [kPa]"])
+            | (
+                self._soil_properties["sigma_v bottom [kPa]"]
+                != previous_soil["sigma_v bottom [kPa]"]
+            )
+        )
+        for i, layer in enumerate(self.soil.layers):
+            if changed_elements[self._layer_elements(layer)].any():
+                changed_layers.add(i)
+
+        if changed_layers:
+            (
+                self._py_springs,
+                self._mt_springs,
+                self._Hb_spring,
+                self._Mb_spring,
+                self._tz_springs,
+            ) = self._create_springs(layers=changed_layers)
+
+    def _refined(self, elements) -> "Model":
+        # copy of the model where the given elements are split in two, loads, displacements
+        # and supports are transferred to the nodes of the new mesh and springs are only created
+        # again for the layers with split elements.
+        split = np.zeros(self.element_number, dtype=bool)
+        split[elements] = True
+        repeats = np.where(split, 2, 1)
+
+        x = self._nodes_coordinates["x [m]"]
+        midpoints = 0.5 * (x[:-1] + x[1:])[split]
+        new_x = np.sort(np.concatenate((x, midpoints)))[::-1]
+        old_nodes = np.searchsorted(-new_x, -x)
+
+        model = copy.copy(self)
+        model.x2mesh = list(self.x2mesh) + midpoints.tolist()
+        model.element_number = len(new_x) - 1
+        model._nodes_coordinates = {"x [m]": new_x, "y [m]": np.zeros(new_x.shape)}
+
+        properties = {k: np.repeat(v, repeats) for k, v in self._element_properties.items()}
+        properties["x_top [m]"] = np.ascontiguousarray(new_x[:-1])
+        properties["x_bottom [m]"] = np.ascontiguousarray(new_x[1:])
+        model._element_properties = properties
+
+        for name in ["_global_forces", "_global_disp", "_global_restrained"]:
+            values = getattr(self, name)
+            new_values = np.zeros((len(new_x), 3), dtype=values.dtype)
+            new_values[old_nodes] = values
+            setattr(model, name, new_values)
+
+        if self.soil is not None:
+            model._soil_properties = model._create_soil_properties(model.element_coordinates)
+            model._py_springs = np.repeat(self._py_springs, repeats, axis=0)
+            model._mt_springs = np.repeat(self._mt_springs, repeats, axis=0)
+            model._tz_springs = np.repeat(self._tz_springs, repeats, axis=0)
+            layers = {
+                i
+                for i, layer in enumerate(self.soil.layers)
+                if split[self._layer_elements(layer)].any()
+            }
+            if layers:
+                (
+                    model._py_springs,
+                    model._mt_springs,
+                    model._Hb_spring,
+                    model._Mb_spring,
+                    model._tz_springs,
+                ) = model._create_springs(layers=layers)
+
+        return model
+
+    def update_layer(self, layer: Union[int, str], **parameters) -> None:
+        """Updates parameters of a layer of the soil profile without creating the model again.
+
+        Only the springs of the layers that are affected by the change are created again,
+        i.e. the updated layer and, if its unit weight changes, the layers below.
+        The mesh, point loads, displacements and supports of the model are kept.
+        The soil profile of the model is replaced by an updated copy, the soil profile
+        given when creating the model is not modified.
+
+        Parameters
+        ----------
+        layer : int or str
+            index or name of the layer in the soil profile.
+        **parameters
+            new values of the attributes of the layer, i.e. `name`, `weight`, `lateral_model`,
+            `axial_model` or `color`, or of the parameters of its lateral model, e.g. `phi=32.0`
+            for a layer with an `openpile.soilmodels.API_sand` model.
+
+        Raises
+        ------
+        ValueError
+            if the layer does not exist, if the top or bottom elevation of the layer is changed
+            (the mesh would change, a new model must be created) or if a parameter is neither
+            an attribute of the layer nor of its lateral model.
+
+        Example
+        -------
+
+        >>> M.update_layer("Layer0", weight=19.0, phi=32.0)  # doctest: +SKIP
+        """
+        i = self._layer_index(layer)
+        old = self.soil.layers[i]
+
+        if "top" in parameters or "bottom" in parameters:
+            raise ValueError(
+                "The elevations of a layer define the mesh and cannot be updated, "
+                "please create a new model."
+            )
+
+        layer_fields = {"name", "weight", "lateral_model", "axial_model", "color"}
+        layer_parameters = {k: v for k, v in parameters.items() if k in layer_fields}
+        model_parameters = {k: v for k, v in parameters.items() if k not in layer_fields}
+
+        if model_parameters:
+            lateral_model = layer_parameters.get("lateral_model", old.lateral_model)
+            unknown = (
+                set(model_parameters)
+                if lateral_model is None
+                else set(model_parameters).difference(lateral_model.__dataclass_fields__)
+            )
+            if unknown:
+                raise ValueError(
+                    f"Parameters {sorted(unknown)} are neither attributes of layer '{old.name}' "
+                    f"nor parameters of its lateral model."
+                )
+            layer_parameters["lateral_model"] = replace(lateral_model, **model_parameters)
+
+        self._update(layers={i: replace(old, **layer_parameters)})
+
+    def update_multipliers(self, layer: Optional[Union[int, str]] = None, **multipliers) -> None:
+        """Updates the multipliers of the lateral model of one or all layers without creating
+        the model again, see :py:meth:`openpile.construct.Model.update_layer`.
+
+        Parameters
+        ----------
+        layer : int or str, optional
+            index or name of the layer in the soil profile,
+            by default all layers with a lateral model.
+        **multipliers
+            new values of the multipliers, e.g. `p_multiplier=0.8`,
+            floats or functions of the depth.
+
+        Raises
+        ------
+        ValueError
+            if a keyword argument is not a multiplier or not a parameter of the lateral model.
+
+        Example
+        -------
+
+        >>> M.update_multipliers(p_multiplier=0.8, y_multiplier=1.2)  # doctest: +SKIP
+        """
+        not_multipliers = [k for k in multipliers if not k.endswith("_multiplier")]
+        if not_multipliers:
+            raise ValueError(f"{not_multipliers} are not multipliers.")
+
+        if layer is None:
+            if self.soil is None:
+                raise ValueError("The model has no soil profile.")
+            indices = [i for i, x in enumerate(self.soil.layers) if x.lateral_model is not None]
+        else:
+            indices = [self._layer_index(layer)]
+
+        layers = {}
+        for i in indices:
+            old = self.soil.layers[i]
+            unknown = set(multipliers).difference(
+                [] if old.lateral_model is None else old.lateral_model.__dataclass_fields__
+            )
+            if unknown:
+                raise ValueError(
+                    f"Multipliers {sorted(unknown)} are not parameters of the lateral model "
+                    f"of layer '{old.name}'."
+                )
+            layers[i] = replace(old, lateral_model=replace(old.lateral_model, **multipliers))
+
+        self._update(layers=layers)
+
+    def update_pile_sections(
+        self,
+        diameter: Optional[Union[float, List[float]]] = None,
+        wall_thickness: Optional[Union[float, List[float]]] = None,
+    ) -> None:
+        """Updates the diameter and/or wall thickness of the pile sections without creating
+        the model again.
+
+        The structural properties of the elements are computed again from the new sections.
+        Springs are only created again for the layers where the diameter of the pile changes.
+        The mesh, point loads, displacements and supports of the model are kept.
+        The pile of the model is replaced by an updated copy (with the same Young modulus),
+        the pile given when creating the model is not modified.
+
+        Parameters
+        ----------
+        diameter : float or list of floats, optional
+            new diameter of all sections or of each section [m], by default unchanged.
+        wall_thickness : float or list of floats, optional
+            new wall thickness of all sections or of each section [m], by default unchanged.
+
+        Raises
+        ------
+        ValueError
+            if the number of values does not match the number of pile sections.
+
+        Example
+        -------
+
+        >>> M.update_pile_sections(wall_thickness=[0.07, 0.09])  # doctest: +SKIP
+        """
+        sections = dict(self.pile.pile_sections)
+        n = len(sections["length"])
+        for key, value in [("diameter", diameter), ("wall thickness", wall_thickness)]:
+            if value is None:
+                continue
+            values = [value] * n if isinstance(value, (int, float)) else list(value)
+            if len(values) != n:
+                raise ValueError(f"{len(values)} values of {key} given for {n} pile sections.")
+            sections[key] = values
+
+        pile = replace(self.pile, pile_sections=sections)
+        pile.E = self.pile.E
+        self._update(pile=pile)
+
     def get_py_springs(self, kind: str = "node") -> pd.DataFrame:
         """Table with p-y springs computed for the given Model.
 
@@ -8,10 +8,15 @@
 """
 # general utilities for openfile
 
+from dataclasses import dataclass
+
 import numpy as np
 import pandas as pd
 from numba import njit, prange, f4, f8, b1, char
 import numba as nb
+from scipy import sparse
+from scipy.sparse.linalg import splu
+from scipy.linalg import cholesky_banded, cho_solve_banded, lu_factor, lu_solve
 from typing_extensions import Literal
 
 from openpile.construct import Model, Pile
@@ -136,6 +141,11 @@ def solve_equations(K, F, U, restraints):
     
     """
 
+    if sparse.issparse(K):
+        return solve_sparse_equations(K, F, U, restraints)
+    elif K.shape[0] != K.shape[1]:
+        return solve_banded_equations(K, F, U, restraints)
+
     if restraints.any():
         prescribed_dof_true = np.where(restraints)[0]
         prescribed_dof_false = np.where(~restraints)[0]
@@ -156,18 +166,290 @@ def solve_equations(K, F, U, restraints):
     return U, Q
 
 
+def solve_sparse_equations(K, F, U, restraints):
+    """function that solves the system of equations with a sparse global stiffness matrix.
+
+    Same as :py:func:`openpile.core.kernel.solve_equations` but the reduction of the restrained
+    dofs and the solve are performed on a `scipy.sparse` matrix, i.e. without densifying it.
+
+    Parameters
+    ----------
+    K : scipy.sparse matrix of dim (ndof, ndof)
+        Global stiffness matrix with all dofs in unit:1/kPa.
+    F : float numpy array of dim (ndof, 1)
+        External force vetor (can also be denoted as load vector) in unit:kN.
+    U : float numpy array of dim (ndof, 1)
+        Prescribed displacement vector in unit:m.
+    restraints: boolean numpy array of dim (ndof, 1)
+        External vector of restrained dof.
+
+    Returns
+    -------
+    U : float numpy array of dim (ndof, 1)
+        Global displacement vector in unit:m.
+    Q : float numpy array of dim (ndof, 1)
+        Global reaction force vector in unit:kN
+    """
+    return FactorizedStiffness(K, restraints).solve(F, U)
+
+
+@njit(cache=True)
+def banded_dot(ab, x):
+    """matrix-vector product of a matrix in general banded storage with a vector."""
+    bw = ab.shape[0] // 2
+    n = ab.shape[1]
+    y = np.zeros(n, dtype=np.float64)
+    for j in range(n):
+        for i in range(max(0, j - bw), min(n, j + bw + 1)):
+            y[i] += ab[bw + i - j, j] * x[j]
+    return y
+
+
+@njit(cache=True)
+def jit_restrain_banded(ab, restrained):
+    """replaces rows and columns of restrained dofs by identity in a banded matrix (inplace)."""
+    bw = ab.shape[0] // 2
+    n = ab.shape[1]
+    for r in restrained:
+        for k in range(max(0, r - bw), min(n, r + bw + 1)):
+            # column r
+            ab[bw + k - r, r] = 0.0
+            # row r
+            ab[bw + r - k, k] = 0.0
+        ab[bw, r] = 1.0
+
+
+def stiffness_dot(K, u):
+    """product of a global stiffness matrix (dense, banded or sparse storage) with a vector.
+
+    Parameters
+    ----------
+    K : numpy array or scipy.sparse matrix
+        Global stiffness matrix in dense, banded or sparse storage.
+    u : numpy array of dim (ndof,)
+        Global vector
+
+    Returns
+    -------
+    numpy array of dim (ndof,)
+    """
+    if not sparse.issparse(K) and K.shape[0] != K.shape[1]:
+        return banded_dot(K, np.ascontiguousarray(u, dtype=np.float64))
+    else:
+        return K.dot(u)
+
+
+def solve_banded_equations(K, F, U, restraints):
+    """function that solves the system of equations with a banded global stiffness matrix.
+
+    Same as :py:func:`openpile.core.kernel.solve_equations` but for the global stiffness matrix
+    stored in LAPACK general banded storage, see :py:func:`openpile.core.kernel.build_stiffness_matrix`.
+
+    The restrained dofs are not removed from the system but their rows and columns are replaced by
+    the identity so that the band structure is kept, the prescribed displacements being moved to
+    the right-hand side. The system being symmetric, a banded Cholesky decomposition is first
+    attempted and a banded LU decomposition is used if the matrix is not positive definite.
+    The cost of the solve is thus linear with the number of dofs.
+
+    Parameters
+    ----------
+    K : float numpy array of dim (11, ndof)
+        Global stiffness matrix in banded storage with all dofs in unit:1/kPa.
+    F : float numpy array of dim (ndof, 1)
+        External force vetor (can also be denoted as load vector) in unit:kN.
+    U : float numpy array of dim (ndof, 1)
+        Prescribed displacement vector in unit:m.
+    restraints: boolean numpy array of dim (ndof, 1)
+        External vector of restrained dof.
+
+    Returns
+    -------
+    U : float numpy array of dim (ndof, 1)
+        Global displacement vector in unit:m.
+    Q : float numpy array of dim (ndof, 1)
+        Global reaction force vector in unit:kN
+    """
+    return FactorizedStiffness(K, restraints).solve(F, U)
+
+
+class FactorizedStiffness:
+    """Factorization of a global stiffness matrix with restrained dofs.
+
+    The factorization is computed once when the object is created and can be reused
+    for any number of solves (i.e. back-substitutions) with different force vectors
+    and prescribed displacements, as long as the stiffness matrix and the
+    restrained dofs remain the same.
+
+    Parameters
+    ----------
+    K : numpy array or scipy.sparse matrix
+        Global stiffness matrix in dense, banded or sparse storage,
+        see :py:func:`openpile.core.kernel.build_stiffness_matrix`.
+    restraints: boolean numpy array of dim (ndof, 1)
+        External vector of restrained dof.
+
+    Raises
+    ------
+    numpy.linalg.LinAlgError
+        if the reduced stiffness matrix is singular
+    """
+
+    def __init__(self, K, restraints):
+        self.K = K
+        self.restraints = np.asarray(restraints, dtype=bool)
+
+        self._prescribed_dof_true = np.where(self.restraints)[0]
+        self._prescribed_dof_false = np.where(~self.restraints)[0]
+
+        if sparse.issparse(K):
+            self.storage = "sparse"
+            self.K = sparse.csr_matrix(K)
+            K_free = self.K[self._prescribed_dof_false]
+            self._K_free_restrained = K_free[:, self._prescribed_dof_true]
+            self._factor = self._splu(K_free[:, self._prescribed_dof_false].tocsc())
+        elif K.shape[0] != K.shape[1]:
+            self.storage = "banded"
+            bw = K.shape[0] // 2
+            # restrained rows and columns are replaced by identity to keep the band
+            Kred = K.copy()
+            jit_restrain_banded(Kred, self._prescribed_dof_true)
+            try:
+                self._factor = cholesky_banded(Kred[: bw + 1], check_finite=False)
+                self._cholesky = True
+            except np.linalg.LinAlgError:
+                # matrix not positive definite, LU decomposition instead
+                offsets = np.arange(bw, -bw - 1, -1)
+                self._factor = self._splu(
+                    sparse.dia_matrix((Kred, offsets), shape=(K.shape[1], K.shape[1])).tocsc()
+                )
+                self._cholesky = False
+        else:
+            self.storage = "dense"
+            Kred = K[np.ix_(self._prescribed_dof_false, self._prescribed_dof_false)]
+            self._K_free_restrained = K[
+                np.ix_(self._prescribed_dof_false, self._prescribed_dof_true)
+            ]
+            if not np.all(np.isfinite(Kred)):
+                raise np.linalg.LinAlgError("Stiffness matrix is not finite")
+            self._factor = lu_factor(Kred, check_finite=False)
+
+    @staticmethod
+    def _splu(K):
+        try:
+            return splu(K)
+        except RuntimeError as e:
+            # superLU raises a RuntimeError if the matrix is singular
+            raise np.linalg.LinAlgError(str(e))
+
+    def solve(self, F, U):
+        """solves the system of equations with the factorized stiffness matrix.
+
+        Parameters
+        ----------
+        F : float numpy array of dim (ndof, 1)
+            External force vetor (can also be denoted as load vector) in unit:kN.
+        U : float numpy array of dim (ndof, 1)
+            Prescribed displacement vector in unit:m.
+
+        Returns
+        -------
+        U : float numpy array of dim (ndof, 1)
+            Global displacement vector in unit:m.
+        Q : float numpy array of dim (ndof, 1)
+            Global reaction force vector in unit:kN
+        """
+        true = self._prescribed_dof_true
+        false = self._prescribed_dof_false
+
+        if self.storage == "banded":
+            # move prescribed displacements to the right-hand side
+            U_prescribed = np.where(self.restraints, U, 0.0)
+            Fred = F - banded_dot(self.K, U_prescribed)
+            Fred[true] = U_prescribed[true]
+            if self._cholesky:
+                U = cho_solve_banded((self._factor, False), Fred, check_finite=False)
+            else:
+                U = self._factor.solve(Fred)
+        else:
+            U = np.array(U, dtype=np.float64)
+            Fred = F[false] - self._K_free_restrained.dot(U[true])
+            if self.storage == "sparse":
+                U[false] = self._factor.solve(Fred)
+            else:
+                U[false] = lu_solve(self._factor, Fred, check_finite=False)
+
+        if not np.all(np.isfinite(U)):
+            raise np.linalg.LinAlgError("Singular matrix")
+
+        Q = stiffness_dot(self.K, U) - F
+
+        return U, Q
+
+
+def condense_stiffness(K, restraints, dofs):
+    r"""statically condenses a global stiffness matrix to a set of retained dofs.
+
+    The condensed stiffness matrix is the Schur complement of the stiffness matrix of the other
+    free dofs, the restrained dofs being kept fixed:
+
+    .. math::
+
+        K_c = K_{rr} - K_{ri} K_{ii}^{-1} K_{ir}
+
+    It is obtained with one factorization of the global stiffness matrix, where the retained dofs
+    are restrained, and one back-substitution per retained dof: the reaction forces at the retained
+    dofs for a unit displacement of one of them give a column of the condensed stiffness matrix.
+
+    Parameters
+    ----------
+    K : numpy array or scipy.sparse matrix
+        Global stiffness matrix in dense, banded or sparse storage,
+        see :py:func:`openpile.core.kernel.build_stiffness_matrix`.
+    restraints: boolean numpy array of dim (ndof, 1)
+        External vector of restrained dof.
+    dofs: integer numpy array of dim (n,)
+        indices of the retained dofs, restrained or not.
+
+    Returns
+    -------
+    K_c : numpy array of dim (n, n)
+        condensed stiffness matrix.
+
+    Raises
+    ------
+    numpy.linalg.LinAlgError
+        if the stiffness matrix of the condensed dofs is singular
+    """
+    dofs = np.asarray(dofs, dtype=np.int64)
+    restraints = np.array(restraints, dtype=bool)
+    restraints[dofs] = True
+
+    factorized = FactorizedStiffness(K, restraints)
+
+    F = np.zeros(restraints.shape, dtype=np.float64)
+    K_c = np.zeros((len(dofs), len(dofs)), dtype=np.float64)
+    for j, dof in enumerate(dofs):
+        U = np.zeros(restraints.shape, dtype=np.float64)
+        U[dof] = 1.0
+        _, Q = factorized.solve(F, U)
+        K_c[:, j] = Q[dofs]
+
+    # remove the asymmetry due to round-off errors
+    return 0.5 * (K_c + K_c.T)
+
+
 def mesh_to_element_length(model) -> np.ndarray:
     # elememt coordinates along z and y-axes
     ez = np.array(
         [
-            model.element_properties["x_top [m]"].to_numpy(dtype=float),
-            model.element_properties["x_bottom [m]"].to_numpy(dtype=float),
+            np.asarray(model._element_properties["x_top [m]"], dtype=float),
+            np.asarray(model._element_properties["x_bottom [m]"], dtype=float),
         ]
     )
     ey = np.array(
         [
-            model.element_properties["y_top [m]"].to_numpy(dtype=float),
-            model.element_properties["y_bottom [m]"].to_numpy(dtype=float),
+            np.asarray(model._element_properties["y_top [m]"], dtype=float),
+            np.asarray(model._element_properties["y_bottom [m]"], dtype=float),
         ]
     )
     # length calcuated via pythagorus theorem
@@ -176,58 +458,119 @@ def mesh_to_element_length(model) -> np.ndarray:
     return L
 
 
-def elem_mechanical_stiffness_matrix(model):
-    """creates pile element stiffness matrix based on model info and element number
+def timoshenko_shear_coefficient(d, wt, nu):
+    """Timoshenko shear coefficient of a circular hollow section.
 
     Parameters
     ----------
-    model : openpile class object `openpile.construct.Model`
-        includes information on soil/structure, elements, nodes and other model-related data.
+    d : np.ndarray
+        outer diameter
+    wt : np.ndarray
+        wall thickness
+    nu : float
+        Poisson's ratio
 
     Returns
     -------
-    k: numpy array (3d)
-        element stiffness matrix of all elememts related to the mechanical properties of the structure
+    kappa: np.ndarray
+        shear coefficient
+    """
+    a = 0.5 * d
+    b = 0.5 * (d - 2 * wt)
+    nom = 6 * (a**2 + b**2) ** 2 * (1 + nu) ** 2
+    denom = (
+        7 * a**4
+        + 34 * a**2 * b**2
+        + 7 * b**4
+        + nu * (12 * a**4 + 48 * a**2 * b**2 + 12 * b**4)
+        + nu**2 * (4 * a**4 + 16 * a**2 * b**2 + 4 * b**4)
+    )
+    return nom / denom
+
+
+@dataclass
+class ElementInvariants:
+    """Element quantities of a model that do not change during an analysis.
+
+    All arrays are contiguous and of shape (n_elem, 1, 1) or (n_elem, 6, 6).
+
+    Attributes
+    ----------
+    key : tuple
+        element properties, pile, element type and Poisson's ratio the invariants are computed with
+    L : np.ndarray
+        element lengths
+    kappa : np.ndarray
+        Timoshenko shear coefficient (0 for Euler-Bernoulli elements)
+    k_mechanical : np.ndarray
+        element stiffness matrices related to the mechanical properties of the structure
+    k_geometric : np.ndarray
+        consistent element matrices of transverse dofs, scaled by the axial force for the stress stiffness
+        and by the distributed rotational springs stiffness for the m-t stiffness
+    k_py_top : np.ndarray
+        consistent element matrices of the p-y springs at the top of elements, scaled by the spring stiffness
+    k_py_bottom : np.ndarray
+        consistent element matrices of the p-y springs at the bottom of elements, scaled by the spring stiffness
+    """
+
+    key: tuple
+    L: np.ndarray
+    kappa: np.ndarray
+    k_mechanical: np.ndarray
+    k_geometric: np.ndarray
+    k_py_top: np.ndarray
+    k_py_bottom: np.ndarray
 
-    Raises
-    ------
-    ValueError
-        Model.element.type only accepts 'EB' type (for Euler-Bernoulli) or 'T' type (for Timoshenko)
-    ValueError
-        Timoshenko beams cannot be used yet for non-circular pile types
-    ValueError
-        ndof per node can be either 2 or 3
 
+def element_invariants(model) -> ElementInvariants:
+    """returns the element invariants of a model, see :py:class:`ElementInvariants`.
+
+    The invariants are computed once and stored with the model until its pile or mesh changes.
+
+    Parameters
+    ----------
+    model : openpile class object `openpile.construct.Model`
+        includes information on soil/structure, elements, nodes and other model-related data.
+
+    Returns
+    -------
+    ElementInvariants
     """
+    cache = getattr(model, "_element_invariants", None)
+    if (
+        cache is None
+        or cache.key[0] is not model._element_properties
+        or cache.key[1] is not model.pile
+        or cache.key[2:] != (model.element_type, model.pile._nu)
+    ):
+        key = (model._element_properties, model.pile, model.element_type, model.pile._nu)
+        cache = _compute_element_invariants(model, key)
+        model._element_invariants = cache
+    return cache
+
+
+def _compute_element_invariants(model, key) -> ElementInvariants:
+    """computes the element invariants of a model"""
 
     # calculate length vector
     L = mesh_to_element_length(model)
     # elastic properties
+    properties = model._element_properties
     nu = model.pile._nu
-    E = model.element_properties["E [kPa]"].to_numpy(dtype=float).reshape((-1, 1, 1))
+    E = np.asarray(properties["E [kPa]"], dtype=float).reshape((-1, 1, 1))
     G = E / (2 + 2 * nu)
     # cross-section properties
-    I = model.element_properties["I [m4]"].to_numpy(dtype=float).reshape((-1, 1, 1))
-    A = model.element_properties["Area [m2]"].to_numpy(dtype=float).reshape((-1, 1, 1))
-    d = model.element_properties["Diameter [m]"].to_numpy(dtype=float).reshape((-1, 1, 1))
-    wt = model.element_properties["Wall thickness [m]"].to_numpy(dtype=float).reshape((-1, 1, 1))
+    I = np.asarray(properties["I [m4]"], dtype=float).reshape((-1, 1, 1))
+    A = np.asarray(properties["Area [m2]"], dtype=float).reshape((-1, 1, 1))
+    d = np.asarray(properties["Diameter [m]"], dtype=float).reshape((-1, 1, 1))
+    wt = np.asarray(properties["Wall thickness [m]"], dtype=float).reshape((-1, 1, 1))
 
     # calculate shear component in stiffness matrix (if Timorshenko)
     if model.element_type == "EulerBernoulli":
-        kappa = 0
+        kappa = np.zeros(L.shape)
     elif model.element_type == "Timoshenko":
         if model.pile.kind == "Circular":
-            a = 0.5 * d
-            b = 0.5 * (d - 2 * wt)
-            nom = 6 * (a**2 + b**2) ** 2 * (1 + nu) ** 2
-            denom = (
-                7 * a**4
-                + 34 * a**2 * b**2
-                + 7 * b**4
-                + nu * (12 * a**4 + 48 * a**2 * b**2 + 12 * b**4)
-                + nu**2 * (4 * a**4 + 16 * a**2 * b**2 + 4 * b**4)
-            )
-            kappa = nom / denom
+            kappa = timoshenko_shear_coefficient(d, wt, nu)
         else:
             raise ValueError("Timoshenko beams cannot be used yet for non-circular pile types")
     else:
@@ -235,6 +578,7 @@ def elem_mechanical_stiffness_matrix(model):
             "Model.element.type only accepts 'EB' type (for Euler-Bernoulli) of 'T' type (for Timoshenko)"
         )
 
+    # mechanical stiffness matrix
     phi = 12 * E * I * kappa / (A * G * L**2)
     X = A * E / L
     Y1 = (12 * E * I) / ((1 + phi) * L**3)
@@ -243,7 +587,7 @@ def elem_mechanical_stiffness_matrix(model):
     Y4 = ((2 - phi) * E * I) / ((1 + phi) * L)
     N = np.zeros(shape=X.shape)
 
-    k = np.block(
+    k_mechanical = np.block(
         [
             [X, N, N, -X, N, N],
             [N, Y1, Y2, N, -Y1, Y2],
@@ -254,7 +598,105 @@ def elem_mechanical_stiffness_matrix(model):
         ]
     )
 
-    return k
+    # consistent matrix of transverse dofs
+    if model.element_type == "EulerBernoulli":
+        A = 6 / (5 * L)
+        B = N + 1 / 10
+        C = 2 * L / 15
+        D = -L / 30
+    else:
+        omega = E * I * kappa / (A * G * L**2)
+        phi = (12 * omega + 1) ** 2
+
+        A = 6 * (120 * omega**2 + 20 * omega + 1) / ((5 * L) * phi) + 12 * I / (A * L**3 * phi)
+        B = 1 / (10 * phi) + 6 * I / (A * L**2 * phi)
+        C = (2 * L * (90 * omega**2 + 15 * omega + 1)) / (15 * phi) + 4 * I * (
+            36 * omega**2 + 6 * omega + 1
+        ) / (A * L * phi)
+        D = -L * (360 * omega**2 + 60 * omega + 1) / (30 * phi) - 2 * I * (
+            72 * omega**2 + 12 * omega - 1
+        ) / (A * L * phi)
+
+    k_geometric = np.block(
+        [
+            [N, N, N, N, N, N],
+            [N, A, B, N, -A, B],
+            [N, B, C, N, -B, D],
+            [N, N, N, N, N, N],
+            [N, -A, -B, N, A, -B],
+            [N, B, D, N, -B, C],
+        ]
+    )
+
+    # consistent matrices of p-y springs varying linearly along the elements
+    A = 2 * L / 7
+    B = L**2 / 28
+    C = L**3 / 168
+    D = 9 * L / 140
+    E = L**2 / 70
+    F = 3 * L / 35
+    G = -(L**2) / 60
+    H = -(L**3) / 280
+    I = L**3 / 280
+
+    k_py_top = np.block(
+        [
+            [N, N, N, N, N, N],
+            [N, A, B, N, D, G],
+            [N, B, C, N, E, H],
+            [N, N, N, N, N, N],
+            [N, D, E, N, F, G],
+            [N, G, H, N, G, I],
+        ]
+    )
+
+    k_py_bottom = np.block(
+        [
+            [N, N, N, N, N, N],
+            [N, F, -G, N, D, -E],
+            [N, -G, -H, N, -G, -I],
+            [N, N, N, N, N, N],
+            [N, D, -G, N, A, -B],
+            [N, -E, -I, N, -B, C],
+        ]
+    )
+
+    return ElementInvariants(
+        key=key,
+        L=np.ascontiguousarray(L),
+        kappa=np.ascontiguousarray(kappa),
+        k_mechanical=np.ascontiguousarray(k_mechanical),
+        k_geometric=np.ascontiguousarray(k_geometric),
+        k_py_top=np.ascontiguousarray(k_py_top),
+        k_py_bottom=np.ascontiguousarray(k_py_bottom),
+    )
+
+
+def elem_mechanical_stiffness_matrix(model):
+    """creates pile element stiffness matrix based on model info and element number
+
+    Parameters
+    ----------
+    model : openpile class object `openpile.construct.Model`
+        includes information on soil/structure, elements, nodes and other model-related data.
+
+    Returns
+    -------
+    k: numpy array (3d)
+        element stiffness matrix of all elememts related to the mechanical properties of the structure
+
+    Raises
+    ------
+    ValueError
+        Model.element.type only accepts 'EB' type (for Euler-Bernoulli) or 'T' type (for Timoshenko)
+    ValueError
+        Timoshenko beams cannot be used yet for non-circular pile types
+    ValueError
+        ndof per node can be either 2 or 3
+
+    """
+
+    return element_invariants(model).k_mechanical.copy()
 
 
 def elem_py_stiffness_matrix(model, u, kind):
@@ -270,12 +712,12 @@ def elem_py_stiffness_matrix(model, u, kind):
         includes information on soil/structure, elements, nodes and other model-related data.
     u: np.ndarray
         Global displacement vector
-    kind: str
-        "initial", "secant" or "tangent"
+    kind: str or tuple of str
+        "initial", "secant" or "tangent", several kinds can be calculated in one pass if a tuple is given.
 
     Returns
     -------
-    k: numpy array (3d)
+    k: numpy array (3d) or tuple of numpy arrays
         soil consistent stiffness matrix of all elememts related to the p-y soil springs' stiffness
 
     Raises
@@ -285,52 +727,21 @@ def elem_py_stiffness_matrix(model, u, kind):
 
     """
 
-    # calculate length vector
-    L = mesh_to_element_length(model)
+    invariants = element_invariants(model)
 
     # calculate the spring stiffness
-    ksoil = calculate_py_springs_stiffness(u=u[1::3], springs=model._py_springs, kind=kind)
-
-    N = 0 * L
-    A = 2 * L / 7
-    B = L**2 / 28
-    C = L**3 / 168
-    D = 9 * L / 140
-    E = L**2 / 70
-    F = 3 * L / 35
-    G = -(L**2) / 60
-    H = -(L**3) / 280
-    I = L**3 / 280
-
-    ktop = (
-        np.block(
-            [
-                [N, N, N, N, N, N],
-                [N, A, B, N, D, G],
-                [N, B, C, N, E, H],
-                [N, N, N, N, N, N],
-                [N, D, E, N, F, G],
-                [N, G, H, N, G, I],
-            ]
-        )
-        * ksoil[:, 0]
+    ksoils = calculate_py_springs_stiffness(
+        u=u[1::3],
+        springs=model._py_springs,
+        kind=(kind,) if isinstance(kind, str) else kind,
+        maxima=springs_maxima(model),
     )
 
-    kbottom = (
-        np.block(
-            [
-                [N, N, N, N, N, N],
-                [N, F, -G, N, D, -E],
-                [N, -G, -H, N, -G, -I],
-                [N, N, N, N, N, N],
-                [N, D, -G, N, A, -B],
-                [N, -E, -I, N, -B, C],
-            ]
-        )
-        * ksoil[:, 1]
+    k = tuple(
+        invariants.k_py_top * ksoil[:, 0] + invariants.k_py_bottom * ksoil[:, 1] for ksoil in ksoils
     )
 
-    return ktop + kbottom
+    return k[0] if isinstance(kind, str) else k
 
 
 def elem_mt_stiffness_matrix(model, u, kind):
@@ -346,12 +757,12 @@ def elem_mt_stiffness_matrix(model, u, kind):
         includes information on soil/structure, elements, nodes and other model-related data.
     u: np.ndarray
         Global displacement vector
-    kind: str
-        "initial", "secant" or "tangent"
+    kind: str or tuple of str
+        "initial", "secant" or "tangent", several kinds can be calculated in one pass if a tuple is given.
 
     Returns
     -------
-    k: numpy array (3d)
+    k: numpy array (3d) or tuple of numpy arrays
         soil consistent stiffness matrix of all elememts related to the p-y soil springs' stiffness
 
     Raises
@@ -361,88 +772,27 @@ def elem_mt_stiffness_matrix(model, u, kind):
 
     """
 
-    # calculate length vector
-    L = mesh_to_element_length(model)
+    invariants = element_invariants(model)
 
     # calculate the py spring stiffness
-    kspy = calculate_py_springs_stiffness(u=u[1::3], springs=model._py_springs, kind="secant")
+    kspy = calculate_py_springs_stiffness(
+        u=u[1::3], springs=model._py_springs, kind="secant", maxima=springs_maxima(model)
+    )
     upy = double_inner_njit(u[1::3]).reshape(-1, 2, 1, 1)
     p_mobilised = kspy * upy
 
     # calculate the spring stiffness
-    ksoil = calculate_mt_springs_stiffness(
+    ksoils = calculate_mt_springs_stiffness(
         u=u[2::3],
         mt_springs=model._mt_springs,
         py_springs=model._py_springs,
         p_mobilised=p_mobilised,
-        kind=kind,
+        kind=(kind,) if isinstance(kind, str) else kind,
     )
 
-    # elastic properties
-    nu = model.pile._nu
-    E = model.element_properties["E [kPa]"].to_numpy(dtype=float).reshape((-1, 1, 1))
-    G = E / (2 + 2 * nu)
-    # cross-section properties
-    I = model.element_properties["I [m4]"].to_numpy(dtype=float).reshape((-1, 1, 1))
-    A = model.element_properties["Area [m2]"].to_numpy(dtype=float).reshape((-1, 1, 1))
-    d = model.element_properties["Diameter [m]"].to_numpy(dtype=float).reshape((-1, 1, 1))
-    wt = model.element_properties["Wall thickness [m]"].to_numpy(dtype=float).reshape((-1, 1, 1))
-
-    # calculate shear component in stiffness matrix (if Timorshenko)
-    if model.element_type == "EulerBernoulli":
-        N = 0 * L
-        A = 6 / (5 * L)
-        B = N + 1 / 10
-        C = 2 * L / 15
-        D = -L / 30
-    elif model.element_type == "Timoshenko":
-        if model.pile.kind == "Circular":
-            a = 0.5 * d
-            b = 0.5 * (d - 2 * wt)
-            nom = 6 * (a**2 + b**2) ** 2 * (1 + nu) ** 2
-            denom = (
-                7 * a**4
-                + 34 * a**2 * b**2
-                + 7 * b**4
-                + nu * (12 * a**4 + 48 * a**2 * b**2 + 12 * b**4)
-                + nu**2 * (4 * a**4 + 16 * a**2 * b**2 + 4 * b**4)
-            )
-            kappa = nom / denom
-
-            omega = E * I * kappa / (A * G * L**2)
-
-        else:
-            raise ValueError("Timoshenko beams cannot be used yet for non-circular pile types")
+    k = tuple(invariants.k_geometric * (0.5 * ksoil[:, 0] + 0.5 * ksoil[:, 1]) for ksoil in ksoils)
 
-        phi = (12 * omega + 1) ** 2
-
-        N = 0 * L
-        A = 6 * (120 * omega**2 + 20 * omega + 1) / ((5 * L) * phi) + 12 * I / (A * L**3 * phi)
-        B = 1 / (10 * phi) + 6 * I / (A * L**2 * phi)
-        C = (2 * L * (90 * omega**2 + 15 * omega + 1)) / (15 * phi) + 4 * I * (
-            36 * omega**2 + 6 * omega + 1
-        ) / (A * L * phi)
-        D = -L * (360 * omega**2 + 60 * omega + 1) / (30 * phi) - 2 * I * (
-            72 * omega**2 + 12 * omega - 1
-        ) / (A * L * phi)
-
-    else:
-        raise ValueError(
-            "Model.element.type only accepts 'EB' type (for Euler-Bernoulli) of 'T' type (for Timoshenko)"
-        )
-
-    km = np.block(
-        [
-            [N, N, N, N, N, N],
-            [N, A, B, N, -A, B],
-            [N, B, C, N, -B, D],
-            [N, N, N, N, N, N],
-            [N, -A, -B, N, A, -B],
-            [N, B, D, N, -B, C],
-        ]
-    ) * (0.5 * ksoil[:, 0] + 0.5 * ksoil[:, 1])
-
-    return km
+    return k[0] if isinstance(kind, str) else k
 
 
 def elem_p_delta_stiffness_matrix(model, u):
@@ -469,83 +819,76 @@ def elem_p_delta_stiffness_matrix(model, u):
 
     """
 
-    # calculate length vector
-    L = mesh_to_element_length(model)
-
     # internal forces
     f = pile_internal_forces(model, u)
     P = f[::6].reshape(-1, 1, 1)
 
-    # elastic properties
-    nu = model.pile._nu
-    E = model.element_properties["E [kPa]"].to_numpy(dtype=float).reshape((-1, 1, 1))
-    G = E / (2 + 2 * nu)
-    # cross-section properties
-    I = model.element_properties["I [m4]"].to_numpy(dtype=float).reshape((-1, 1, 1))
-    A = model.element_properties["Area [m2]"].to_numpy(dtype=float).reshape((-1, 1, 1))
-    d = model.element_properties["Diameter [m]"].to_numpy(dtype=float).reshape((-1, 1, 1))
-    wt = model.element_properties["Wall thickness [m]"].to_numpy(dtype=float).reshape((-1, 1, 1))
-
-    # calculate shear component in stiffness matrix (if Timorshenko)
-    if model.element_type == "EulerBernoulli":
-        N = 0 * L
-        N1 = 0 * L
-        N2 = 0 * L
-        A = 6 / (5 * L)
-        B = N + 1 / 10
-        C = 2 * L / 15
-        D = -L / 30
-    elif model.element_type == "Timoshenko":
-        if model.pile.kind == "Circular":
-            a = 0.5 * d
-            b = 0.5 * (d - 2 * wt)
-            nom = 6 * (a**2 + b**2) ** 2 * (1 + nu) ** 2
-            denom = (
-                7 * a**4
-                + 34 * a**2 * b**2
-                + 7 * b**4
-                + nu * (12 * a**4 + 48 * a**2 * b**2 + 12 * b**4)
-                + nu**2 * (4 * a**4 + 16 * a**2 * b**2 + 4 * b**4)
-            )
-            kappa = nom / denom
-
-            omega = E * I * kappa / (A * G * L**2)
+    return element_invariants(model).k_geometric * -P
 
-        else:
-            raise ValueError("Timoshenko beams cannot be used yet for non-circular pile types")
 
-        phi = (12 * omega + 1) ** 2
+def elem_mass_matrix(model, kind: Literal["consistent", "lumped"] = "consistent"):
+    """creates pile element mass matrix based on the unit weight of the pile material.
 
-        N = 0 * L
-        N1 = 0 / L
-        N2 = 0 / L
-        A = 6 * (120 * omega**2 + 20 * omega + 1) / ((5 * L) * phi) + 12 * I / (A * L**3 * phi)
-        B = 1 / (10 * phi) + 6 * I / (A * L**2 * phi)
-        C = (2 * L * (90 * omega**2 + 15 * omega + 1)) / (15 * phi) + 4 * I * (
-            36 * omega**2 + 6 * omega + 1
-        ) / (A * L * phi)
-        D = -L * (360 * omega**2 + 60 * omega + 1) / (30 * phi) - 2 * I * (
-            72 * omega**2 + 12 * omega - 1
-        ) / (A * L * phi)
+    The consistent mass matrix uses the linear (axial) and cubic (transverse) shape functions
+    of Euler-Bernoulli beams, the rotary inertia of the cross-section being neglected.
+    The lumped mass matrix allocates half the mass of each element to the translational dofs
+    of its nodes, without rotational inertia.
 
-    else:
-        raise ValueError("Model.element.type only accepts 'EulerBernoulli' or 'Timoshenko'")
+    Parameters
+    ----------
+    model : openpile class object `openpile.construct.Model`
+        includes information on soil/structure, elements, nodes and other model-related data.
+    kind: str, by default "consistent"
+        "consistent" or "lumped"
 
-    k = (
-        np.block(
+    Returns
+    -------
+    m: numpy array (3d)
+        element mass matrices of all elements in unit: t (i.e. kN.s2/m)
+    """
+    invariants = element_invariants(model)
+    L = invariants.L
+
+    # mass per unit length, unit weight in kN/m3 converted to t/m3
+    A = np.asarray(model._element_properties["Area [m2]"], dtype=float).reshape((-1, 1, 1))
+    mass = model.pile._uw / 9.81 * A * L
+    N = np.zeros(shape=L.shape)
+
+    if kind == "consistent":
+        X1 = mass / 3
+        X2 = mass / 6
+        A = 156 * mass / 420
+        B = 22 * L * mass / 420
+        C = 4 * L**2 * mass / 420
+        D = 54 * mass / 420
+        E = 13 * L * mass / 420
+        F = -3 * L**2 * mass / 420
+        m = np.block(
             [
-                [N, N, N1, N, N, N2],
-                [N, A, B, N, -A, B],
-                [N1, B, C, -N1, -B, D],
-                [N, N, -N1, N, N, -N2],
-                [N, -A, -B, N, A, -B],
-                [N2, B, D, -N2, -B, C],
+                [X1, N, N, X2, N, N],
+                [N, A, B, N, D, -E],
+                [N, B, C, N, E, F],
+                [X2, N, N, X1, N, N],
+                [N, D, E, N, A, -B],
+                [N, -E, F, N, -B, C],
             ]
         )
-        * -P
-    )
+    elif kind == "lumped":
+        X = mass / 2
+        m = np.block(
+            [
+                [X, N, N, N, N, N],
+                [N, X, N, N, N, N],
+                [N, N, N, N, N, N],
+                [N, N, N, X, N, N],
+                [N, N, N, N, X, N],
+                [N, N, N, N, N, N],
+            ]
+        )
+    else:
+        raise UserInputError("kind must be one of ('consistent', 'lumped').")
 
-    return k
+    return np.ascontiguousarray(m)
 
 
 @njit(parallel=True, cache=True)
@@ -567,7 +910,102 @@ def jit_build(k, ndim, n_elem, node_per_element, ndof_per_node):
     return K
 
 
-def build_stiffness_matrix(model, u=None, kind=None):
+@njit(parallel=True, cache=True)
+def jit_build_banded(k, ndim, n_elem, node_per_element, ndof_per_node):
+    # half-bandwidth of the global stiffness matrix
+    bw = ndof_per_node * node_per_element - 1
+    # pre-allocate stiffness matrix in (LAPACK) general banded storage
+    # where K[i, j] is stored in ab[bw + i - j, j]
+    ab = np.zeros((2 * bw + 1, ndim), dtype=np.float64)
+
+    # two consecutive elements share one node, elements are therefore scattered in two
+    # passes (even then odd elements) so that no two threads write in the same entries
+    for parity in range(2):
+        for ii in prange((n_elem - parity + 1) // 2):
+            i = 2 * ii + parity
+            start = ndof_per_node * i
+            for a in range(ndof_per_node * node_per_element):
+                for b in range(ndof_per_node * node_per_element):
+                    ab[bw + a - b, start + b] += k[i, a, b]
+
+    return ab
+
+
+def sparse_build(k, ndim, n_elem, node_per_element, ndof_per_node):
+    # dofs of each element
+    ndof_per_element = ndof_per_node * node_per_element
+    dofs = ndof_per_node * np.arange(n_elem).reshape(-1, 1) + np.arange(ndof_per_element)
+    # row and column indices of each entry in the element stiffness matrices
+    rows = np.repeat(dofs, ndof_per_element, axis=1).reshape(-1)
+    cols = np.tile(dofs, (1, ndof_per_element)).reshape(-1)
+
+    # duplicate entries (i.e. shared nodes) are summed when converted to CSR format
+    K = sparse.coo_matrix(
+        (np.ascontiguousarray(k, dtype=np.float64).reshape(-1), (rows, cols)),
+        shape=(ndim, ndim),
+    ).tocsr()
+
+    return K
+
+
+def add_to_diagonal(K, idx, value):
+    """adds a value to the diagonal term of a global stiffness matrix, whatever its storage.
+
+    Parameters
+    ----------
+    K : numpy array or scipy.sparse matrix
+        Global stiffness matrix in dense, banded or sparse storage.
+    idx : int
+        dof index of the diagonal term
+    value : float
+        value to add
+    """
+    if sparse.issparse(K):
+        K[idx, idx] += value
+    elif K.shape[0] != K.shape[1]:
+        # banded storage, the main diagonal is the middle row
+        K[K.shape[0] // 2, idx] += value
+    else:
+        K[idx, idx] += value
+
+
+def _assembler(storage):
+    """returns the function assembling element matrices in a global matrix of the given storage"""
+    if storage == "dense":
+        return jit_build
+    elif storage == "banded":
+        return jit_build_banded
+    elif storage == "sparse":
+        return sparse_build
+    else:
+        raise UserInputError("storage must be one of ('dense', 'banded', 'sparse').")
+
+
+def assemble(k, storage: Literal["dense", "banded", "sparse"] = "dense"):
+    """assembles element matrices of a model in a global matrix.
+
+    Parameters
+    ----------
+    k : numpy array of dim (n_elem, 6, 6)
+        element matrices
+    storage: str, by default "dense"
+        storage of the global matrix, can be of ("dense", "banded", "sparse"),
+        see :py:func:`openpile.core.kernel.build_stiffness_matrix`.
+
+    Returns
+    -------
+    numpy array of dim (ndof, ndof) or (11, ndof) or scipy.sparse.csr_matrix
+    """
+    n_elem = k.shape[0]
+    return _assembler(storage)(np.ascontiguousarray(k), 3 * n_elem + 3, n_elem, 2, 3)
+
+
+def build_stiffness_matrix(
+    model,
+    u=None,
+    kind=None,
+    storage: Literal["dense", "banded", "sparse"] = "dense",
+):
     """Builds the stiffness matrix based on the model(element and node) properties
 
     Element stiffness matrices are first computed for each element and then loaded in the global stiffness matrix through summation.
@@ -583,12 +1021,20 @@ def build_stiffness_matrix(model, u=None, kind=None):
         Global displacement vector. Must be given if soil_flag is not None
     p_mobilised: np.ndarray, Optional
         Mobilised p-value. Must be given if soil_flag is not None
-    kind: str, Optional
-        "initial", "secant" or "tangent". Must be given if soil_flag is not None
+    kind: str or tuple of str, Optional
+        "initial", "secant" or "tangent". Must be given if soil_flag is not None.
+        If a tuple is given, e.g. ("secant", "tangent"), the springs are evaluated in one pass
+        and one global stiffness matrix is returned per kind.
+    storage: str, by default "dense"
+        storage of the global stiffness matrix, can be of ("dense", "banded", "sparse").
+        "dense" returns a full array of dim (ndof, ndof), "banded" returns the LAPACK general
+        banded storage of dim (11, ndof) where K[i,j] is stored in [5 + i - j, j] and
+        "sparse" returns a `scipy.sparse.csr_matrix`. The element matrices are directly
+        scattered in the two latter storages.
 
     Returns
     -------
-    K : numpy array of dim (ndof, ndof)
+    K : numpy array of dim (ndof, ndof) or (11, ndof) or scipy.sparse.csr_matrix, or tuple of these
         Global stiffness matrix with all dofs in unit:1/kPa.
     """
 
@@ -601,11 +1047,15 @@ def build_stiffness_matrix(model, u=None, kind=None):
     # global dimension of the global stiffness matrix can be inferred
     ndim_global = ndof_per_node * n_elem + ndof_per_node
 
+    # kinds of stiffness matrices to build
+    kinds = (kind,) if kind is None or isinstance(kind, str) else tuple(kind)
+
     # mechanical stiffness properties
     k = elem_mechanical_stiffness_matrix(model)
     k += elem_p_delta_stiffness_matrix(model, u)
 
     # k = np.maximum(0,k)
+    k = [k] + [k.copy() for _ in kinds[1:]]
 
     # add soil contribution
     if model.soil is not None:
@@ -614,26 +1064,90 @@ def build_stiffness_matrix(model, u=None, kind=None):
             UserWarning("'u' and 'kind' must be stipulated.")
         else:
             if model.distributed_lateral:
-                k += elem_py_stiffness_matrix(model, u, kind)
+                for k_i, k_py in zip(k, elem_py_stiffness_matrix(model, u, kinds)):
+                    k_i += k_py
 
             if model.distributed_moment:
                 if not model.distributed_lateral:
                     raise UserInputError(
                         "Error: Distributed moment cannot be calculated without distributed lateral springs."
                     )
-                k += elem_mt_stiffness_matrix(model, u, kind)
+                for k_i, k_mt in zip(k, elem_mt_stiffness_matrix(model, u, kinds)):
+                    k_i += k_mt
 
-    K = jit_build(k, ndim_global, n_elem, node_per_element, ndof_per_node)
+    build = _assembler(storage)
 
-    # add base springs contribution
-    if model.soil is not None:
-        if model.base_shear:
-            K[-2, -2] += calculate_base_spring_stiffness(u[-2], model._Hb_spring, kind)
+    K = []
+    for k_i, kind_i in zip(k, kinds):
+        K_i = build(k_i, ndim_global, n_elem, node_per_element, ndof_per_node)
 
-        if model.base_moment:
-            K[-1, -1] += calculate_base_spring_stiffness(u[-1], model._Mb_spring, kind)
+        # add base springs contribution
+        if model.soil is not None:
+            if model.base_shear:
+                add_to_diagonal(
+                    K_i, -2, calculate_base_spring_stiffness(u[-2], model._Hb_spring, kind_i)
+                )
 
-    return K
+            if model.base_moment:
+                add_to_diagonal(
+                    K_i, -1, calculate_base_spring_stiffness(u[-1], model._Mb_spring, kind_i)
+                )
+
+        K.append(K_i)
+
+    return K[0] if kind is None or isinstance(kind, str) else tuple(K)
+
+
+def build_mass_matrix(
+    model,
+    kind: Literal["consistent", "lumped"] = "consistent",
+    storage: Literal["dense", "banded", "sparse"] = "sparse",
+):
+    """Builds the global mass matrix of the pile, see :py:func:`openpile.core.kernel.elem_mass_matrix`.
+
+    Parameters
+    ----------
+    model : obj from openpile library
+        stores all information about nodes elements, and other model-related items
+    kind: str, by default "consistent"
+        "consistent" or "lumped" mass matrix.
+    storage: str, by default "sparse"
+        storage of the global mass matrix, can be of ("dense", "banded", "sparse"),
+        see :py:func:`openpile.core.kernel.build_stiffness_matrix`.
+
+    Returns
+    -------
+    M : numpy array of dim (ndof, ndof) or (11, ndof) or scipy.sparse.csr_matrix
+        Global mass matrix in unit: t (i.e. kN.s2/m).
+    """
+    return assemble(elem_mass_matrix(model, kind), storage)
+
+
+def global_dof_vectors(model):
+    """returns the global force, displacement and restraint vectors of a model.
+
+    The vectors are copies of the nodal arrays of the model, flattened node by node
+    with dofs ordered as (x, y, z).
+
+    Parameters
+    ----------
+    model : openpile class object `openpile.construct.Model`
+        includes information on soil/structure, elements, nodes and other model-related data.
+
+    Returns
+    -------
+    F : np.ndarray
+        global force vector
+    U : np.ndarray
+        global prescribed displacement vector
+    supports : np.ndarray
+        global restrained dof vector (boolean)
+    """
+    F = model._global_forces.reshape(-1).astype(np.float64)
+    U = model._global_disp.reshape(-1).astype(np.float64)
+    supports = model._global_restrained.reshape(-1).astype(bool)
+
+    return F, U, supports
 
 
 def mesh_to_global_force_dof_vector(df: pd.DataFrame) -> np.ndarray:
@@ -664,7 +1178,7 @@ def pile_internal_forces(model, u):
     node_per_element = 2
 
     # create mech consistent stiffness matrix
-    k = elem_mechanical_stiffness_matrix(model)
+    k = element_invariants(model).k_mechanical
 
     # create array u of shape [n_elem x 6 x 1]
     u = global_dof_vector_to_consistent_stacked_array(u, ndof_per_node * node_per_element)
@@ -728,9 +1242,140 @@ def calculate_base_spring_stiffness(
     return k
 
 
+# codes of the kinds of stiffness used in the jitted functions
+STIFFNESS_KINDS = {"initial": 0, "secant": 1, "tangent": 2}
+
+
+def _kind_codes(kind):
+    """converts a kind or a tuple of kinds of stiffness to an array of codes"""
+    kinds = (kind,) if isinstance(kind, str) else tuple(kind)
+    try:
+        return np.array([STIFFNESS_KINDS[x] for x in kinds], dtype=np.int64)
+    except KeyError:
+        raise UserInputError("kind must be one of ('initial', 'secant', 'tangent').")
+
+
+@njit(parallel=True, cache=True)
+def jit_springs_maxima(springs):
+    """computes the maximum value and whether each spring is defined.
+
+    Parameters
+    ----------
+    springs : np.ndarray
+        soil-structure interaction springs array of shape (n_elem, 2, 2, spring_dim)
+
+    Returns
+    -------
+    defined : np.ndarray
+        boolean array of shape (n_elem, 2), False if the spring is not defined
+    ymax : np.ndarray
+        maximum displacement of each spring, array of shape (n_elem, 2)
+    """
+    n_elem = springs.shape[0]
+    defined = np.zeros((n_elem, 2), dtype=np.bool_)
+    ymax = np.zeros((n_elem, 2), dtype=np.float64)
+
+    for i in prange(n_elem):
+        for j in range(2):
+            defined[i, j] = np.sum(springs[i, j, 1]) != 0
+            ymax[i, j] = np.max(springs[i, j, 1])
+
+    return defined, ymax
+
+
+def springs_maxima(model):
+    """returns the maxima of the p-y springs of a model, see :py:func:`jit_springs_maxima`.
+
+    The maxima are computed once and stored with the model until its springs are re-created.
+    """
+    cache = getattr(model, "_py_springs_maxima", None)
+    if cache is None or cache[0] is not model._py_springs:
+        cache = (model._py_springs,) + jit_springs_maxima(model._py_springs)
+        model._py_springs_maxima = cache
+    return cache[1:]
+
+
 @njit(cache=True)
+def _interp_index(x, xp):
+    """returns the index j and weight w such that np.interp(x, xp, fp) = fp[j] + w * (fp[j+1] - fp[j])"""
+    n = xp.shape[0]
+    if x < xp[0]:
+        return 0, 0.0
+    elif x >= xp[n - 1]:
+        return n - 2, 1.0
+    else:
+        # xp[j] <= x < xp[j+1]
+        j = np.searchsorted(xp, x, side="right") - 1
+        return j, (x - xp[j]) / (xp[j + 1] - xp[j])
+
+
+@njit(parallel=True, cache=True)
+def jit_py_springs_stiffness(d, springs, defined, ymax, kinds):
+    """Calculate springs stiffness for py or t-z springs for several kinds of stiffness in one pass.
+
+    Parameters
+    ----------
+    d : np.ndarray
+        absolute displacements at each spring, array of shape (n_elem, 2)
+    springs : np.ndarray
+        soil-structure interaction py springs array of shape (n_elem, 2, 2, spring_dim)
+    defined : np.ndarray
+        boolean array of shape (n_elem, 2), False if the spring is not defined
+    ymax : np.ndarray
+        maximum displacement of each spring, array of shape (n_elem, 2)
+    kinds : np.ndarray
+        codes of the kinds of stiffness to calculate, see STIFFNESS_KINDS
+
+    Returns
+    -------
+    k: np.ndarray
+        stiffness for all kinds and elements. Array of shape(n_kinds, n_elem, 2)
+    """
+    n_elem = d.shape[0]
+    k = np.zeros((kinds.shape[0], n_elem, 2), dtype=np.float64)
+
+    for i in prange(n_elem):
+        for j in range(2):
+            if not defined[i, j]:
+                continue
+
+            y = springs[i, j, 1]
+            p = springs[i, j, 0]
+            dij = d[i, j]
+
+            for n in range(kinds.shape[0]):
+                if kinds[n] == 0 or dij == 0.0:
+                    dx = y[1] - y[0]
+                    p0 = p[0]
+                    p1 = p[1]
+                elif kinds[n] == 1:
+                    dx = dij
+                    p0 = p[0]
+                    if dij > ymax[i, j]:
+                        p1 = p[-1]
+                    else:
+                        p1 = np.interp(dx, y, p)
+                else:
+                    dx = min(0.0005, dij)
+                    if (dij - dx) > ymax[i, j]:
+                        p0 = p[-1]
+                    else:
+                        p0 = np.interp(dij - dx, y, p)
+                    if dij > ymax[i, j]:
+                        p1 = p[-1]
+                    else:
+                        p1 = np.interp(dij, y, p)
+
+                k[n, i, j] = abs((p1 - p0) / dx)
+
+    return k
+
+
 def calculate_py_springs_stiffness(
-    u: np.ndarray, springs: np.ndarray, kind: Literal["initial", "secant", "tangent"]
+    u: np.ndarray,
+    springs: np.ndarray,
+    kind: Literal["initial", "secant", "tangent"],
+    maxima: tuple = None,
 ):
     """Calculate springs stiffness for py or t-z springs.
 
@@ -742,56 +1387,108 @@ def calculate_py_springs_stiffness(
         For dofs related to p-y curves, u = U[1::3] where U is the global displacement vector.
     springs : np.ndarray
         soil-structure interaction py springs array of shape (n_elem, 2, 2, spring_dim)
-    kind : str
-        defines whether it is initial, secant of tangent stiffness to define
+    kind : str or tuple of str
+        defines whether it is initial, secant of tangent stiffness to define,
+        several kinds can be calculated in one pass if a tuple is given.
+    maxima : tuple, optional
+        precomputed output of :py:func:`jit_springs_maxima` for the given springs
 
     Returns
     -------
-    k: np.ndarray
+    k: np.ndarray or tuple of np.ndarray
         secant or tangent stiffness for all elements. Array of shape(n_elem,2,1,1)
     """
+    # displacemet with same dimension as spring
+    d = np.abs(double_inner_njit(u)).reshape((-1, 2))
 
-    # double inner values for u
-    d = double_inner_njit(u)
+    if maxima is None:
+        maxima = jit_springs_maxima(springs)
 
-    # displacemet with same dimension as spring
-    d = np.abs(d).reshape((-1, 2, 1, 1))
+    k = jit_py_springs_stiffness(d, springs, maxima[0], maxima[1], _kind_codes(kind))
+    k = k.reshape((k.shape[0], -1, 2, 1, 1))
 
-    k = np.zeros(d.shape, dtype=np.float64)
+    return k[0] if isinstance(kind, str) else tuple(k)
 
-    for i in range(k.shape[0]):
-        for j in range(k.shape[1]):
-            if np.sum(springs[i, j, 1]) == 0:
-                pass
-            else:
-                if kind == "initial" or d[i, j, 0, 0] == 0.0:
-                    dx = springs[i, j, 1, 1] - springs[i, j, 1, 0]
-                    p0 = springs[i, j, 0, 0]
-                    p1 = springs[i, j, 0, 1]
-                elif kind == "secant":
-                    dx = d[i, j, 0, 0]
-                    p0 = springs[i, j, 0, 0]
-                    if d[i, j, 0, 0] > np.max(springs[i, j, 1]):
-                        p1 = springs[i, j, 0, -1]
+
+@njit(parallel=True, cache=True)
+def jit_mt_springs_stiffness(d, mt_springs, py_springs, p, kinds):
+    """Calculate springs stiffness for rotational springs for several kinds of stiffness in one pass.
+
+    The m-t curve of each spring is interpolated from the p-y mobilisation with a single
+    search in the p-values of the p-y spring.
+
+    Parameters
+    ----------
+    d : np.ndarray
+        absolute rotations at each spring, array of shape (n_elem, 2)
+    mt_springs : np.ndarray
+        soil-structure interaction m-t springs array of shape (n_elem, 2, 2, py_spring_dim, mt_spring_dim)
+    py_springs : np.ndarray
+        soil-structure interaction p-y springs array of shape (n_elem, 2, 2, py_spring_dim)
+    p : np.ndarray
+        current p value of p-y springs of shape (n_elem, 2)
+    kinds : np.ndarray
+        codes of the kinds of stiffness to calculate, see STIFFNESS_KINDS
+
+    Returns
+    -------
+    k: np.ndarray
+        stiffness for all kinds and elements. Array of shape(n_kinds, n_elem, 2)
+    """
+    n_elem = d.shape[0]
+    mt_dim = mt_springs.shape[4]
+    k = np.zeros((kinds.shape[0], n_elem, 2), dtype=np.float64)
+
+    # i for each element
+    for i in prange(n_elem):
+        # j for top and bottom values of spring
+        for j in range(2):
+            if np.sum(mt_springs[i, j, 1, 0]) == 0:
+                # check if first m-vector is not a defined spring
+                # if that is the case, we do not calculate any stiffness
+                continue
+
+            # get the proper m-t spring, the first point is the origin
+            jj, w = _interp_index(p[i, j], py_springs[i, j, 0, :])
+            m = np.zeros(mt_dim)
+            t = np.zeros(mt_dim)
+            for ii in range(1, mt_dim):
+                m[ii] = mt_springs[i, j, 0, jj, ii] + w * (
+                    mt_springs[i, j, 0, jj + 1, ii] - mt_springs[i, j, 0, jj, ii]
+                )
+                t[ii] = mt_springs[i, j, 1, jj, ii] + w * (
+                    mt_springs[i, j, 1, jj + 1, ii] - mt_springs[i, j, 1, jj, ii]
+                )
+
+            dij = d[i, j]
+            for n in range(kinds.shape[0]):
+                if kinds[n] == 0 or dij == 0.0:
+                    dt = t[1] - t[0]
+                    m0 = m[0]
+                    m1 = m[1]
+                elif kinds[n] == 1:
+                    dt = dij
+                    m0 = m[0]
+                    if dij > t[-1]:
+                        m1 = m[-1]
                     else:
-                        p1 = np.interp(dx, springs[i, j, 1], springs[i, j, 0])
-                elif kind == "tangent":
-                    dx = min(0.0005, d[i, j, 0, 0])
-                    if (d[i, j, 0, 0] - dx) > np.max(springs[i, j, 1]):
-                        p0 = springs[i, j, 0, -1]
+                        m1 = np.interp(dt, t, m)
+                else:
+                    dt = min(0.01 * t[1], dij)
+                    if (dij - dt) > t[-1]:
+                        m0 = m[-1]
                     else:
-                        p0 = np.interp(d[i, j, 0, 0] - dx, springs[i, j, 1], springs[i, j, 0])
-                    if d[i, j, 0, 0] > np.max(springs[i, j, 1]):
-                        p1 = springs[i, j, 0, -1]
+                        m0 = np.interp(dij - dt, t, m)
+                    if dij > t[-1]:
+                        m1 = m[-1]
                     else:
-                        p1 = np.interp(d[i, j, 0, 0], springs[i, j, 1], springs[i, j, 0])
+                        m1 = np.interp(dij, t, m)
 
-                k[i, j, 0, 0] = abs((p1 - p0) / dx)
+                k[n, i, j] = abs(m1 - m0) / (dt)
 
     return k
 
 
-@njit(cache=True)
 def calculate_mt_springs_stiffness(
     u: np.ndarray,
     mt_springs: np.ndarray,
@@ -815,74 +1512,23 @@ def calculate_mt_springs_stiffness(
         soil-structure interaction p-y springs array of shape (n_elem, 2, 2, py_spring_dim)
     p_mobilised : np.ndarray
         current p value of p-y springs of shape (nelem, 2, 1, 1)
-    kind : str
-        defines whether it is initial, secant of tangent stiffness to define
+    kind : str or tuple of str
+        defines whether it is initial, secant of tangent stiffness to define,
+        several kinds can be calculated in one pass if a tuple is given.
 
     Returns
     -------
-    k: np.ndarray
+    k: np.ndarray or tuple of np.ndarray
         secant or tangent stiffness for all elements. Array of shape(n_elem,2,1,1)
     """
-
-    # double inner values for u
-    d = double_inner_njit(u)
-
     # displacemet and p_mobilised with same dimension as spring
-    d = np.abs(d).reshape((-1, 2, 1, 1))
-    p = p_mobilised.reshape((-1, 2, 1, 1))
-
-    k = np.zeros(d.shape, dtype=np.float64)
-
-    # get the proper m-t spring
-    m = np.zeros(mt_springs.shape[4])
-    t = np.zeros(mt_springs.shape[4])
-
-    # i for each element
-    for i in range(k.shape[0]):
-        # j for top and bottom values of spring
-        for j in range(k.shape[1]):
-            if np.sum(mt_springs[i, j, 1, 0]) == 0:
-                # check if first m-vector is not a defined spring
-                # if that is the case, we do not calculate any stiffness
-                pass
-            else:
+    d = np.abs(double_inner_njit(u)).reshape((-1, 2))
+    p = np.ascontiguousarray(p_mobilised, dtype=np.float64).reshape((-1, 2))
 
-                for ii in range((mt_springs.shape[4])):
-                    if ii == 0:
-                        pass
-                    else:
-                        m[ii] = np.interp(
-                            p[i, j, 0, 0], py_springs[i, j, 0, :], mt_springs[i, j, 0, :, ii]
-                        )
-                        t[ii] = np.interp(
-                            p[i, j, 0, 0], py_springs[i, j, 0, :], mt_springs[i, j, 1, :, ii]
-                        )
-
-                if kind == "initial" or d[i, j, 0, 0] == 0.0:
-                    dt = t[1] - t[0]
-                    m0 = m[0]
-                    m1 = m[1]
-                elif kind == "secant":
-                    dt = d[i, j, 0, 0]
-                    m0 = m[0]
-                    if d[i, j, 0, 0] > t[-1]:
-                        m1 = m[-1]
-                    else:
-                        m1 = np.interp(dt, t, m)
-                elif kind == "tangent":
-                    dt = min(0.01 * t[1], d[i, j, 0, 0])
-                    if (d[i, j, 0, 0] - dt) > t[-1]:
-                        m0 = m[-1]
-                    else:
-                        m0 = np.interp(d[i, j, 0, 0] - dt, t, m)
-                    if (d[i, j, 0, 0]) > t[-1]:
-                        m1 = m[-1]
-                    else:
-                        m1 = np.interp(d[i, j, 0, 0], t, m)
-
-                k[i, j, 0, 0] = abs(m1 - m0) / (dt)
+    k = jit_mt_springs_stiffness(d, mt_springs, py_springs, p, _kind_codes(kind))
+    k = k.reshape((k.shape[0], -1, 2, 1, 1))
 
-    return k
+    return k[0] if isinstance(kind, str) else tuple(k)
 
 
 def computer():
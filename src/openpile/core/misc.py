@@ -76,6 +76,85 @@ def repeat_inner(arr):
     return np.hstack([arr[0], arr_inner, arr[-1]])
 
 
+def mesh_elevations(
+    elevations,
+    coarseness: float,
+    grading: float = 1.0,
+    ground: float = None,
+    tip: float = None,
+    tolerance: float = 1e-3,
+) -> np.ndarray:
+    """elevations of the nodes of a mesh, sorted from top to bottom.
+
+    The given elevations are merged when closer than `tolerance` and each interval between
+    them is divided in the least number of elements not longer than the maximum element length.
+    The maximum element length is `coarseness` above the ground and increases linearly with depth
+    below the ground up to `grading * coarseness` at the tip. Nodes of an interval are evenly
+    spaced w.r.t. the element length, i.e. elements get longer with depth in graded meshes.
+
+    Parameters
+    ----------
+    elevations : array-like
+        elevations to be included in the mesh [m].
+    coarseness : float
+        maximum element length [m], at the ground if the mesh is graded.
+    grading : float, optional
+        ratio of the maximum element length at the tip to the one at the ground, by default 1.0,
+        i.e. uniform mesh.
+    ground : float, optional
+        elevation of the ground [m], by default the top elevation.
+    tip : float, optional
+        elevation of the tip [m], by default the bottom elevation.
+    tolerance : float, optional
+        elevations closer than the tolerance are merged [m], by default 1e-3.
+
+    Returns
+    -------
+    np.ndarray
+        float64 elevations of the nodes, in descending order.
+    """
+    x = np.unique(np.asarray(elevations, dtype=np.float64))[::-1]
+    # merge elevations within tolerance
+    x = x[np.concatenate(([True], -np.diff(x) > tolerance))]
+
+    ground = x[0] if ground is None else ground
+    tip = x[-1] if tip is None else tip
+    # rate of increase of the element length with depth below the ground
+    rate = (grading - 1.0) / (ground - tip) if grading != 1.0 and ground > tip else 0.0
+
+    def to_psi(x):
+        # number of elements of maximum length between the ground and the elevation
+        depth = ground - x
+        if rate == 0.0:
+            return depth / coarseness
+        below = np.maximum(depth, 0.0)
+        return np.minimum(depth, 0.0) / coarseness + np.log1p(rate * below) / (rate * coarseness)
+
+    def from_psi(psi):
+        if rate == 0.0:
+            return ground - psi * coarseness
+        below = np.maximum(psi, 0.0)
+        return (
+            ground - np.minimum(psi, 0.0) * coarseness - np.expm1(rate * coarseness * below) / rate
+        )
+
+    psi = to_psi(x)
+    # least number of elements per interval, round-off does not add an element
+    n = np.maximum(np.ceil(np.diff(psi) * (1 - 1e-9)), 1).astype(np.int64)
+
+    # secondary nodes, n-1 per interval
+    interval = np.repeat(np.arange(len(n)), n - 1)
+    k = np.arange(len(interval)) - np.repeat(np.cumsum(n - 1) - (n - 1), n - 1) + 1
+    if rate == 0.0:
+        x_secondary = x[interval] - k * (x[interval] - x[interval + 1]) / n[interval]
+    else:
+        x_secondary = from_psi(
+            psi[interval] + k * (psi[interval + 1] - psi[interval]) / n[interval]
+        )
+
+    return np.sort(np.concatenate((x, x_secondary)))[::-1]
+
+
 def get_reduced_springs(springs: np.ndarray, elevations: np.ndarray, kind: str) -> pd.DataFrame:
     """
     Returns soil springs created for the given model in one DataFrame.
@@ -78,7 +78,7 @@ def must_be_numbers_in_list(values, values_name):
             raise UserInputError(f"values in {values_name} can only be numbers")
 
 
-def check_boundary_conditions(model):
+def check_boundary_conditions(model, forces=None):
     """
     Check if boundary conditions are satisfactory to solve the system of equations.
 
@@ -86,20 +86,22 @@ def check_boundary_conditions(model):
     ----------
     model: openppile.construct.Model object
         Mehs object crated from openpile
+    forces: numpy.ndarray, optional
+        nodal loads [Px, Py, Mz] of dim (n_nodes, 3), by default the loads of the model
     """
-    # rename vars
-    restrained_dof = model.global_restrained
-    loaded_dof = model.global_forces
+    # rename vars, nodal arrays of [Tx, Ty, Rz] and [Px, Py, Mz]
+    restrained_dof = model._global_restrained
+    loaded_dof = model._global_forces if forces is None else forces
 
     # count BC in [Translation over z-axis,Translation over y-axis,Rotation around x-axis]
-    restrained_count_Rz = np.count_nonzero(restrained_dof["Rz"])
-    restrained_count_Ty = np.count_nonzero(restrained_dof["Ty"])
-    restrained_count_Tx = np.count_nonzero(restrained_dof["Tx"])
+    restrained_count_Rz = np.count_nonzero(restrained_dof[:, 2])
+    restrained_count_Ty = np.count_nonzero(restrained_dof[:, 1])
+    restrained_count_Tx = np.count_nonzero(restrained_dof[:, 0])
     restrained_count_total = restrained_count_Rz + restrained_count_Ty + restrained_count_Tx
 
-    loaded_count_Rz = np.count_nonzero(loaded_dof["Mz [kNm]"])
-    loaded_count_Ty = np.count_nonzero(loaded_dof["Py [kN]"])
-    loaded_count_Tx = np.count_nonzero(loaded_dof["Px [kN]"])
+    loaded_count_Rz = np.count_nonzero(loaded_dof[:, 2])
+    loaded_count_Ty = np.count_nonzero(loaded_dof[:, 1])
+    loaded_count_Tx = np.count_nonzero(loaded_dof[:, 0])
     loaded_count_total = loaded_count_Rz + loaded_count_Ty + loaded_count_Tx
 
     if restrained_count_total == 0:
@@ -0,0 +1,284 @@
+"""
+`parallel` module
+==================
+
+The `parallel` module is used to run the analyses of many models, e.g. one model per location
+of a wind farm, in a pool of processes.
+
+Only the compact numerical state of each model, see :py:class:`openpile.parallel.ModelState`,
+is sent to the processes and the results are sent back as they are completed.
+
+Example
+-------
+
+.. code-block:: python
+
+    from openpile.parallel import run_many
+
+    if __name__ == "__main__":
+        # models is a list of `openpile.construct.Model` objects
+        for i, result in run_many(models, analysis="winkler", workers=4):
+            print(models[i].name, result.details())
+
+"""
+
+import os
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from typing_extensions import Literal
+
+from openpile import analyze
+from openpile.construct import Pile, SoilProfile, Layer, Model
+from openpile.soilmodels import Cowden_clay
+from openpile.core import kernel
+from openpile.core.validation import UserInputError
+
+# element properties needed by the kernel
+_ELEMENT_PROPERTIES = [
+    "x_top [m]",
+    "x_bottom [m]",
+    "y_top [m]",
+    "y_bottom [m]",
+    "E [kPa]",
+    "I [m4]",
+    "Area [m2]",
+    "Diameter [m]",
+    "Wall thickness [m]",
+]
+
+# keyword arguments of the winkler analysis accepted by the processes, i.e. the ones of the
+# Newton-Raphson scheme
+_WINKLER_KWARGS = [
+    "max_iter",
+    "storage",
+    "strategy",
+    "refactor_every",
+    "line_search",
+    "acceleration",
+]
+
+
+@dataclass
+class PileState:
+    """Pile properties needed by the kernel."""
+
+    kind: str
+    _nu: float
+
+
+@dataclass
+class ModelState:
+    """Compact numerical state of a `openpile.construct.Model` object.
+
+    It holds numpy arrays and built-in types only such that it is cheap to send to other processes.
+    The kernel functions of :py:mod:`openpile.core.kernel` accept it in place of a Model.
+    """
+
+    name: str
+    element_type: str
+    element_number: int
+    pile: PileState
+    #: name of the soil profile, None if the model has no soil
+    soil: Optional[str]
+    distributed_lateral: bool
+    distributed_moment: bool
+    base_shear: bool
+    base_moment: bool
+    _element_properties: dict
+    F: np.ndarray
+    U: np.ndarray
+    supports: np.ndarray
+    _py_springs: Optional[np.ndarray] = None
+    _mt_springs: Optional[np.ndarray] = None
+    _Hb_spring: Optional[np.ndarray] = None
+    _Mb_spring: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_model(cls, model):
+        """Extracts the state of a model.
+
+        Parameters
+        ----------
+        model : `openpile.construct.Model` object
+
+        Returns
+        -------
+        `openpile.parallel.ModelState` object
+        """
+        F, U, supports = kernel.global_dof_vectors(model)
+        state = cls(
+            name=model.name,
+            element_type=model.element_type,
+            element_number=model.element_number,
+            pile=PileState(kind=model.pile.kind, _nu=model.pile._nu),
+            soil=None if model.soil is None else model.soil.name,
+            distributed_lateral=model.distributed_lateral,
+            distributed_moment=model.distributed_moment,
+            base_shear=model.base_shear,
+            base_moment=model.base_moment,
+            _element_properties={
+                key: model._element_properties[key].astype(float) for key in _ELEMENT_PROPERTIES
+            },
+            F=F,
+            U=U,
+            supports=supports,
+        )
+        if model.soil is not None:
+            state._py_springs = model._py_springs
+            state._mt_springs = model._mt_springs
+            state._Hb_spring = model._Hb_spring
+            state._Mb_spring = model._Mb_spring
+
+        return state
+
+
+def _run_state(state, analysis, kwargs):
+    """runs the analysis of a model state and returns the global displacement and reaction vectors"""
+    if analysis == "winkler":
+        if state.soil is None:
+            raise UserInputError(
+                f"SoilProfile must be provided when creating the Model '{state.name}'."
+            )
+        return analyze._newton_raphson(
+            state, state.F, state.U, state.supports, verbose=False, **kwargs
+        )
+    elif analysis == "beam":
+        d, Q = analyze._beam_solve(state, state.F, state.U, state.supports, **kwargs)
+        return d, Q, None
+
+
+def _warm_up():
+    """compiles or loads from cache the numba functions of the kernel with a small model"""
+    p = Pile.create_tubular(
+        name="warm-up", top_elevation=0, bottom_elevation=-5, diameter=2.0, wt=0.05
+    )
+    sp = SoilProfile(
+        name="warm-up",
+        top_elevation=0,
+        water_line=0,
+        layers=[
+            Layer(
+                name="clay",
+                top=0,
+                bottom=-10,
+                weight=18,
+                lateral_model=Cowden_clay(Su=50, G0=50e3),
+            ),
+        ],
+    )
+    M = Model(name="warm-up", pile=p, soil=sp, coarseness=1.0)
+    M.set_support(elevation=-5, Tx=True)
+    M.set_pointload(elevation=0, Py=100)
+    _run_state(ModelState.from_model(M), "winkler", {})
+
+
+def executor(workers: int = None):
+    """Creates a pool of processes where the numba functions of the kernel are warmed up
+    once per process.
+
+    Processes are spawned, so scripts using the pool must be protected by an
+    `if __name__ == "__main__":` block.
+
+    Parameters
+    ----------
+    workers : int, optional
+        number of processes, by default the number of CPUs.
+
+    Returns
+    -------
+    concurrent.futures.ProcessPoolExecutor
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        mp_context=mp.get_context("spawn"),
+        initializer=_warm_up,
+    )
+
+
+def run_many(
+    models,
+    analysis: Literal["winkler", "beam"] = "winkler",
+    workers: int = None,
+    **kwargs,
+):
+    """
+    Runs the analysis of many models in a pool of processes and yields the results as they are completed.
+
+    The models are reduced to their compact numerical state, see :py:class:`openpile.parallel.ModelState`,
+    before being sent to the processes, and the `openpile.analyze.AnalyzeResult` objects are created
+    from the returned displacements and reactions in the calling process.
+
+    Processes are spawned, so scripts calling this function must be protected by an
+    `if __name__ == "__main__":` block.
+
+    Parameters
+    ----------
+    models : list of `openpile.construct.Model` objects
+        Models where structure and boundary conditions are defined.
+    analysis : str, by default "winkler"
+        analysis to run, can be of ("winkler", "beam"), see :py:func:`openpile.analyze.winkler`
+        and :py:func:`openpile.analyze.beam`.
+    workers : int, optional
+        number of processes, by default the number of CPUs. If 1, the models are run one
+        after the other in the calling process.
+    kwargs
+        keyword arguments passed to the analysis, e.g. `max_iter`, `storage` or `strategy`.
+        Only `storage` is passed to the beam analysis. The `initial_state` and adaptive mesh
+        refinement arguments of the winkler analysis are not supported.
+
+    Yields
+    ------
+    i : int
+        index of the model in `models`
+    results : `openpile.analyze.AnalyzeResult` object
+        Results of the analysis of the model
+
+    Raises
+    ------
+    UserInputError
+        if `analysis` or the keyword arguments of the winkler analysis are not supported
+    """
+    # checked here and not in the generator such that errors are raised before any work is submitted
+    if analysis not in ["winkler", "beam"]:
+        raise UserInputError("analysis must be one of ('winkler', 'beam').")
+    if analysis == "beam":
+        kwargs = {key: value for key, value in kwargs.items() if key == "storage"}
+    else:
+        unsupported = [key for key in kwargs if key not in _WINKLER_KWARGS]
+        if unsupported:
+            raise UserInputError(
+                f"Keyword arguments {unsupported} are not supported, they must be of {_WINKLER_KWARGS}."
+            )
+
+    return _yield_results(list(models), analysis, workers, kwargs)
+
+
+def _yield_results(models, analysis, workers, kwargs):
+    """runs the analyses of `run_many` and yields the results as they are completed"""
+
+    def to_results(i, out):
+        d, Q, details = out
+        if analysis == "winkler":
+            return i, analyze._winkler_results(models[i], d, Q, details)
+        else:
+            return i, analyze._beam_results(models[i], d, Q)
+
+    if workers is None:
+        workers = os.cpu_count()
+    workers = max(1, min(workers, len(models)))
+
+    if workers == 1:
+        for i, model in enumerate(models):
+            yield to_results(i, _run_state(ModelState.from_model(model), analysis, kwargs))
+    else:
+        with executor(workers) as pool:
+            futures = {
+                pool.submit(_run_state, ModelState.from_model(model), analysis, kwargs): i
+                for i, model in enumerate(models)
+            }
+            for future in as_completed(futures):
+                yield to_results(futures[future], future.result())
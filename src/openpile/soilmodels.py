@@ -34,6 +34,70 @@ from openpile.utils import py_curves, Hb_curves, mt_curves, Mb_curves, tz_curves
 from openpile.utils.misc import _fmax_api_sand, _fmax_api_clay, _Qmax_api_clay, _Qmax_api_sand
 
 
+# BATCH SPRING FUNCTIONS --------------------------------------
+
+
+def _values_at_depths(var, depth_from_top_of_layer, layer_height):
+    """linear variation of a layer parameter at each depth from the top of the layer"""
+    top, bottom = from_list2x_parse_top_bottom(var)
+    return top + (bottom - top) * depth_from_top_of_layer / layer_height
+
+
+def _multipliers_at_depths(multiplier, X, dtype):
+    """values of a multiplier at each depth, reshaped to scale the rows of a batch of springs"""
+    if isinstance(multiplier, float):
+        values = np.full(X.shape, multiplier)
+    else:
+        values = np.array([multiplier(x) for x in X], dtype=np.float64)
+    return values.astype(dtype).reshape((-1, 1))
+
+
+def _check_depths(depth_from_top_of_layer, layer_height):
+    if np.any(depth_from_top_of_layer > layer_height):
+        raise ValueError("Spring elevation outside layer")
+
+
+@njit(parallel=True, cache=True)
+def _bothkennar_clay_mt_batch(X, Su, G0, D, output_length):
+    # the m-t curves of the PISA clay models do not depend on the p-values,
+    # all rows are therefore the same
+    t = np.zeros((len(X), output_length, output_length), dtype=np.float32)
+    m = np.zeros((len(X), output_length, output_length), dtype=np.float32)
+    for i in prange(len(X)):
+        t_row, m_row = mt_curves.bothkennar_clay(X[i], Su[i], G0[i], D[i], output_length)
+        for j in range(output_length):
+            t[i, j] = t_row
+            m[i, j] = m_row
+    return t, m
+
+
+@njit(parallel=True, cache=True)
+def _cowden_clay_mt_batch(X, Su, G0, D, output_length):
+    # the m-t curves of the PISA clay models do not depend on the p-values,
+    # all rows are therefore the same
+    t = np.zeros((len(X), output_length, output_length), dtype=np.float32)
+    m = np.zeros((len(X), output_length, output_length), dtype=np.float32)
+    for i in prange(len(X)):
+        t_row, m_row = mt_curves.cowden_clay(X[i], Su[i], G0[i], D[i], output_length)
+        for j in range(output_length):
+            t[i, j] = t_row
+            m[i, j] = m_row
+    return t, m
+
+
+@njit(parallel=True, cache=True)
+def _dunkirk_sand_mt_batch(sig, X, Dr, G0, D, L, output_length):
+    t = np.zeros((len(X), output_length, output_length), dtype=np.float32)
+    m = np.zeros((len(X), output_length, output_length), dtype=np.float32)
+    for i in prange(len(X)):
+        _, p_array = py_curves.dunkirk_sand(sig[i], X[i], Dr[i], G0[i], D[i], L, output_length)
+        for j in range(output_length):
+            t[i, j], m[i, j] = mt_curves.dunkirk_sand(
+                sig[i], X[i], Dr[i], G0[i], p_array[j], D[i], L, output_length
+            )
+    return t, m
+
+
 # CONSTITUTIVE MODELS CLASSES ---------------------------------
 
 
@@ -47,7 +111,14 @@ class ConstitutiveModel:
 
 
 class LateralModel(ConstitutiveModel):
-    pass
+    """Base class of the lateral soil models.
+
+    Besides the `*_spring_fct` methods that create one spring at a time, a lateral model can
+    implement `py_spring_batch` and `mt_spring_batch` methods taking arrays of stresses, depths
+    and diameters and returning the springs of all depths at once, one row per depth.
+    The model then creates its springs with these methods and falls back to the
+    `*_spring_fct` methods otherwise.
+    """
 
 
 class AxialModel(ConstitutiveModel):
@@ -193,6 +264,35 @@ class Bothkennar_clay(LateralModel):
 
         return y * y_mult, p * p_mult
 
+    def py_spring_batch(
+        self,
+        sig: np.ndarray,
+        X: np.ndarray,
+        layer_height: float,
+        depth_from_top_of_layer: np.ndarray,
+        D: np.ndarray,
+        L: float = None,
+        below_water_table: np.ndarray = True,
+        ymax: float = 0.0,
+        output_length: int = 15,
+    ):
+        # validation
+        _check_depths(depth_from_top_of_layer, layer_height)
+
+        y, p = py_curves.bothkennar_clay_batch(
+            X=X,
+            Su=_values_at_depths(self.Su, depth_from_top_of_layer, layer_height),
+            G0=_values_at_depths(self.G0, depth_from_top_of_layer, layer_height),
+            D=D,
+            output_length=output_length,
+        )
+
+        # parse multipliers and apply results
+        y_mult = _multipliers_at_depths(self.y_multiplier, X, y.dtype)
+        p_mult = _multipliers_at_depths(self.p_multiplier, X, p.dtype)
+
+        return y * y_mult, p * p_mult
+
     def Hb_spring_fct(
         self,
         sig: float,
@@ -276,6 +376,35 @@ class Bothkennar_clay(LateralModel):
 
         return t * t_mult, m * m_mult
 
+    def mt_spring_batch(
+        self,
+        sig: np.ndarray,
+        X: np.ndarray,
+        layer_height: float,
+        depth_from_top_of_layer: np.ndarray,
+        D: np.ndarray,
+        L: float = None,
+        below_water_table: np.ndarray = True,
+        ymax: float = 0.0,
+        output_length: int = 15,
+    ):
+        # validation
+        _check_depths(depth_from_top_of_layer, layer_height)
+
+        t, m = _bothkennar_clay_mt_batch(
+            X=X,
+            Su=_values_at_depths(self.Su, depth_from_top_of_layer, layer_height),
+            G0=_values_at_depths(self.G0, depth_from_top_of_layer, layer_height),
+            D=D,
+            output_length=output_length,
+        )
+
+        # parse multipliers and apply results
+        t_mult = _multipliers_at_depths(self.t_multiplier, X, t.dtype).reshape((-1, 1, 1))
+        m_mult = _multipliers_at_depths(self.m_multiplier, X, m.dtype).reshape((-1, 1, 1))
+
+        return t * t_mult, m * m_mult
+
     def Mb_spring_fct(
         self,
         sig: float,
@@ -395,6 +524,35 @@ class Cowden_clay(LateralModel):
 
         return y * y_mult, p * p_mult
 
+    def py_spring_batch(
+        self,
+        sig: np.ndarray,
+        X: np.ndarray,
+        layer_height: float,
+        depth_from_top_of_layer: np.ndarray,
+        D: np.ndarray,
+        L: float = None,
+        below_water_table: np.ndarray = True,
+        ymax: float = 0.0,
+        output_length: int = 15,
+    ):
+        # validation
+        _check_depths(depth_from_top_of_layer, layer_height)
+
+        y, p = py_curves.cowden_clay_batch(
+            X=X,
+            Su=_values_at_depths(self.Su, depth_from_top_of_layer, layer_height),
+            G0=_values_at_depths(self.G0, depth_from_top_of_layer, layer_height),
+            D=D,
+            output_length=output_length,
+        )
+
+        # parse multipliers and apply results
+        y_mult = _multipliers_at_depths(self.y_multiplier, X, y.dtype)
+        p_mult = _multipliers_at_depths(self.p_multiplier, X, p.dtype)
+
+        return y * y_mult, p * p_mult
+
     def Hb_spring_fct(
         self,
         sig: float,
@@ -478,6 +636,35 @@ class Cowden_clay(LateralModel):
 
         return t * t_mult, m * m_mult
 
+    def mt_spring_batch(
+        self,
+        sig: np.ndarray,
+        X: np.ndarray,
+        layer_height: float,
+        depth_from_top_of_layer: np.ndarray,
+        D: np.ndarray,
+        L: float = None,
+        below_water_table: np.ndarray = True,
+        ymax: float = 0.0,
+        output_length: int = 15,
+    ):
+        # validation
+        _check_depths(depth_from_top_of_layer, layer_height)
+
+        t, m = _cowden_clay_mt_batch(
+            X=X,
+            Su=_values_at_depths(self.Su, depth_from_top_of_layer, layer_height),
+            G0=_values_at_depths(self.G0, depth_from_top_of_layer, layer_height),
+            D=D,
+            output_length=output_length,
+        )
+
+        # parse multipliers and apply results
+        t_mult = _multipliers_at_depths(self.t_multiplier, X, t.dtype).reshape((-1, 1, 1))
+        m_mult = _multipliers_at_depths(self.m_multiplier, X, m.dtype).reshape((-1, 1, 1))
+
+        return t * t_mult, m * m_mult
+
     def Mb_spring_fct(
         self,
         sig: float,
@@ -598,6 +785,37 @@ class Dunkirk_sand(LateralModel):
 
         return y * y_mult, p * p_mult
 
+    def py_spring_batch(
+        self,
+        sig: np.ndarray,
+        X: np.ndarray,
+        layer_height: float,
+        depth_from_top_of_layer: np.ndarray,
+        D: np.ndarray,
+        L: float = None,
+        below_water_table: np.ndarray = True,
+        ymax: float = 0.0,
+        output_length: int = 15,
+    ):
+        # validation
+        _check_depths(depth_from_top_of_layer, layer_height)
+
+        y, p = py_curves.dunkirk_sand_batch(
+            sig=sig,
+            X=X,
+            Dr=_values_at_depths(self.Dr, depth_from_top_of_layer, layer_height),
+            G0=_values_at_depths(self.G0, depth_from_top_of_layer, layer_height),
+            D=D,
+            L=L,
+            output_length=output_length,
+        )
+
+        # parse multipliers and apply results
+        y_mult = _multipliers_at_depths(self.y_multiplier, X, y.dtype)
+        p_mult = _multipliers_at_depths(self.p_multiplier, X, p.dtype)
+
+        return y * y_mult, p * p_mult
+
     def Hb_spring_fct(
         self,
         sig: float,
@@ -687,6 +905,37 @@ class Dunkirk_sand(LateralModel):
 
         return t * t_mult, m * m_mult
 
+    def mt_spring_batch(
+        self,
+        sig: np.ndarray,
+        X: np.ndarray,
+        layer_height: float,
+        depth_from_top_of_layer: np.ndarray,
+        D: np.ndarray,
+        L: float = None,
+        below_water_table: np.ndarray = True,
+        ymax: float = 0.0,
+        output_length: int = 15,
+    ):
+        # validation
+        _check_depths(depth_from_top_of_layer, layer_height)
+
+        t, m = _dunkirk_sand_mt_batch(
+            sig=sig,
+            X=X,
+            Dr=_values_at_depths(self.Dr, depth_from_top_of_layer, layer_height),
+            G0=_values_at_depths(self.G0, depth_from_top_of_layer, layer_height),
+            D=D,
+            L=L,
+            output_length=output_length,
+        )
+
+        # parse multipliers and apply results
+        t_mult = _multipliers_at_depths(self.t_multiplier, X, t.dtype).reshape((-1, 1, 1))
+        m_mult = _multipliers_at_depths(self.m_multiplier, X, m.dtype).reshape((-1, 1, 1))
+
+        return t * t_mult, m * m_mult
+
     def Mb_spring_fct(
         self,
         sig: float,
@@ -814,6 +1063,38 @@ class API_sand(LateralModel):
 
         return y * y_mult, p * p_mult
 
+    def py_spring_batch(
+        self,
+        sig: np.ndarray,
+        X: np.ndarray,
+        layer_height: float,
+        depth_from_top_of_layer: np.ndarray,
+        D: np.ndarray,
+        L: float = None,
+        below_water_table: np.ndarray = True,
+        ymax: float = 0.0,
+        output_length: int = 15,
+    ):
+        # validation
+        _check_depths(depth_from_top_of_layer, layer_height)
+
+        y, p = py_curves.api_sand_batch(
+            sig=sig,
+            X=X,
+            phi=_values_at_depths(self.phi, depth_from_top_of_layer, layer_height),
+            D=D,
+            kind=self.kind,
+            below_water_table=np.broadcast_to(below_water_table, np.shape(X)),
+            ymax=ymax,
+            output_length=output_length,
+        )
+
+        # parse multipliers and apply results
+        y_mult = _multipliers_at_depths(self.y_multiplier, X, y.dtype)
+        p_mult = _multipliers_at_depths(self.p_multiplier, X, p.dtype)
+
+        return y * y_mult, p * p_mult
+
     def mt_spring_fct(
         self,
         sig: float,
@@ -986,6 +1267,40 @@ class API_clay(LateralModel):
 
         return y * y_mult, p * p_mult
 
+    def py_spring_batch(
+        self,
+        sig: np.ndarray,
+        X: np.ndarray,
+        layer_height: float,
+        depth_from_top_of_layer: np.ndarray,
+        D: np.ndarray,
+        L: float = None,
+        below_water_table: np.ndarray = True,
+        ymax: float = 0.0,
+        output_length: int = 15,
+    ):
+        # validation
+        _check_depths(depth_from_top_of_layer, layer_height)
+
+        y, p = py_curves.api_clay_batch(
+            sig=sig,
+            X=X,
+            Su=_values_at_depths(self.Su, depth_from_top_of_layer, layer_height),
+            eps50=_values_at_depths(self.eps50, depth_from_top_of_layer, layer_height),
+            D=D,
+            J=self.J,
+            stiff_clay_threshold=self.stiff_clay_threshold,
+            kind=self.kind,
+            ymax=ymax,
+            output_length=output_length,
+        )
+
+        # parse multipliers and apply results
+        y_mult = _multipliers_at_depths(self.y_multiplier, X, y.dtype)
+        p_mult = _multipliers_at_depths(self.p_multiplier, X, p.dtype)
+
+        return y * y_mult, p * p_mult
+
     def mt_spring_fct(
         self,
         sig: float,
@@ -1122,6 +1437,37 @@ class Reese_weakrock(LateralModel):
 
         return y * y_mult, p * p_mult
 
+    def py_spring_batch(
+        self,
+        sig: np.ndarray,
+        X: np.ndarray,
+        layer_height: float,
+        depth_from_top_of_layer: np.ndarray,
+        D: np.ndarray,
+        L: float = None,
+        below_water_table: np.ndarray = True,
+        ymax: float = 0.0,
+        output_length: int = 15,
+    ):
+        # validation
+        _check_depths(depth_from_top_of_layer, layer_height)
+
+        y, p = py_curves.reese_weakrock_batch(
+            Ei=_values_at_depths(self.Ei, depth_from_top_of_layer, layer_height),
+            qu=_values_at_depths(self.qu, depth_from_top_of_layer, layer_height),
+            RQD=self.RQD,
+            xr=(X + self.ztop),
+            D=D,
+            k=self.k,
+            output_length=output_length,
+        )
+
+        # parse multipliers and apply results
+        y_mult = _multipliers_at_depths(self.y_multiplier, X, y.dtype)
+        p_mult = _multipliers_at_depths(self.p_multiplier, X, p.dtype)
+
+        return y * y_mult, p * p_mult
+
 
 @dataclass(config=PydanticConfigFrozen)
 class Custom_pisa_sand(LateralModel):
@@ -105,3 +105,41 @@ def _fmax_api_sand(
 
     # Unit skin friction [kPa]
     return min(fs_max, K * sig * m.tan(delta * m.pi / 180.0))
+
+
+@njit(cache=True)
+def _refine(x: np.ndarray, n: int) -> np.ndarray:
+    """Adds points between the sorted breakpoints of a curve.
+
+    The points are added one by one in the interval with the largest spacing between points,
+    such that they are spread over the intervals in proportion to their lengths and evenly
+    spaced within each interval. The breakpoints are kept and the result is sorted.
+
+    Parameters
+    ----------
+    x : 1darray
+        sorted breakpoints, at least two.
+    n : int
+        number of points to add
+
+    Returns
+    -------
+    1darray
+        array of len(x) + n points
+    """
+    lengths = np.diff(x.astype(np.float64))
+    counts = np.zeros(len(lengths), dtype=np.int64)
+    for _ in range(n):
+        counts[np.argmax(lengths / (counts + 1))] += 1
+
+    out = np.empty(len(x) + max(n, 0), dtype=np.float64)
+    j = 0
+    for k in range(len(lengths)):
+        out[j] = x[k]
+        j += 1
+        for i in range(counts[k]):
+            out[j] = x[k] + lengths[k] * (i + 1) / (counts[k] + 1)
+            j += 1
+    out[j] = x[-1]
+
+    return out
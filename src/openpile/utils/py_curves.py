@@ -8,9 +8,9 @@
 import math as m
 import numpy as np
 from numba import njit, prange
-from random import random
 
 from openpile.core.misc import conic
+from openpile.utils.misc import _refine
 
 # SPRING FUNCTIONS --------------------------------------------
 @njit(cache=True)
@@ -191,7 +191,7 @@ def dunkirk_sand(
 
 
 # API sand function
-@njit(parallel=True, cache=True)
+@njit(cache=True)
 def api_sand(
     sig: float,
     X: float,
@@ -279,7 +279,7 @@ def api_sand(
 
     ## calculate p vector
     p = np.zeros(shape=len(y), dtype=np.float32)
-    for i in prange(len(y)):
+    for i in range(len(y)):
         if Pmax == 0:
             p[i] = 0
         else:
@@ -289,7 +289,7 @@ def api_sand(
 
 
 # API clay function
-@njit(parallel=True, cache=True)
+@njit(cache=True)
 def api_clay(
     sig: float,
     X: float,
@@ -352,25 +352,22 @@ def api_clay(
     Pmax_deep = 9 * Su * X
     Pmax = min(Pmax_deep, Pmax_shallow)
 
-    ylist_in = [0.0, 0.1 * y50, 0.21 * y50, 1 * y50, 3 * y50, 8 * y50, 15 * y50, ymax]
-    ylist_out = []
-    for i in range(len(ylist_in)):
-        if ylist_in[i] <= ymax:
-            ylist_out.append(ylist_in[i])
+    # breakpoints of the curve up to ymax
+    y = np.array([0.0, 0.1 * y50, 0.21 * y50, 1 * y50, 3 * y50, 8 * y50, 15 * y50, ymax])
+    y = np.unique(y[y <= ymax])
 
-    # determine y vector from 0 to ymax
-    y = np.array(ylist_out, dtype=np.float32)
-    add_values = output_length - len(y)
-    add_y_values = []
-    for _ in range(add_values):
-        add_y_values.append(0.1 * y50 + random() * (ymax - 0.1 * y50))
-    y = np.append(y, add_y_values)
-    y = np.sort(y)
+    # determine y vector from 0 to ymax, the remaining points being spread
+    # between the breakpoints beyond 0.1*y50
+    add_values = max(output_length - len(y), 0)
+    if len(y) > 2:
+        y = np.append(y[:1], _refine(y[1:], add_values))
+    else:
+        y = _refine(y, add_values)
 
     # define p vector
     p = np.zeros(shape=len(y), dtype=np.float32)
 
-    for i in prange(len(y)):
+    for i in range(len(y)):
         if kind == "static":
             # derive static curve
             if y[i] > 8 * y50:
@@ -414,7 +411,7 @@ def api_clay(
     return y, p
 
 
-@njit(parallel=True, cache=True)
+@njit(cache=True)
 def reese_weakrock(
     Ei: float,
     qu: float,
@@ -580,3 +577,393 @@ def custom_pisa_clay(
 
     # return non-normalised curve
     return y * (Su * D / G0), p * (Su * D)
+
+
+# BATCH FUNCTIONS ---------------------------------------------
+# the curves of many depths are computed in parallel, one curve per row of the output arrays
+
+
+@njit(parallel=True, cache=True)
+def bothkennar_clay_batch(
+    X: np.ndarray,
+    Su: np.ndarray,
+    G0: np.ndarray,
+    D: np.ndarray,
+    output_length: int = 20,
+):
+    """
+    Creates the springs of many depths from the PISA Bothkennar clay formulation,
+    see :py:func:`openpile.utils.py_curves.bothkennar_clay`.
+
+    Parameters
+    ----------
+    X : 1darray
+        Depths below ground level [unit: m]
+    Su : 1darray
+        Undrained shear strength at each depth [unit: kPa]
+    G0 : 1darray
+        Small-strain shear modulus at each depth [unit: kPa]
+    D : 1darray
+        Pile diameter at each depth [unit: m]
+    output_length : int, optional
+        Number of datapoints in the curves, by default 20
+
+    Returns
+    -------
+    2darray
+        y vectors [unit: m], one row per depth
+    2darray
+        p vectors [unit: kN/m], one row per depth
+    """
+    y = np.zeros((len(X), output_length), dtype=np.float64)
+    p = np.zeros((len(X), output_length), dtype=np.float64)
+    for i in prange(len(X)):
+        y[i], p[i] = bothkennar_clay(X[i], Su[i], G0[i], D[i], output_length)
+    return y, p
+
+
+@njit(parallel=True, cache=True)
+def cowden_clay_batch(
+    X: np.ndarray,
+    Su: np.ndarray,
+    G0: np.ndarray,
+    D: np.ndarray,
+    output_length: int = 20,
+):
+    """
+    Creates the springs of many depths from the PISA Cowden clay formulation,
+    see :py:func:`openpile.utils.py_curves.cowden_clay`.
+
+    Parameters
+    ----------
+    X : 1darray
+        Depths below ground level [unit: m]
+    Su : 1darray
+        Undrained shear strength at each depth [unit: kPa]
+    G0 : 1darray
+        Small-strain shear modulus at each depth [unit: kPa]
+    D : 1darray
+        Pile diameter at each depth [unit: m]
+    output_length : int, optional
+        Number of datapoints in the curves, by default 20
+
+    Returns
+    -------
+    2darray
+        y vectors [unit: m], one row per depth
+    2darray
+        p vectors [unit: kN/m], one row per depth
+    """
+    y = np.zeros((len(X), output_length), dtype=np.float64)
+    p = np.zeros((len(X), output_length), dtype=np.float64)
+    for i in prange(len(X)):
+        y[i], p[i] = cowden_clay(X[i], Su[i], G0[i], D[i], output_length)
+    return y, p
+
+
+@njit(parallel=True, cache=True)
+def dunkirk_sand_batch(
+    sig: np.ndarray,
+    X: np.ndarray,
+    Dr: np.ndarray,
+    G0: np.ndarray,
+    D: np.ndarray,
+    L: float,
+    output_length: int = 20,
+):
+    """
+    Creates the springs of many depths from the PISA sand formulation,
+    see :py:func:`openpile.utils.py_curves.dunkirk_sand`.
+
+    Parameters
+    ----------
+    sig : 1darray
+        vertical/overburden effective stress at each depth [unit: kPa]
+    X : 1darray
+        Depths below ground level [unit: m]
+    Dr : 1darray
+        Sand relative density at each depth, values must be between 0 and 100 [unit: -]
+    G0 : 1darray
+        Small-strain shear modulus at each depth [unit: kPa]
+    D : 1darray
+        Pile diameter at each depth [unit: m]
+    L : float
+        Embedded pile length [unit: m]
+    output_length : int, optional
+        Number of datapoints in the curves, by default 20
+
+    Returns
+    -------
+    2darray
+        y vectors [unit: m], one row per depth
+    2darray
+        p vectors [unit: kN/m], one row per depth
+    """
+    y = np.zeros((len(X), output_length), dtype=np.float64)
+    p = np.zeros((len(X), output_length), dtype=np.float64)
+    for i in prange(len(X)):
+        y[i], p[i] = dunkirk_sand(sig[i], X[i], Dr[i], G0[i], D[i], L, output_length)
+    return y, p
+
+
+@njit(parallel=True, cache=True)
+def api_sand_batch(
+    sig: np.ndarray,
+    X: np.ndarray,
+    phi: np.ndarray,
+    D: np.ndarray,
+    kind: str = "static",
+    below_water_table: np.ndarray = None,
+    ymax: float = 0.0,
+    output_length: int = 20,
+):
+    """
+    Creates the API sand p-y curves of many depths, see :py:func:`openpile.utils.py_curves.api_sand`.
+
+    Parameters
+    ----------
+    sig: 1darray
+        Vertical effective stress at each depth [unit: kPa]
+    X: 1darray
+        Depths of the curves w.r.t. mudline [unit: m]
+    phi: 1darray
+        internal angle of friction of the sand at each depth [unit: degrees]
+    D: 1darray
+        Pile width at each depth [unit: m]
+    kind: str, by default "static"
+        types of curves, can be of ("static","cyclic")
+    below_water_table: 1darray of bool, by default None
+        switch to calculate initial subgrade modulus below/above water table at each depth,
+        all depths are below water table if None
+    ymax: float, by default 0.0
+        maximum value of y, default goes to 99.9% of ultimate resistance
+    output_length: int, by default 20
+        Number of discrete point along the springs
+
+    Returns
+    -------
+    2darray
+        y vectors [unit: m], one row per depth
+    2darray
+        p vectors [unit: kN/m], one row per depth
+    """
+    y = np.zeros((len(X), output_length), dtype=np.float64)
+    p = np.zeros((len(X), output_length), dtype=np.float32)
+    for i in prange(len(X)):
+        y[i], p[i] = api_sand(
+            sig[i],
+            X[i],
+            phi[i],
+            D[i],
+            kind,
+            True if below_water_table is None else below_water_table[i],
+            ymax,
+            output_length,
+        )
+    return y, p
+
+
+@njit(parallel=True, cache=True)
+def api_clay_batch(
+    sig: np.ndarray,
+    X: np.ndarray,
+    Su: np.ndarray,
+    eps50: np.ndarray,
+    D: np.ndarray,
+    J: float = 0.5,
+    stiff_clay_threshold=96,
+    kind: str = "static",
+    ymax: float = 0.0,
+    output_length: int = 20,
+):
+    """
+    Creates the API clay p-y curves of many depths, see :py:func:`openpile.utils.py_curves.api_clay`.
+
+    Parameters
+    ----------
+    sig: 1darray
+        Vertical effective stress at each depth [unit: kPa]
+    X: 1darray
+        Depths of the curves w.r.t. mudline [unit: m]
+    Su : 1darray
+        Undrained shear strength at each depth [unit: kPa]
+    eps50: 1darray
+        strain at 50% ultimate resistance at each depth [-]
+    D: 1darray
+        Pile width at each depth [unit: m]
+    J: float, by default 0.5
+        empirical factor varying depending on clay stiffness
+    stiff_clay_threshold: float, by default 96.0
+        undrained shear strength at which stiff clay curve is computed [unit: kPa]
+    kind: str, by default "static"
+        types of curves, can be of ("static","cyclic")
+    ymax: float, by default 0.0
+        maximum value of y, if null the maximum is calculated such that the whole curve is computed
+    output_length: int, by default 20
+        Number of discrete point along the springs
+
+    Returns
+    -------
+    2darray
+        y vectors [unit: m], one row per depth
+    2darray
+        p vectors [unit: kN/m], one row per depth
+    """
+    y = np.zeros((len(X), output_length), dtype=np.float64)
+    p = np.zeros((len(X), output_length), dtype=np.float32)
+    for i in prange(len(X)):
+        y[i], p[i] = api_clay(
+            sig[i],
+            X[i],
+            Su[i],
+            eps50[i],
+            D[i],
+            J,
+            stiff_clay_threshold,
+            kind,
+            ymax,
+            output_length,
+        )
+    return y, p
+
+
+@njit(parallel=True, cache=True)
+def reese_weakrock_batch(
+    Ei: np.ndarray,
+    qu: np.ndarray,
+    RQD: float,
+    xr: np.ndarray,
+    D: np.ndarray,
+    k: float = 0.0005,
+    output_length=20,
+):
+    """creates the Reese weakrock p-y curves of many depths,
+    see :py:func:`openpile.utils.py_curves.reese_weakrock`.
+
+    Parameters
+    ----------
+    Ei : 1darray
+        initial modulus of rock at each depth [kPa]
+    qu : 1darray
+        compressive strength of rock at each depth [kPa]
+    RQD : float
+        Rock Quality Designation [%]
+    xr : 1darray
+        depths from rock surface [m]
+    D : 1darray
+        pile width at each depth [m]
+    k : float, optional
+        dimensional constant, randing from 0.0005 to 0.00005, by default 0.0005
+    output_length : int, optional
+        length of output arrays, by default 20
+
+    Returns
+    -------
+    2darray
+        y vectors [unit: m], one row per depth
+    2darray
+        p vectors [unit: kN/m], one row per depth
+    """
+    y = np.zeros((len(xr), max(10, output_length)), dtype=np.float64)
+    p = np.zeros((len(xr), max(10, output_length)), dtype=np.float64)
+    for i in prange(len(xr)):
+        y[i], p[i] = reese_weakrock(Ei[i], qu[i], RQD, xr[i], D[i], k, output_length)
+    return y, p
+
+
+@njit(parallel=True, cache=True)
+def custom_pisa_sand_batch(
+    sig: np.ndarray,
+    G0: np.ndarray,
+    D: np.ndarray,
+    X_ult: np.ndarray,
+    n: np.ndarray,
+    k: np.ndarray,
+    Y_ult: np.ndarray,
+    output_length: int = 20,
+):
+    """Creates the lateral springs of many depths with the PISA sand formulation and custom user inputs,
+    see :py:func:`openpile.utils.py_curves.custom_pisa_sand`.
+
+    Parameters
+    ----------
+    sig : 1darray
+        vertical/overburden effective stress at each depth [unit: kPa]
+    G0 : 1darray
+        Small-strain shear modulus at each depth [unit: kPa]
+    D : 1darray
+        Pile diameter at each depth [unit: m]
+    X_ult : 1darray
+        Normalized displacement at maximum strength at each depth
+    n : 1darray
+        Normalized curvature parameter at each depth, must be between 0 and 1
+    k : 1darray
+        Normalized stiffness parameter at each depth
+    Y_ult : 1darray
+        Normalized maximum strength parameter at each depth
+    output_length : int, optional
+        Number of datapoints in the curves, by default 20
+
+    Returns
+    -------
+    2darray
+        y vectors [unit: m], one row per depth
+    2darray
+        p vectors [unit: kN/m], one row per depth
+    """
+    y = np.zeros((len(sig), output_length), dtype=np.float64)
+    p = np.zeros((len(sig), output_length), dtype=np.float64)
+    for i in prange(len(sig)):
+        y[i], p[i] = custom_pisa_sand(
+            sig[i], G0[i], D[i], X_ult[i], n[i], k[i], Y_ult[i], output_length
+        )
+    return y, p
+
+
+@njit(parallel=True, cache=True)
+def custom_pisa_clay_batch(
+    Su: np.ndarray,
+    G0: np.ndarray,
+    D: np.ndarray,
+    X_ult: np.ndarray,
+    n: np.ndarray,
+    k: np.ndarray,
+    Y_ult: np.ndarray,
+    output_length: int = 20,
+):
+    """Creates the lateral springs of many depths with the PISA clay formulation and custom user inputs,
+    see :py:func:`openpile.utils.py_curves.custom_pisa_clay`.
+
+    Parameters
+    ----------
+    Su : 1darray
+        Undrained shear strength at each depth [unit: kPa]
+    G0 : 1darray
+        Small-strain shear modulus at each depth [unit: kPa]
+    D : 1darray
+        Pile diameter at each depth [unit: m]
+    X_ult : 1darray
+        Normalized displacement at maximum strength at each depth
+    n : 1darray
+        Normalized curvature parameter at each depth, must be between 0 and 1
+    k : 1darray
+        Normalized stiffness parameter at each depth
+    Y_ult : 1darray
+        Normalized maximum strength parameter at each depth
+    output_length : int, optional
+        Number of datapoints in the curves, by default 20
+
+    Returns
+    -------
+    2darray
+        y vectors [unit: m], one row per depth
+    2darray
+        p vectors [unit: kN/m], one row per depth
+    """
+    y = np.zeros((len(Su), output_length), dtype=np.float64)
+    p = np.zeros((len(Su), output_length), dtype=np.float64)
+    for i in prange(len(Su)):
+        y[i], p[i] = custom_pisa_clay(
+            Su[i], G0[i], D[i], X_ult[i], n[i], k[i], Y_ult[i], output_length
+        )
+    return y, p
@@ -8,9 +8,8 @@
 import math as m
 import numpy as np
 from numba import njit, prange
-from random import random
-
 import openpile.utils.misc as misc
+from openpile.utils.misc import _refine
 
 # SPRING FUNCTIONS --------------------------------------------
 
@@ -60,21 +59,10 @@ def api_sand(
     # define t vector
     Q = np.array(Qlist, dtype=np.float32) * f
 
-    add_values = output_length - len(z)
-    add_z_values = np.zeros((add_values), dtype=np.float32)
-    add_Q_values = np.zeros((add_values), dtype=np.float32)
-
-    for i in range(add_values):
-        add_z_values[i] = (0.1 + random() * 0.1) * D
-        add_Q_values[i] = f
-
-    z = np.append(z, add_z_values)
-    Q = np.append(Q, add_Q_values)
-
-    z = np.sort(z)
-    z_id_sorted = np.argsort(z)
-
-    Q = Q[z_id_sorted]
+    # the remaining points are evenly spread on the plateau between 0.1D and 0.2D
+    add_values = max(output_length - len(z), 0)
+    z = np.concatenate((z[:-2], _refine(z[-2:], add_values).astype(np.float32)))
+    Q = np.concatenate((Q[:-2], np.full(add_values + 2, f, dtype=np.float32)))
 
     return z, Q
 
@@ -122,20 +110,9 @@ def api_clay(
     # define t vector
     Q = np.array(Qlist, dtype=np.float32) * f
 
-    add_values = output_length - len(z)
-    add_z_values = np.zeros((add_values), dtype=np.float32)
-    add_Q_values = np.zeros((add_values), dtype=np.float32)
-
-    for i in range(add_values):
-        add_z_values[i] = (0.1 + random() * 0.1) * D
-        add_Q_values[i] = f
-
-    z = np.append(z, add_z_values)
-    Q = np.append(Q, add_Q_values)
-
-    z = np.sort(z)
-    z_id_sorted = np.argsort(z)
-
-    Q = Q[z_id_sorted]
+    # the remaining points are evenly spread on the plateau between 0.1D and 0.2D
+    add_values = max(output_length - len(z), 0)
+    z = np.concatenate((z[:-2], _refine(z[-2:], add_values).astype(np.float32)))
+    Q = np.concatenate((Q[:-2], np.full(add_values + 2, f, dtype=np.float32)))
 
     return z, Q
@@ -7,11 +7,11 @@
 
 # Import libraries
 import openpile.utils.misc as misc
+from openpile.utils.misc import _refine
 
 import math as m
 import numpy as np
 from numba import njit, prange
-from random import random
 
 # Kraft et al (1989) formulation aid to ease up implementation
 @njit(cache=True)
@@ -127,26 +127,16 @@ def api_clay(
 
     # determine z vector
     z = np.array(zlist, dtype=np.float32) * D
-    z = np.concatenate((-z[-1:0:-1], z))
     # define t vector
     t = np.array(tlist, dtype=np.float32) * f
-    t = np.concatenate((-tensile_factor * t[-1:0:-1], t))
 
-    add_values = output_length - len(z)
-    add_z_values = np.zeros((add_values), dtype=np.float32)
-    add_t_values = np.zeros((add_values), dtype=np.float32)
+    # the remaining points are evenly spread on the residual plateau between 0.02D and 0.03D
+    add_values = max(output_length - (2 * len(z) - 1), 0)
+    z_pos = np.concatenate((z[:-2], _refine(z[-2:], add_values).astype(np.float32)))
+    t_pos = np.concatenate((t[:-2], np.full(add_values + 2, residual * f, dtype=np.float32)))
 
-    for i in range(add_values):
-        add_z_values[i] = (0.02 + random() * 0.01) * D
-        add_t_values[i] = residual * f
-
-    z = np.append(z, add_z_values)
-    t = np.append(t, add_t_values)
-
-    z = np.sort(z)
-    z_id_sorted = np.argsort(z)
-
-    t = t[z_id_sorted]
+    z = np.concatenate((-z[-1:0:-1], z_pos))
+    t = np.concatenate((-tensile_factor * t[-1:0:-1], t_pos))
 
     return z, t
 
@@ -251,26 +241,16 @@ def api_sand(
 
     # determine z vector
     z = np.array(zlist, dtype=np.float32)
-    z = np.concatenate((-z[-1:0:-1], z))
     # define t vector
     t = np.array(tlist, dtype=np.float32) * f
-    t = np.concatenate((-tensile_factor * t[-1:0:-1], t))
-
-    add_values = output_length - len(z)
-    add_z_values = np.zeros((add_values), dtype=np.float32)
-    add_t_values = np.zeros((add_values), dtype=np.float32)
-
-    for i in range(add_values):
-        add_z_values[i] = 0.03 + random() * 0.01
-        add_t_values[i] = f
-
-    z = np.append(z, add_z_values)
-    t = np.append(t, add_t_values)
 
-    z = np.sort(z)
-    z_id_sorted = np.argsort(z)
+    # the remaining points are evenly spread on the plateau between 0.03m and 0.04m
+    add_values = max(output_length - (2 * len(z) - 1), 0)
+    z_pos = np.concatenate((z[:-2], _refine(z[-2:], add_values).astype(np.float32)))
+    t_pos = np.concatenate((t[:-2], np.full(add_values + 2, f, dtype=np.float32)))
 
-    t = t[z_id_sorted]
+    z = np.concatenate((-z[-1:0:-1], z_pos))
+    t = np.concatenate((-tensile_factor * t[-1:0:-1], t_pos))
 
     return z, t
 
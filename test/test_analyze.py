@@ -0,0 +1,671 @@
+import pytest
+import numpy as np
+
+from openpile.construct import Pile, SoilProfile, Layer, Model
+from openpile.soilmodels import API_sand, Dunkirk_sand, Cowden_clay
+from openpile.core import kernel
+from openpile import analyze
+
+
+@pytest.fixture
+def create_sand_model():
+    def create(coarseness=0.5):
+        p = Pile.create_tubular(
+            name="<pile name>", top_elevation=0, bottom_elevation=-40, diameter=7.5, wt=0.075
+        )
+        sp = SoilProfile(
+            name="Offshore Soil Profile",
+            top_elevation=0,
+            water_line=15,
+            layers=[
+                Layer(
+                    name="medium dense sand",
+                    top=0,
+                    bottom=-20,
+                    weight=18,
+                    lateral_model=API_sand(phi=33, kind="cyclic"),
+                ),
+                Layer(
+                    name="dense sand",
+                    top=-20,
+                    bottom=-40,
+                    weight=19,
+                    lateral_model=API_sand(phi=[35, 38], kind="static", extension="mt_curves"),
+                ),
+            ],
+        )
+        M = Model(name="<model name>", pile=p, soil=sp, coarseness=coarseness)
+        M.set_support(elevation=-40, Tx=True)
+        M.set_pointload(elevation=0, Px=-20e3, Py=5e3, Mz=-100e3)
+        return M
+
+    return create
+
+
+@pytest.fixture
+def create_pisa_model():
+    def create(coarseness=0.5):
+        p = Pile.create_tubular(
+            name="<pile name>", top_elevation=0, bottom_elevation=-30, diameter=8.0, wt=0.075
+        )
+        sp = SoilProfile(
+            name="Offshore Soil Profile",
+            top_elevation=0,
+            water_line=15,
+            layers=[
+                Layer(
+                    name="sand",
+                    top=0,
+                    bottom=-15,
+                    weight=18,
+                    lateral_model=Dunkirk_sand(Dr=75, G0=[50e3, 100e3]),
+                ),
+                Layer(
+                    name="clay",
+                    top=-15,
+                    bottom=-40,
+                    weight=19,
+                    lateral_model=Cowden_clay(Su=[60, 120], G0=[50e3, 90e3]),
+                ),
+            ],
+        )
+        M = Model(name="<model name>", pile=p, soil=sp, coarseness=coarseness)
+        M.set_support(elevation=-30, Tx=True)
+        M.set_pointload(elevation=0, Py=8e3, Mz=-150e3)
+        return M
+
+    return create
+
+
+@pytest.fixture
+def create_beam_model():
+    def create():
+        p = Pile.create_tubular(
+            name="<pile name>", top_elevation=0, bottom_elevation=-40, diameter=7.5, wt=0.075
+        )
+        M = Model(name="<model name>", pile=p, coarseness=1.0)
+        M.set_support(elevation=-40, Tx=True, Ty=True, Rz=True)
+        M.set_pointload(elevation=0, Px=-1e3, Py=1e3)
+        return M
+
+    return create
+
+
+class TestStiffnessAssembly:
+    @pytest.mark.parametrize("kind", ["initial", "secant", "tangent"])
+    def test_storages_are_equivalent(self, create_pisa_model, kind):
+        M = create_pisa_model()
+        u = np.linspace(0.0, 0.05, 3 * (M.element_number + 1))
+
+        K = kernel.build_stiffness_matrix(M, u=u, kind=kind, storage="dense")
+        ab = kernel.build_stiffness_matrix(M, u=u, kind=kind, storage="banded")
+        Ks = kernel.build_stiffness_matrix(M, u=u, kind=kind, storage="sparse")
+
+        # rebuild dense matrix from banded storage
+        K_from_band = np.zeros_like(K)
+        for i in range(K.shape[0]):
+            for j in range(max(0, i - 5), min(K.shape[0], i + 6)):
+                K_from_band[i, j] = ab[5 + i - j, j]
+
+        assert np.allclose(K, K_from_band, rtol=1e-12, atol=1e-6)
+        assert np.allclose(K, Ks.toarray(), rtol=1e-12, atol=1e-6)
+
+
+class TestElementInvariants:
+    def test_cached_until_mesh_changes(self, create_sand_model):
+        M = create_sand_model()
+        invariants = kernel.element_invariants(M)
+
+        assert kernel.element_invariants(M) is invariants
+        assert np.allclose(invariants.L, kernel.mesh_to_element_length(M))
+        assert invariants.k_mechanical.flags["C_CONTIGUOUS"]
+
+        M._element_properties = dict(M._element_properties)
+        assert kernel.element_invariants(M) is not invariants
+
+    def test_mechanical_matrix_is_a_copy(self, create_sand_model):
+        M = create_sand_model()
+        k = kernel.elem_mechanical_stiffness_matrix(M)
+        k += 1.0
+
+        assert not np.allclose(k, kernel.element_invariants(M).k_mechanical)
+
+
+class TestSpringsStiffness:
+    def test_kinds_in_one_pass(self, create_pisa_model):
+        M = create_pisa_model()
+        u = np.linspace(0.0, 0.05, 3 * (M.element_number + 1))
+        kinds = ("initial", "secant", "tangent")
+
+        for k_all, kind in zip(kernel.build_stiffness_matrix(M, u=u, kind=kinds), kinds):
+            assert np.allclose(k_all, kernel.build_stiffness_matrix(M, u=u, kind=kind))
+
+    def test_mt_stiffness_vs_reference(self, create_pisa_model):
+        M = create_pisa_model()
+        n_elem = M.element_number
+        u = np.linspace(0.0, 0.01, n_elem + 1)
+        p = np.linspace(-10.0, 1.5 * M._py_springs[:, :, 0].max(), 2 * n_elem).reshape(-1, 2, 1, 1)
+
+        k = kernel.calculate_mt_springs_stiffness(u, M._mt_springs, M._py_springs, p, "secant")
+
+        # reference: m-t curve interpolated point by point from p-y mobilisation
+        d = np.abs(kernel.double_inner_njit(u)).reshape(-1, 2)
+        for i in range(n_elem):
+            for j in range(2):
+                if np.sum(M._mt_springs[i, j, 1, 0]) == 0:
+                    continue
+                xp = M._py_springs[i, j, 0]
+                m = [
+                    np.interp(p[i, j, 0, 0], xp, M._mt_springs[i, j, 0, :, ii]) for ii in range(15)
+                ]
+                t = [
+                    np.interp(p[i, j, 0, 0], xp, M._mt_springs[i, j, 1, :, ii]) for ii in range(15)
+                ]
+                if d[i, j] == 0:
+                    k_ref = (m[1] - m[0]) / (t[1] - t[0])
+                else:
+                    k_ref = np.interp(d[i, j], t, m) / d[i, j]
+                assert np.isclose(k[i, j, 0, 0], k_ref, rtol=1e-10)
+
+
+class TestWinkler:
+    @pytest.mark.parametrize("model", ["create_sand_model", "create_pisa_model"])
+    @pytest.mark.parametrize("storage", ["banded", "sparse"])
+    def test_storage_vs_dense(self, request, model, storage):
+        M = request.getfixturevalue(model)()
+        r_dense = analyze.winkler(M, storage="dense")
+        r = analyze.winkler(M, storage=storage)
+
+        assert np.allclose(
+            r_dense.displacements.values, r.displacements.values, rtol=1e-9, atol=1e-12
+        )
+
+    @pytest.mark.parametrize("strategy", ["modified", "initial"])
+    def test_iteration_strategies(self, create_pisa_model, strategy):
+        M = create_pisa_model()
+        r_full = analyze.winkler(M)
+        r = analyze.winkler(M, strategy=strategy, max_iter=200)
+
+        details = r.details()
+        assert details["strategy"] == strategy
+        assert details["factorizations"] <= details["converged @ iter no."]
+        if strategy == "initial":
+            assert details["factorizations"] == 1
+        assert np.allclose(
+            r_full.displacements["Deflection [m]"].values,
+            r.displacements["Deflection [m]"].values,
+            rtol=1e-2,
+            atol=1e-5,
+        )
+
+
+class TestLineSearchAcceleration:
+    @pytest.mark.parametrize("line_search", [None, "backtracking", "energy"])
+    @pytest.mark.parametrize("acceleration", [None, "aitken", "anderson"])
+    def test_same_solution(self, create_pisa_model, line_search, acceleration):
+        M = create_pisa_model()
+        r_ref = analyze.winkler(M)
+        r = analyze.winkler(
+            M, strategy="modified", line_search=line_search, acceleration=acceleration
+        )
+
+        details = r.details()
+        assert len(details["residual history [kN]"]) == details["converged @ iter no."]
+        assert details["residual history [kN]"][-1] < details["tolerance [kN]"]
+        assert np.allclose(r_ref.arrays.deflection, r.arrays.deflection, rtol=1e-2, atol=1e-5)
+
+    def test_anderson_reduces_iterations(self, create_pisa_model):
+        M = create_pisa_model()
+        r = analyze.winkler(M, strategy="initial", max_iter=200)
+        r_anderson = analyze.winkler(M, strategy="initial", acceleration="anderson")
+
+        assert r_anderson.details()["factorizations"] == 1
+        assert r_anderson.details()["converged @ iter no."] < r.details()["converged @ iter no."]
+
+    def test_wrong_line_search(self, create_pisa_model):
+        with pytest.raises(ValueError):
+            analyze.winkler(create_pisa_model(), line_search="armijo")
+
+
+class TestInitialState:
+    def test_same_model(self, create_pisa_model):
+        M = create_pisa_model()
+        r = analyze.winkler(M)
+        r_warm = analyze.winkler(M, initial_state=r)
+
+        assert r_warm.details()["converged @ iter no."] == 1
+        assert np.allclose(r.arrays.deflection, r_warm.arrays.deflection, atol=1e-5)
+
+    @pytest.mark.parametrize("strategy", ["full", "modified", "initial"])
+    def test_nudged_load(self, create_pisa_model, strategy):
+        M = create_pisa_model()
+        r = analyze.winkler(M)
+        M.set_pointload(elevation=0, Py=8.4e3, Mz=-157e3)
+        r_ref = analyze.winkler(M)
+        r_warm = analyze.winkler(M, strategy=strategy, initial_state=r.arrays.displacements)
+
+        assert r_warm.details()["converged @ iter no."] <= 2
+        assert r_warm.details()["converged @ iter no."] < r_ref.details()["converged @ iter no."]
+        assert np.allclose(r_ref.arrays.deflection, r_warm.arrays.deflection, rtol=1e-2, atol=1e-5)
+
+    def test_nudged_displacement(self, create_pisa_model):
+        M = create_pisa_model()
+        M.set_support(elevation=0, Ty=True)
+        M.set_pointdisplacement(elevation=0, Ty=0.05)
+        r = analyze.winkler(M)
+        M.set_pointdisplacement(elevation=0, Ty=0.052)
+        r_warm = analyze.winkler(M, initial_state=r)
+
+        assert r_warm.arrays.deflection[0] == pytest.approx(0.052)
+
+    def test_wrong_size(self, create_pisa_model):
+        with pytest.raises(ValueError):
+            analyze.winkler(create_pisa_model(), initial_state=np.zeros(3))
+
+
+class TestAdaptive:
+    def test_vs_fine_mesh(self, create_sand_model):
+        M = create_sand_model(coarseness=2.0)
+        r = analyze.winkler(M, adaptive=True)
+        r_fine = analyze.winkler(create_sand_model(coarseness=0.25))
+
+        history = r.details()["element number history"]
+        assert history[0] == M.element_number == 20
+        assert history[-1] == r._model.element_number < r_fine._model.element_number
+        assert r.details()["head change history"][0] is None
+        assert np.allclose(r.arrays.displacements[0], r_fine.arrays.displacements[0], rtol=1e-2)
+        # refined near the mudline where the soil is mobilized
+        L = -np.diff(r.arrays.elevation)
+        assert L[0] < L[-1]
+
+    def test_refined_model(self, create_sand_model):
+        M = create_sand_model(coarseness=2.0)
+        refined = M._refined(np.array([0, 5, 12]))
+
+        assert refined.element_number == M.element_number + 3
+        assert np.isin(M._nodes_coordinates["x [m]"], refined._nodes_coordinates["x [m]"]).all()
+        assert np.array_equal(refined._global_forces.sum(axis=0), M._global_forces.sum(axis=0))
+        assert refined._global_restrained[-1, 0]
+        # springs of the new elements are the ones created for the refined mesh
+        for springs, created in zip(
+            [refined._py_springs, refined._mt_springs], refined._create_springs()
+        ):
+            assert np.array_equal(springs, created)
+
+
+class TestHeadStiffness:
+    @staticmethod
+    def schur_complement(model, d, kind):
+        K = kernel.build_stiffness_matrix(model, u=d, kind=kind, storage="dense")
+        _, _, supports = kernel.global_dof_vectors(model)
+        head = np.arange(3)
+        internal = np.flatnonzero(~supports)[3:]
+        return K[np.ix_(head, head)] - K[np.ix_(head, internal)] @ np.linalg.solve(
+            K[np.ix_(internal, internal)], K[np.ix_(internal, head)]
+        )
+
+    @pytest.mark.parametrize("storage", ["dense", "banded", "sparse"])
+    def test_vs_schur_complement(self, create_pisa_model, storage):
+        M = create_pisa_model()
+        r = analyze.winkler(M)
+
+        K = analyze.head_stiffness(M, storage=storage)
+        K_tangent = analyze.head_stiffness(M, state=r, storage=storage)
+
+        assert np.allclose(K, self.schur_complement(M, np.zeros(r._d.shape), "initial"))
+        assert np.allclose(K_tangent, self.schur_complement(M, r._d, "tangent"))
+        # the soil springs soften with the load
+        assert K_tangent[1, 1] < K[1, 1]
+
+    def test_flexibility(self, create_pisa_model):
+        M = create_pisa_model()
+        K, C = analyze.head_stiffness(M, flexibility=True)
+
+        assert np.allclose(K @ C, np.eye(3))
+
+    def test_flexibility_without_axial_support(self, create_pisa_model):
+        M = create_pisa_model()
+        M.set_support(elevation=-30, Tx=False)
+        K, C = analyze.head_stiffness(M, flexibility=True)
+
+        assert np.isinf(C[0]).all() and np.isinf(C[:, 0]).all()
+        assert np.allclose(K[1:, 1:] @ C[1:, 1:], np.eye(2))
+
+
+class TestSuperelement:
+    def test_vs_head_stiffness(self, create_pisa_model):
+        M = create_pisa_model()
+        r = analyze.winkler(M)
+        se = analyze.superelement(M, elevations=[0, -15], states=[r])
+
+        assert se.stiffness.shape == (6, 6)
+        assert se.dofs[4] == "Ty @ -15.0m"
+        # condensing the second node gives the head stiffness
+        for K, K_head in [
+            (se.stiffness, analyze.head_stiffness(M)),
+            (se.states_stiffness[0], analyze.head_stiffness(M, state=r)),
+        ]:
+            condensed = K[:3, :3] - K[:3, 3:] @ np.linalg.solve(K[3:, 3:], K[3:, :3])
+            assert np.allclose(condensed, K_head)
+
+    def test_states(self, create_pisa_model):
+        M = create_pisa_model()
+        r = analyze.winkler_batch(M, loads=[[0, 4e3, -75e3], [0, 8e3, -150e3]])
+        se = analyze.superelement(M, states=r)
+
+        assert se.states_stiffness.shape == (2, 3, 3)
+        assert np.allclose(se.states_displacements, r.displacements[:, 0])
+        # forces resisted by the pile at the head balance the loads
+        assert np.allclose(se.states_forces[1], [0, 8e3, -150e3], rtol=1e-3, atol=1.0)
+
+    def test_npz(self, create_pisa_model, tmp_path):
+        M = create_pisa_model()
+        se = analyze.superelement(M, elevations=[0, -15], states=[analyze.winkler(M)])
+        se.to_npz(tmp_path / "superelement.npz")
+        loaded = analyze.Superelement.from_npz(tmp_path / "superelement.npz")
+
+        assert loaded.name == se.name
+        assert loaded.dofs == se.dofs
+        assert np.array_equal(loaded.stiffness, se.stiffness)
+        assert np.array_equal(loaded.states_forces, se.states_forces)
+
+
+class TestModal:
+    @pytest.fixture
+    def cantilever(self):
+        p = Pile.create_tubular(
+            name="<pile name>", top_elevation=0, bottom_elevation=-40, diameter=7.5, wt=0.075
+        )
+        M = Model(name="<model name>", pile=p, coarseness=1.0, element_type="EulerBernoulli")
+        M.set_support(elevation=-40, Tx=True, Ty=True, Rz=True)
+        return M
+
+    @pytest.mark.parametrize("mass, rtol", [("consistent", 1e-5), ("lumped", 1e-2)])
+    def test_cantilever(self, cantilever, mass, rtol):
+        r = analyze.modal(cantilever, n_modes=4, mass=mass)
+
+        EI = cantilever.pile.E * cantilever.pile.data["I [m4]"][0]
+        m = 78.0 / 9.81 * cantilever.pile.data["Area [m2]"][0]
+        f = np.array([1.875104, 4.694091]) ** 2 * np.sqrt(EI / (m * 40**4)) / (2 * np.pi)
+
+        # first two bending modes, the third mode being axial
+        assert r.frequencies[[0, 1]] == pytest.approx(f, rel=rtol)
+        assert np.abs(r.mode_shapes[:, :, :2]).max(axis=(1, 2)) == pytest.approx(1.0)
+        assert r.mode_shapes[0, 0, 1] == pytest.approx(1.0)
+
+    def test_head_mass(self, cantilever):
+        r = analyze.modal(cantilever, n_modes=1, head_mass=1e3)
+
+        # single degree of freedom with Rayleigh's effective mass of the pile
+        EI = cantilever.pile.E * cantilever.pile.data["I [m4]"][0]
+        m = 78.0 / 9.81 * cantilever.pile.data["Area [m2]"][0]
+        f = np.sqrt(3 * EI / 40**3 / (1e3 + 0.2357 * m * 40)) / (2 * np.pi)
+        assert r.frequencies[0] == pytest.approx(f, rel=1e-3)
+
+    def test_soil_state(self, create_pisa_model):
+        M = create_pisa_model()
+        r = analyze.modal(M, n_modes=2, head_mass=500)
+        r_loaded = analyze.modal(M, n_modes=2, head_mass=500, state=analyze.winkler(M))
+
+        assert len(r) == 2
+        assert (np.diff(r.frequencies) > 0).all()
+        # the soil springs soften with the load
+        assert r_loaded.frequencies[0] < r.frequencies[0]
+
+    def test_wrong_n_modes(self, cantilever):
+        with pytest.raises(ValueError):
+            analyze.modal(cantilever, n_modes=0)
+
+
+class TestBuckling:
+    @pytest.fixture
+    def column(self):
+        p = Pile.create_tubular(
+            name="<pile name>", top_elevation=0, bottom_elevation=-40, diameter=1.0, wt=0.02
+        )
+        M = Model(name="<model name>", pile=p, coarseness=1.0, element_type="EulerBernoulli")
+        M.set_support(elevation=-40, Tx=True, Ty=True, Rz=True)
+        return M
+
+    def test_euler_column(self, column):
+        r = analyze.buckling(column, n_modes=3, load=1.0)
+
+        EI = column.pile.E * column.pile.data["I [m4]"][0]
+        P = np.pi**2 * EI / (4 * 40**2) * np.array([1, 9, 25])
+        assert r.critical_loads == pytest.approx(P, rel=1e-5)
+        assert r.load_factors == pytest.approx(r.critical_loads)
+        assert r.mode_shapes[0, 0, 1] == pytest.approx(1.0)
+
+    def test_model_loads(self, column):
+        column.set_pointload(elevation=0, Px=-500, Py=10)
+        r = analyze.buckling(column)
+
+        assert r.critical_loads == pytest.approx(analyze.buckling(column, load=1.0).critical_loads)
+        assert r.load_factors[0] == pytest.approx(r.critical_loads[0] / 500)
+
+    def test_model_displacements(self, column):
+        # the column is compressed by a settlement of its base against its restrained head
+        column.set_support(elevation=0, Tx=True)
+        column.set_pointdisplacement(elevation=-40, Tx=0.001)
+        r = analyze.buckling(column)
+
+        EA = column.pile.E * column.pile.data["Area [m2]"][0]
+        assert r.details()["reference axial load [kN]"] == pytest.approx(EA * 0.001 / 40, rel=1e-3)
+        assert r.critical_loads[0] == pytest.approx(r.load_factors[0] * EA * 0.001 / 40)
+
+    def test_tension(self, column):
+        column.set_pointload(elevation=0, Px=500)
+        with pytest.raises(ValueError):
+            analyze.buckling(column)
+
+    def test_soil_state(self, create_pisa_model):
+        M = create_pisa_model()
+        r = analyze.buckling(M, load=1.0)
+        r_loaded = analyze.buckling(M, load=1.0, state=analyze.winkler(M))
+
+        # the soil springs soften with the load
+        assert 0.0 < r_loaded.critical_loads[0] < r.critical_loads[0]
+
+
+class TestAnalyzeResult:
+    def test_tables_are_lazy_and_memoized(self, create_pisa_model):
+        r = analyze.winkler(create_pisa_model())
+
+        assert r._cache == {}
+        assert r.forces is r.forces
+        assert r.py_mobilization is not None
+        assert "springs_mobilization" in r._cache
+        assert r.Hb_mobilization[1] > 0.0
+
+    def test_arrays_vs_tables(self, create_pisa_model):
+        r = analyze.winkler(create_pisa_model())
+
+        assert np.array_equal(r.arrays.elevation, r.displacements["Elevation [m]"].values)
+        assert np.array_equal(r.arrays.deflection, r.displacements["Deflection [m]"].values)
+        assert np.array_equal(r.arrays.displacements[:, 2], r.rotation["Rotation [rad]"].values)
+        assert np.array_equal(r.arrays.forces_elevation, r.forces["Elevation [m]"].values)
+        assert np.array_equal(r.arrays.forces, r.forces[["N [kN]", "V [kN]", "M [kNm]"]].values)
+        assert np.array_equal(r.arrays.p_mobilized, r.py_mobilization["p_mobilized [kN/m]"].values)
+        assert np.array_equal(r.arrays.m_mobilized, r.mt_mobilization["m_mobilized [kNm/m]"].values)
+
+    def test_model_edited_before_reading(self, create_sand_model):
+        """results refer to the model that was solved, even if it is edited afterwards"""
+        M = create_sand_model()
+        r, r_read = analyze.winkler(M), analyze.winkler(M)
+        batch = analyze.winkler_batch(M, [[-20e3, 5e3, -100e3]])
+        forces, p_mobilized = r.arrays.forces.copy(), r.arrays.p_mobilized.copy()
+
+        M.update_pile_sections(wall_thickness=0.03)
+        M.update_layer(0, phi=28.0)
+
+        assert np.array_equal(r_read.arrays.forces, forces)
+        assert np.array_equal(r_read.arrays.p_mobilized, p_mobilized)
+        assert np.allclose(batch[0].arrays.p_mobilized, p_mobilized)
+
+    def test_beam_has_no_mobilization(self, create_beam_model):
+        r = analyze.beam(create_beam_model())
+
+        assert r.py_mobilization is None
+        assert r.Hb_mobilization is None
+        assert r.arrays.p_mobilized is None
+        assert r.details()["Max. moment [kNm]"] == round(r.forces["M [kNm]"].max(), 2)
+
+
+class TestBeam:
+    @pytest.mark.parametrize("storage", ["banded", "sparse"])
+    def test_storage_vs_dense(self, create_beam_model, storage):
+        M = create_beam_model()
+        r_dense = analyze.beam(M, storage="dense")
+        r = analyze.beam(M, storage=storage)
+
+        assert np.allclose(
+            r_dense.displacements.values, r.displacements.values, rtol=1e-9, atol=1e-12
+        )
+
+
+class TestBandedSolver:
+    def test_banded_vs_dense_with_prescribed_displacement(self, create_pisa_model):
+        M = create_pisa_model(coarseness=1.0)
+        n = 3 * (M.element_number + 1)
+        u = np.zeros(n)
+
+        F = np.zeros(n)
+        F[1] = 1e3
+        U = np.zeros(n)
+        U[-2] = 0.01
+        restraints = np.zeros(n, dtype=bool)
+        restraints[[0, n - 2]] = True
+
+        K = kernel.build_stiffness_matrix(M, u=u, kind="initial", storage="dense")
+        ab = kernel.build_stiffness_matrix(M, u=u, kind="initial", storage="banded")
+
+        U_dense, Q_dense = kernel.solve_equations(K, F.copy(), U.copy(), restraints)
+        U_band, Q_band = kernel.solve_equations(ab, F.copy(), U.copy(), restraints)
+
+        assert np.allclose(U_dense, U_band, rtol=1e-9, atol=1e-12)
+        assert np.allclose(Q_dense, Q_band, rtol=1e-6, atol=1e-6)
+        assert U_band[-2] == 0.01
+
+
+class TestBatch:
+    loads = np.array([[-20e3, 5e3, -100e3], [0.0, 2e3, -50e3], [-10e3, 8e3, 0.0]])
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_winkler_batch_vs_winkler(self, create_sand_model, workers):
+        M = create_sand_model(coarseness=1.0)
+        results = analyze.winkler_batch(M, self.loads, workers=workers)
+
+        assert len(results) == len(self.loads)
+        for i, (Px, Py, Mz) in enumerate(self.loads):
+            M.set_pointload(elevation=0, Px=Px, Py=Py, Mz=Mz)
+            r = analyze.winkler(M)
+            assert np.allclose(r.displacements.values, results[i].displacements.values)
+            assert np.allclose(r.deflection["Deflection [m]"].values, results.deflection[i])
+
+    def test_beam_batch_vs_beam(self, create_beam_model):
+        M = create_beam_model()
+        results = analyze.beam_batch(M, self.loads)
+
+        for i, (Px, Py, Mz) in enumerate(self.loads):
+            M.set_pointload(elevation=0, Px=Px, Py=Py, Mz=Mz)
+            r = analyze.beam(M)
+            assert np.allclose(r.displacements.values, results[i].displacements.values)
+            assert np.allclose(r.forces.values, results[i].forces.values)
+
+    def test_beam_batch_without_support(self):
+        p = Pile.create_tubular(
+            name="<pile name>", top_elevation=0, bottom_elevation=-40, diameter=7.5, wt=0.075
+        )
+        M = Model(name="<model name>", pile=p, coarseness=1.0)
+        with pytest.raises(analyze.validation.InvalidBoundaryConditionsError):
+            analyze.beam_batch(M, self.loads)
+
+        # the loads of the load cases are validated, not the ones of the model
+        M.set_support(elevation=-40, Tx=True, Ty=True, Rz=True)
+        assert len(analyze.beam_batch(M, self.loads)) == len(self.loads)
+
+    def test_wrong_loads_shape(self, create_sand_model):
+        M = create_sand_model(coarseness=1.0)
+        with pytest.raises(analyze.validation.UserInputError):
+            analyze.winkler_batch(M, np.zeros((2, 4)))
+
+
+class TestPushover:
+    def test_load_control_vs_winkler(self, create_pisa_model):
+        M = create_pisa_model(coarseness=1.0)
+        r = analyze.winkler(M)
+        results = analyze.pushover(M, n_steps=5)
+
+        assert results.converged
+        assert len(results) == 5
+        assert np.isclose(results.load_factor[-1], 1.0)
+        assert np.allclose(
+            results[-1].arrays.displacements, r.arrays.displacements, rtol=1e-3, atol=1e-5
+        )
+        assert np.allclose(results.curve["Py [kN]"].values, 8e3 * results.load_factor)
+
+    def test_displacement_control_beyond_peak(self, create_sand_model):
+        M = create_sand_model(coarseness=1.0)
+        results = analyze.pushover(M, target=2.0, control="displacement", n_steps=20)
+
+        curve = results.curve
+        assert results.converged
+        assert np.isclose(curve["Deflection [m]"].iloc[-1], 2.0)
+        # softening response after the peak load
+        assert curve["Load factor"].iloc[-1] < curve["Load factor"].max()
+        # load control cannot pass the peak load
+        over_peak = analyze.pushover(M, target=1.1 * curve["Load factor"].max(), max_cutbacks=3)
+        assert not over_peak.converged
+        assert over_peak.load_factor[-1] < curve["Load factor"].max()
+
+    def test_adaptive_steps(self, create_pisa_model):
+        M = create_pisa_model(coarseness=1.0)
+        results = analyze.pushover(M, target=4.0, n_steps=1, max_iter=4)
+        fixed = analyze.pushover(M, target=4.0, n_steps=1, max_iter=4, adaptive=False)
+
+        assert results.converged and len(results) > 1
+        assert all(x["converged @ iter no."] <= 4 for x in results.details())
+        assert not fixed.converged and len(fixed) == 0
+
+    def test_arc_length_vs_displacement_control(self, create_sand_model):
+        M = create_sand_model(coarseness=1.0)
+        arc = analyze.pushover(M, target=2.0, control="arc-length", n_steps=20)
+        disp = analyze.pushover(M, target=2.0, control="displacement", n_steps=20)
+
+        assert arc.converged
+        assert np.isclose(arc.curve["Deflection [m]"].iloc[-1], 2.0)
+        assert np.isclose(arc.load_factor[-1], disp.load_factor[-1], rtol=1e-3)
+        # passes the peak load
+        assert arc.load_factor.max() > arc.load_factor[-1]
+        assert all("arc length" in x for x in arc.details())
+
+        stats = arc.statistics
+        assert stats["steps"] == len(arc)
+        assert stats["iterations"] == sum(x["converged @ iter no."] for x in arc.details())
+        assert stats["wall time [s]"] > 0.0
+
+    def test_arc_length_landing_failure(self, create_sand_model, monkeypatch):
+        M = create_sand_model(coarseness=1.0)
+        step = analyze._pushover_step
+        landings = []
+
+        def failing_landing(*args, **kwargs):
+            if kwargs.get("arc_length") is None and kwargs.get("target") is not None:
+                landings.append(kwargs["target"])
+                if len(landings) == 1:
+                    return None
+            return step(*args, **kwargs)
+
+        monkeypatch.setattr(analyze, "_pushover_step", failing_landing)
+        arc = analyze.pushover(M, target=2.0, control="arc-length", n_steps=20)
+
+        assert len(landings) >= 2
+        assert arc.converged
+        assert np.isclose(arc.curve["Deflection [m]"].iloc[-1], 2.0)
+        # the overshooting step is not kept
+        assert arc.curve["Deflection [m]"].max() <= 2.0 + 1e-9
+
+    def test_restrained_control_dof(self, create_sand_model):
+        M = create_sand_model(coarseness=1.0)
+        with pytest.raises(analyze.validation.UserInputError):
+            analyze.pushover(M, target=0.1, control="displacement", dof="Tx", elevation=-40)
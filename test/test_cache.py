@@ -0,0 +1,117 @@
+import pytest
+import numpy as np
+
+from openpile import cache
+from openpile.construct import Pile, SoilProfile, Layer, Model
+from openpile.soilmodels import Dunkirk_sand, Cowden_clay
+
+
+@pytest.fixture
+def spring_cache():
+    yield cache.enable(maxsize=8)
+    cache.disable()
+
+
+def create_model(wt=0.075, p_multiplier=1.0):
+    p = Pile.create_tubular(name="", top_elevation=0, bottom_elevation=-30, diameter=8.0, wt=wt)
+    sp = SoilProfile(
+        name="",
+        top_elevation=0,
+        water_line=15,
+        layers=[
+            Layer(
+                name="sand",
+                top=0,
+                bottom=-15,
+                weight=18,
+                lateral_model=Dunkirk_sand(Dr=75, G0=[50e3, 100e3], p_multiplier=p_multiplier),
+            ),
+            Layer(
+                name="clay",
+                top=-15,
+                bottom=-40,
+                weight=19,
+                lateral_model=Cowden_clay(Su=[60, 120], G0=[50e3, 90e3]),
+            ),
+        ],
+    )
+    return Model(name="", pile=p, soil=sp, coarseness=0.5)
+
+
+def test_disabled_by_default():
+    assert cache.active() is None
+    assert cache.statistics() == {}
+
+
+def test_wall_thickness_variants(spring_cache):
+    M = create_model()
+    # p-y and m-t springs of two layers
+    assert spring_cache.statistics()["misses"] == 4
+
+    M_wt = create_model(wt=0.09)
+    assert spring_cache.statistics()["misses"] == 4
+    assert spring_cache.statistics()["hits"] == 4
+    assert np.array_equal(M._py_springs, M_wt._py_springs)
+    assert np.array_equal(M._mt_springs, M_wt._mt_springs)
+
+    cache.disable()
+    assert np.array_equal(M._py_springs, create_model()._py_springs)
+
+
+def test_changed_parameters(spring_cache):
+    create_model()
+    M = create_model(p_multiplier=0.8)
+    # springs of the sand layer are created again
+    assert spring_cache.statistics()["misses"] == 6
+    assert spring_cache.statistics()["hits"] == 2
+
+    cache.disable()
+    assert np.array_equal(M._py_springs, create_model(p_multiplier=0.8)._py_springs)
+
+
+def test_uncacheable(spring_cache):
+    create_model(p_multiplier=lambda x: 0.8)
+    create_model(p_multiplier=lambda x: 0.8)
+    assert spring_cache.statistics()["uncacheable"] == 4
+    assert spring_cache.statistics()["hits"] == 2
+
+
+def test_lru(spring_cache):
+    for multiplier in [0.5, 0.6, 0.7, 0.8, 0.9]:
+        create_model(p_multiplier=multiplier)
+    assert spring_cache.statistics()["size"] == 8
+
+
+def test_disk(tmp_path):
+    try:
+        cache.enable(directory=tmp_path)
+        M = create_model()
+        # new cache, e.g. in another session
+        spring_cache = cache.enable(directory=tmp_path)
+        M_disk = create_model()
+    finally:
+        cache.disable()
+
+    assert len(list(tmp_path.glob("*.npz"))) == 4
+    assert spring_cache.statistics()["disk hits"] == 4
+    assert spring_cache.statistics()["misses"] == 0
+    assert np.array_equal(M._mt_springs, M_disk._mt_springs)
+
+    spring_cache.clear(disk=True)
+    assert len(list(tmp_path.glob("*.npz"))) == 0
+
+
+def test_springs_version(tmp_path, monkeypatch):
+    try:
+        cache.enable(directory=tmp_path)
+        create_model()
+        # springs functions changed, e.g. in a later version
+        monkeypatch.setattr(cache, "SPRINGS_VERSION", cache.SPRINGS_VERSION + 1)
+        spring_cache = cache.enable(directory=tmp_path)
+        create_model()
+    finally:
+        cache.disable()
+
+    assert spring_cache.statistics()["disk hits"] == 0
+    assert spring_cache.statistics()["misses"] == 4
+    assert len(list(tmp_path.glob("*.npz"))) == 8
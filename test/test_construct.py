@@ -1,5 +1,5 @@
 from openpile import construct
-from openpile.soilmodels import API_clay
+from openpile.soilmodels import API_clay, API_sand, Cowden_clay, Dunkirk_sand
 import pytest
 import numpy as np
 import math as m
@@ -288,3 +288,287 @@ class TestModel:
 
         # # check that m_t springs are all zero
         # assert not np.all( model.get_mt_springs()[['VAL 0','VAL 1','VAL 2']].values )
+
+    @pytest.mark.parametrize(
+        "lateral_model",
+        [
+            Dunkirk_sand(Dr=[60, 80], G0=[50e3, 100e3], p_multiplier=lambda x: 1 + 0.01 * x),
+            Cowden_clay(Su=[30, 80], G0=[10e3, 40e3], m_multiplier=0.7),
+            API_sand(phi=[30, 35], kind="cyclic", y_multiplier=1.2),
+        ],
+    )
+    def test_springs_batch(self, lateral_model):
+        """check that the springs created by the batch functions of the lateral models
+        are the same as the ones created element per element"""
+        pile = construct.Pile(
+            name="",
+            top_elevation=1,
+            kind="Circular",
+            material="Steel",
+            pile_sections={
+                "length": [10, 20],
+                "diameter": [7.5, 8.0],
+                "wall thickness": [0.08] * 2,
+            },
+        )
+        layer = construct.Layer(name="", top=0, bottom=-12, weight=18, lateral_model=lateral_model)
+        model = construct.Model(
+            name="",
+            pile=pile,
+            soil=construct.SoilProfile(
+                name="",
+                top_elevation=0,
+                water_line=5,
+                layers=[
+                    layer,
+                    construct.Layer(
+                        name="",
+                        top=-12,
+                        bottom=-40,
+                        weight=19,
+                        lateral_model=Cowden_clay(Su=100, G0=50e3),
+                    ),
+                ],
+            ),
+            coarseness=0.5,
+            distributed_moment=True,
+        )
+
+        soil = model.soil_properties
+        in_layer = (soil["x_top [m]"] <= layer.top) & (soil["x_bottom [m]"] >= layer.bottom)
+        for i in np.flatnonzero(in_layer):
+            for j, pos in enumerate(["top", "bottom"]):
+                kwargs = dict(
+                    sig=soil[f"sigma_v {pos} [kPa]"].iloc[i],
+                    X=abs(soil[f"xg_{pos} [m]"].iloc[i]),
+                    layer_height=layer.top - layer.bottom,
+                    depth_from_top_of_layer=layer.top - soil[f"x_{pos} [m]"].iloc[i],
+                    D=model.element_properties["Diameter [m]"].iloc[i],
+                    L=29,
+                    below_water_table=soil[f"x_{pos} [m]"].iloc[i] <= 5,
+                    output_length=15,
+                )
+                y, p = lateral_model.py_spring_fct(**kwargs)
+                assert np.array_equal(model._py_springs[i, j, 1], y.astype(np.float32))
+                assert np.array_equal(model._py_springs[i, j, 0], p.astype(np.float32))
+                if lateral_model.spring_signature[2]:
+                    t, m = lateral_model.mt_spring_fct(**kwargs)
+                    assert np.array_equal(model._mt_springs[i, j, 1], t.astype(np.float32))
+                    assert np.array_equal(model._mt_springs[i, j, 0], m.astype(np.float32))
+
+    def test_layer_below_pile_tip(self):
+        """check that a layer without elements, below the pile tip, creates no springs"""
+        model = construct.Model(
+            name="",
+            pile=construct.Pile.create_tubular(
+                name="", top_elevation=0, bottom_elevation=-30, diameter=7.5, wt=0.08
+            ),
+            soil=construct.SoilProfile(
+                name="",
+                top_elevation=0,
+                water_line=5,
+                layers=[
+                    construct.Layer(
+                        name="",
+                        top=0,
+                        bottom=-32,
+                        weight=18,
+                        lateral_model=API_sand(phi=32, kind="static"),
+                    ),
+                    construct.Layer(
+                        name="",
+                        top=-32,
+                        bottom=-40,
+                        weight=19,
+                        lateral_model=API_sand(phi=35, kind="static", extension="mt_curves"),
+                    ),
+                ],
+            ),
+            coarseness=1.0,
+            distributed_moment=True,
+        )
+        assert not model._mt_springs.any()
+        assert model._py_springs[:, :, 0].any()
+
+    def test_tables_are_views_of_arrays(self):
+        """check that the tables of the model are created from its arrays and
+        that modifying them does not modify the model"""
+        model = construct.Model(
+            name="",
+            pile=construct.Pile.create_tubular(
+                name="", top_elevation=0, bottom_elevation=-10, diameter=2.0, wt=0.05
+            ),
+            coarseness=1.0,
+        )
+        model.set_pointload(elevation=0, Py=100.0, Mz=-50.0)
+        model.set_support(elevation=-10, Tx=True, Ty=True)
+
+        forces = model.global_forces
+        assert forces.index.name == "Node no."
+        assert list(forces.columns) == ["x [m]", "y [m]", "Px [kN]", "Py [kN]", "Mz [kNm]"]
+        assert np.array_equal(
+            forces[["Px [kN]", "Py [kN]", "Mz [kNm]"]].values, model._global_forces
+        )
+        assert model._global_forces[0].tolist() == [0.0, 100.0, -50.0]
+        assert model._global_restrained[-1].tolist() == [True, True, False]
+        assert model.global_restrained["Ty"].dtype == bool
+
+        forces.loc[0, "Py [kN]"] = 0.0
+        model.element_properties.loc[0, "E [kPa]"] = 0.0
+        assert model._global_forces[0, 1] == 100.0
+        assert model.element_properties["E [kPa]"].iloc[0] > 0.0
+        assert model._element_properties["x_top [m]"].flags["C_CONTIGUOUS"]
+
+    def test_graded_mesh(self):
+        """check that a graded mesh is finer near the mudline and gives results close to
+        the uniform mesh of the mudline element length with fewer elements"""
+        from openpile import analyze
+
+        pile = construct.Pile.create_tubular(
+            name="", top_elevation=5, bottom_elevation=-35, diameter=7.5, wt=0.08
+        )
+        soil = construct.SoilProfile(
+            name="",
+            top_elevation=0,
+            water_line=5,
+            layers=[
+                construct.Layer(
+                    name="",
+                    top=0,
+                    bottom=-40,
+                    weight=19,
+                    lateral_model=Dunkirk_sand(Dr=75, G0=[50e3, 100e3]),
+                ),
+            ],
+        )
+        results = []
+        for grading in [1.0, 5.0]:
+            model = construct.Model(name="", pile=pile, soil=soil, coarseness=0.25, grading=grading)
+            model.set_support(elevation=-35, Tx=True)
+            model.set_pointload(elevation=5, Py=5e3)
+            results.append((model, analyze.winkler(model)))
+
+        (uniform, uniform_result), (graded, graded_result) = results
+        assert graded.element_number < uniform.element_number / 2
+        L = np.diff(graded._nodes_coordinates["x [m]"])
+        assert np.allclose(L[graded._nodes_coordinates["x [m]"][:-1] > 0.0], -0.25)
+        assert m.isclose(
+            graded_result.displacements["Deflection [m]"].iloc[0],
+            uniform_result.displacements["Deflection [m]"].iloc[0],
+            rel_tol=1e-3,
+        )
+
+
+class TestModelUpdate:
+    @staticmethod
+    def create_model(diameter=8.0, wt=0.08, weight=18, phi=32, p_multiplier=1.0):
+        pile = construct.Pile(
+            name="",
+            top_elevation=5,
+            kind="Circular",
+            material="Steel",
+            pile_sections={
+                "length": [10, 25],
+                "diameter": [8.0, diameter],
+                "wall thickness": [0.08, wt],
+            },
+        )
+        soil = construct.SoilProfile(
+            name="",
+            top_elevation=0,
+            water_line=5,
+            layers=[
+                construct.Layer(
+                    name="sand",
+                    top=0,
+                    bottom=-10,
+                    weight=weight,
+                    lateral_model=API_sand(phi=phi, kind="cyclic", p_multiplier=p_multiplier),
+                ),
+                construct.Layer(
+                    name="clay",
+                    top=-10,
+                    bottom=-20,
+                    weight=19,
+                    lateral_model=API_clay(Su=[40, 80], eps50=0.01, kind="static"),
+                ),
+                construct.Layer(
+                    name="dunkirk",
+                    top=-20,
+                    bottom=-40,
+                    weight=19,
+                    lateral_model=Dunkirk_sand(Dr=75, G0=[50e3, 100e3]),
+                ),
+            ],
+        )
+        model = construct.Model(name="", pile=pile, soil=soil, coarseness=0.5)
+        model.set_pointload(elevation=5, Py=1e3)
+        return model
+
+    @staticmethod
+    def assert_same_model(model, reference):
+        for name in ["_py_springs", "_mt_springs", "_Hb_spring", "_Mb_spring"]:
+            assert np.array_equal(getattr(model, name), getattr(reference, name))
+        for key, value in reference._element_properties.items():
+            assert np.array_equal(model._element_properties[key], value)
+        for key, value in reference._soil_properties.items():
+            assert np.allclose(model._soil_properties[key], value, equal_nan=True)
+
+    def test_update_layer(self):
+        """check that updating a layer gives the model created with the new layer and
+        that only the springs of the affected layers are created again"""
+        model = self.create_model()
+        soil = model.soil
+        clay_springs = model._py_springs[model._layer_elements(soil.layers[1])]
+        model.update_layer("sand", phi=35)
+        self.assert_same_model(model, self.create_model(phi=35))
+        # the soil profile given to the model is not modified
+        assert soil.layers[0].lateral_model.phi == 32
+
+        py_springs = model._py_springs
+        model.update_layer(0, weight=19)
+        self.assert_same_model(model, self.create_model(phi=35, weight=19))
+        # springs are new arrays, such that results computed from the previous ones are refreshed
+        assert model._py_springs is not py_springs
+        # vertical stress changes below the layer
+        assert not np.array_equal(
+            clay_springs, model._py_springs[model._layer_elements(soil.layers[1])]
+        )
+        assert model._global_forces[0, 1] == 1e3
+
+    def test_update_multipliers(self):
+        model = self.create_model()
+        mt_springs = model._mt_springs
+        model.update_multipliers("sand", p_multiplier=0.7)
+        self.assert_same_model(model, self.create_model(p_multiplier=0.7))
+        # no m-t springs in the updated layer
+        assert np.array_equal(model._mt_springs, mt_springs)
+
+        model.update_multipliers(y_multiplier=1.2)
+        assert all(layer.lateral_model.y_multiplier == 1.2 for layer in model.soil.layers)
+
+    def test_update_pile_sections(self):
+        model = self.create_model()
+        py_springs = model._py_springs
+        model.update_pile_sections(wall_thickness=[0.08, 0.1])
+        self.assert_same_model(model, self.create_model(wt=0.1))
+        # springs do not depend on the wall thickness
+        assert model._py_springs is py_springs
+
+        model.update_pile_sections(diameter=[8.0, 7.0])
+        self.assert_same_model(model, self.create_model(wt=0.1, diameter=7.0))
+
+    def test_wrong_updates(self):
+        model = self.create_model()
+        with pytest.raises(ValueError):
+            model.update_layer("gravel", weight=19)
+        with pytest.raises(ValueError):
+            model.update_layer(0, bottom=-12)
+        with pytest.raises(ValueError):
+            model.update_layer(0, Su=50)
+        with pytest.raises(ValueError):
+            model.update_multipliers(phi=30)
+        with pytest.raises(ValueError):
+            model.update_pile_sections(diameter=[8.0, 8.0, 8.0])
+        with pytest.raises(ValidationError):
+            model.update_multipliers("sand", p_multiplier=-1.0)
@@ -0,0 +1,96 @@
+import pytest
+import numpy as np
+
+from openpile.construct import Pile, SoilProfile, Layer, Model
+from openpile.soilmodels import API_sand, Cowden_clay
+from openpile import analyze, parallel
+
+
+def create_model(diameter, lateral_model):
+    p = Pile.create_tubular(
+        name="<pile name>", top_elevation=0, bottom_elevation=-30, diameter=diameter, wt=0.075
+    )
+    sp = SoilProfile(
+        name="Offshore Soil Profile",
+        top_elevation=0,
+        water_line=15,
+        layers=[
+            Layer(
+                name="layer",
+                top=0,
+                bottom=-40,
+                weight=18,
+                lateral_model=lateral_model,
+            ),
+        ],
+    )
+    M = Model(name=f"D={diameter}", pile=p, soil=sp, coarseness=1.0)
+    M.set_support(elevation=-30, Tx=True)
+    M.set_pointload(elevation=0, Px=-5e3, Py=5e3, Mz=-50e3)
+    return M
+
+
+@pytest.fixture
+def models():
+    return [
+        create_model(6.0, API_sand(phi=33, kind="cyclic")),
+        create_model(7.0, Cowden_clay(Su=[60, 120], G0=[50e3, 90e3])),
+        create_model(8.0, API_sand(phi=35, kind="static")),
+    ]
+
+
+class TestRunMany:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_winkler(self, models, workers):
+        results = dict(parallel.run_many(models, analysis="winkler", workers=workers))
+
+        assert sorted(results.keys()) == [0, 1, 2]
+        for i, model in enumerate(models):
+            r = analyze.winkler(model)
+            assert np.allclose(r.displacements.values, results[i].displacements.values)
+            assert np.allclose(r.forces.values, results[i].forces.values)
+
+    def test_beam(self):
+        models = []
+        for diameter in [6.0, 7.0]:
+            p = Pile.create_tubular(
+                name="<pile name>",
+                top_elevation=0,
+                bottom_elevation=-30,
+                diameter=diameter,
+                wt=0.075,
+            )
+            M = Model(name=f"D={diameter}", pile=p, coarseness=1.0)
+            M.set_support(elevation=-30, Tx=True, Ty=True, Rz=True)
+            M.set_pointload(elevation=0, Px=-1e3, Py=1e3)
+            models.append(M)
+
+        # keyword arguments of the winkler analysis are not passed to the beam analysis
+        results = dict(
+            parallel.run_many(models, analysis="beam", workers=1, storage="dense", max_iter=10)
+        )
+
+        for i, model in enumerate(models):
+            r = analyze.beam(model)
+            assert np.allclose(r.displacements.values, results[i].displacements.values)
+
+    def test_model_state_is_compact(self, models):
+        state = parallel.ModelState.from_model(models[1])
+
+        for value in state._element_properties.values():
+            assert isinstance(value, np.ndarray)
+        assert state.F.shape == state.U.shape == state.supports.shape
+        assert state._mt_springs is not None
+
+    def test_wrong_analysis(self, models):
+        with pytest.raises(parallel.UserInputError):
+            # raised before the results are iterated
+            parallel.run_many(models, analysis="modal")
+
+    @pytest.mark.parametrize(
+        "kwargs", [dict(adaptive=True), dict(initial_state=None), dict(maxiter=10)]
+    )
+    def test_wrong_winkler_kwargs(self, models, kwargs):
+        with pytest.raises(parallel.UserInputError):
+            # raised before the results are iterated
+            parallel.run_many(models, workers=2, **kwargs)
@@ -138,3 +138,102 @@ def test_reese_weakrock(xEi, xqu, xRQD, xxr, xD):
     alpha = 1 - 2 / 3 * xRQD / 100
     pu = min(alpha * xqu * xD * (1 + 1.4 * xxr / xD), 5.2 * alpha * xqu * xD)
     assert m.isclose(np.max(p), pu, rel_tol=0.01, abs_tol=0.1)
+
+
+@pytest.mark.parametrize("xkind", ["static", "cyclic"])
+def test_batch_functions(xkind):
+    """check that the batch functions return the curves of the scalar functions, one row per depth"""
+    X = np.linspace(0.0, 30.0, 13)
+    sig = 10.0 * X
+    D = np.full(X.shape, 5.0)
+    a = np.linspace(1.0, 2.0, X.size)
+    below_water_table = X > 10.0
+
+    batches = [
+        (
+            py.cowden_clay_batch(X, 50 * a, 20e3 * a, D, 15),
+            [py.cowden_clay(X[i], 50 * a[i], 20e3 * a[i], D[i], 15) for i in range(X.size)],
+        ),
+        (
+            py.bothkennar_clay_batch(X, 50 * a, 20e3 * a, D, 15),
+            [py.bothkennar_clay(X[i], 50 * a[i], 20e3 * a[i], D[i], 15) for i in range(X.size)],
+        ),
+        (
+            py.dunkirk_sand_batch(sig, X, 40 * a, 50e3 * a, D, 30.0, 15),
+            [
+                py.dunkirk_sand(sig[i], X[i], 40 * a[i], 50e3 * a[i], D[i], 30.0, 15)
+                for i in range(X.size)
+            ],
+        ),
+        (
+            py.api_sand_batch(sig, X, 20 * a, D, xkind, below_water_table, 0.0, 15),
+            [
+                py.api_sand(sig[i], X[i], 20 * a[i], D[i], xkind, below_water_table[i], 0.0, 15)
+                for i in range(X.size)
+            ],
+        ),
+        (
+            py.reese_weakrock_batch(1e5 * a, 3e3 * a, 50.0, X, D, 0.0005, 15),
+            [
+                py.reese_weakrock(1e5 * a[i], 3e3 * a[i], 50.0, X[i], D[i], 0.0005, 15)
+                for i in range(X.size)
+            ],
+        ),
+        (
+            py.custom_pisa_sand_batch(sig + 1, 50e3 * a, D, 10 * a, 0.9 * a / 2, 5 * a, a, 15),
+            [
+                py.custom_pisa_sand(
+                    sig[i] + 1, 50e3 * a[i], D[i], 10 * a[i], 0.9 * a[i] / 2, 5 * a[i], a[i], 15
+                )
+                for i in range(X.size)
+            ],
+        ),
+        (
+            py.custom_pisa_clay_batch(50 * a, 20e3 * a, D, 10 * a, 0.9 * a / 2, 5 * a, a, 15),
+            [
+                py.custom_pisa_clay(
+                    50 * a[i], 20e3 * a[i], D[i], 10 * a[i], 0.9 * a[i] / 2, 5 * a[i], a[i], 15
+                )
+                for i in range(X.size)
+            ],
+        ),
+    ]
+
+    for (y, p), curves in batches:
+        assert y.shape == p.shape == (X.size, 15)
+        for i, (y_i, p_i) in enumerate(curves):
+            assert np.array_equal(y[i], y_i)
+            assert np.array_equal(p[i], p_i)
+
+    # api clay curves have random y values, check the curves are sorted with the right length
+    y, p = py.api_clay_batch(sig, X + 0.1, 50 * a, 0.01 * a, D, 0.5, 96, xkind, 0.0, 15)
+    assert y.shape == p.shape == (X.size, 15)
+    assert np.all(np.diff(y, axis=1) >= 0)
+
+
+@pytest.mark.parametrize("xkind", ["static", "cyclic"])
+def test_api_clay_deterministic(xkind):
+    """check that the curves are sampled the same way at each call, with increasing displacements"""
+    y1, p1 = py.api_clay(sig=50, X=5, Su=40, eps50=0.01, D=2, kind=xkind, output_length=20)
+    y2, p2 = py.api_clay(sig=50, X=5, Su=40, eps50=0.01, D=2, kind=xkind, output_length=20)
+    assert len(y1) == 20
+    assert np.array_equal(y1, y2)
+    assert np.array_equal(p1, p2)
+    assert np.all(np.diff(y1) > 0)
+
+
+def test_axial_curves_deterministic():
+    """check that the t-z and Q-z curves are sampled the same way at each call"""
+    from openpile.utils import tz_curves, qz_curves
+
+    for fct, kwargs in [
+        (tz_curves.api_clay, dict(sig=50, Su=40, D=2)),
+        (tz_curves.api_sand, dict(sig=50, delta=25)),
+        (qz_curves.api_sand, dict(sig=50, delta=25, D=2)),
+    ]:
+        z1, t1 = fct(**kwargs, output_length=20)
+        z2, t2 = fct(**kwargs, output_length=20)
+        assert len(z1) == 20
+        assert np.array_equal(z1, z2)
+        assert np.array_equal(t1, t2)
+        assert np.all(np.diff(z1) > 0)
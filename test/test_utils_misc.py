@@ -21,3 +21,26 @@ def test_var_to_str():
     assert print_out == 11
     print_out = misc.var_to_str([11, 21.2])
     assert print_out == "11-21.2"
+
+
+def test_mesh_elevations():
+    import numpy as np
+
+    # uniform mesh, elevations within tolerance are merged
+    x = misc.mesh_elevations([5.0, 0.0, -16.8, -16.8000001, -40.0], coarseness=0.7)
+    assert x.dtype == np.float64
+    assert x[0] == 5.0 and x[-1] == -40.0
+    assert np.isin([0.0, -16.8], x).all()
+    # 16.8 / 0.7 = 24 elements, round-off does not add one
+    assert np.count_nonzero((x < 0.0) & (x > -16.8)) == 23
+    assert np.all(-np.diff(x) <= 0.7 + 1e-12)
+
+    # graded mesh, element length increases with depth up to 4 x coarseness at the tip
+    xg = misc.mesh_elevations(
+        [5.0, 0.0, -40.0], coarseness=0.25, grading=4.0, ground=0.0, tip=-40.0
+    )
+    lengths = -np.diff(xg)
+    assert np.allclose(lengths[xg[:-1] > 0.0], 0.25)
+    assert np.all(np.diff(lengths[xg[:-1] <= 0.0]) > 0.0)
+    assert lengths[-1] <= 1.0
+    assert len(xg) < 0.6 * len(misc.mesh_elevations([5.0, 0.0, -40.0], coarseness=0.25))